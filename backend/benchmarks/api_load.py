@@ -0,0 +1,435 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Load benchmark of the read and write endpoints of the API.
+
+Seeds a database with a synthetic volume of articles spread evenly over the six categories and
+drives the application with a fixed number of concurrent clients, one scenario after the other:
+
+    top-stories     GET /top-stories
+    category        GET /category/{category}/{page} for the first pages
+    category-deep   GET /category/{category}/{page} for the last tenth of the pages
+    post-article    POST /article
+
+For every scenario it reports the p50, p95 and p99 latency and the throughput. The results can
+be written as JSON and compared against an earlier run, which fails the run when a scenario's p95
+latency got worse by more than --max-regression, so regressions show up in CI.
+
+By default the database is the in-process SQLite stand-in of fake_mysql.py. The seeded database
+is kept as a template in --data-dir, the system temp directory by default, and copied for every
+run, so runs with the same --articles and --seed start from identical data. With --mysql the DB_*
+environment variables point the application at a real (throwaway) MySQL server instead, which is
+topped up to --articles articles.
+
+The application is served in-process through httpx' ASGI transport, so the numbers include the
+whole request path except the socket and the HTTP parser of the server.
+
+Run from the backend directory:
+
+    python -m benchmarks.api_load --articles 100000 --concurrency 16 --requests 2000
+    python -m benchmarks.api_load --json results.json --baseline baseline.json
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import httpx
+
+CATEGORIES = ["Mathematics", "Physics", "Chemistry", "Medicine", "Biology", "IT"]
+SCENARIOS = ["top-stories", "category", "category-deep", "post-article"]
+SEED_BATCH_SIZE = 1000
+PAGE_SIZE = 5
+
+Request = Tuple[str, str, Optional[Dict[str, Any]]]
+
+
+def make_article(rng: random.Random, number: int, date: datetime) -> Dict[str, Any]:
+    """
+    Builds the fields of a synthetic article.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        number (int): The running number of the article.
+        date (datetime): The date of the article.
+
+    Returns:
+        Dict[str, Any]: The article fields.
+    """
+    words = ["quantum", "protein", "lattice", "enzyme", "network", "theorem", "neuron", "cell"]
+    return {
+        "title": f"Article {number} on {rng.choice(words)} {rng.choice(words)}",
+        "date": date,
+        "author": f"Author {rng.randrange(500)}",
+        "text": " ".join(rng.choice(words) for _ in range(rng.randrange(50, 250))),
+        "agency": f"Agency {rng.randrange(20)}",
+        "category": CATEGORIES[number % len(CATEGORIES)],
+        "user_submitted": 0,
+    }
+
+
+def seed_articles(articles: int, seed: int) -> None:
+    """
+    Tops the database of the application up to the given number of articles.
+
+    The articles are added through the data-access layer in batches, so the category counters
+    and the latest articles are maintained like for submitted articles.
+
+    Args:
+        articles (int): The number of articles the database should hold.
+        seed (int): The seed of the synthetic data.
+    """
+    # pylint: disable=import-outside-toplevel
+    from src.db.api.main import add_articles
+    from src.db.common.connection import pooled_connection
+    from src.types import Article
+
+    with pooled_connection() as cnx, cnx.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM articles")
+        existing = cursor.fetchone()[0]
+        cnx.commit()
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    started_at = time.perf_counter()
+    for offset in range(existing, articles, SEED_BATCH_SIZE):
+        batch = [
+            Article.model_construct(**make_article(rng, i, start + timedelta(seconds=i * 30)))
+            for i in range(offset, min(offset + SEED_BATCH_SIZE, articles))
+        ]
+        add_articles(batch)
+        if (offset + len(batch)) % (SEED_BATCH_SIZE * 100) == 0:
+            print(f"Seeded {offset + len(batch)}/{articles} articles", file=sys.stderr)
+    if existing < articles:
+        elapsed = time.perf_counter() - started_at
+        print(f"Seeded {articles - existing} articles in {elapsed:.1f}s", file=sys.stderr)
+
+
+def _seed_template(path: str, articles: int, seed: int) -> None:
+    """
+    Creates and seeds the SQLite template database, runs in a separate process so the
+    benchmarked process starts with fresh pools and caches.
+    """
+    # pylint: disable=import-outside-toplevel
+    from . import fake_mysql
+
+    partial = f"{path}.partial"
+    for stale in (partial, f"{partial}-wal", f"{partial}-shm"):
+        if os.path.exists(stale):
+            os.remove(stale)
+    fake_mysql.install(partial)
+    from src.db.common.connection import close_pools
+    from src.db.setup.main import init_db
+
+    init_db()
+    seed_articles(articles, seed)
+    close_pools()
+    with sqlite3.connect(partial) as db:
+        db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        db.execute("PRAGMA journal_mode=DELETE")
+    os.replace(partial, path)
+
+
+def prepare_fake_database(articles: int, seed: int, data_dir: str) -> str:
+    """
+    Returns a fresh copy of the seeded template database, seeding the template first if
+    there is none for these settings yet.
+
+    Args:
+        articles (int): The number of articles.
+        seed (int): The seed of the synthetic data.
+        data_dir (str): The directory of the template and the copy.
+
+    Returns:
+        str: The path of the copy.
+    """
+    template = os.path.join(data_dir, f"api-load-{articles}-{seed}.sqlite")
+    if not os.path.exists(template):
+        process = multiprocessing.get_context("spawn").Process(
+            target=_seed_template, args=(template, articles, seed)
+        )
+        process.start()
+        process.join()
+        if process.exitcode != 0:
+            raise RuntimeError(f"Seeding the template database failed ({process.exitcode})")
+    copy = os.path.join(data_dir, f"api-load-{os.getpid()}.sqlite")
+    shutil.copyfile(template, copy)
+    return copy
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Returns the nearest-rank percentile of sorted values.
+
+    Args:
+        sorted_values (List[float]): The values in ascending order.
+        fraction (float): The percentile as a fraction, e.g. 0.95.
+
+    Returns:
+        float: The percentile, 0 for no values.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(fraction * len(sorted_values) + 0.999999))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    next_request: Callable[[random.Random], Request],
+    requests: int,
+    concurrency: int,
+    seed: int,
+) -> Dict[str, float]:
+    """
+    Sends requests with a fixed number of concurrent clients and measures their latency.
+
+    Args:
+        client (httpx.AsyncClient): The client of the application.
+        next_request (Callable[[random.Random], Request]): Builds the next request.
+        requests (int): The number of requests.
+        concurrency (int): The number of concurrent clients.
+        seed (int): The seed of the request parameters.
+
+    Returns:
+        Dict[str, float]: The latency percentiles in milliseconds, the throughput in requests
+            per second and the number of failed requests.
+    """
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker(rng: random.Random) -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            method, url, body = next_request(rng)
+            started_at = time.perf_counter()
+            response = await client.request(method, url, json=body)
+            latencies.append(time.perf_counter() - started_at)
+            if response.status_code >= 400:
+                errors += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(random.Random(seed + i)) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "throughput_rps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+async def category_pages(client: httpx.AsyncClient) -> Dict[str, int]:
+    """Returns the number of pages of every category."""
+    pages = {}
+    for category in CATEGORIES:
+        response = await client.get(f"/category/{category}/1")
+        response.raise_for_status()
+        pages[category] = max(1, response.json()["total_pages"])
+    return pages
+
+
+def build_scenarios(pages: Dict[str, int]) -> Dict[str, Callable[[random.Random], Request]]:
+    """
+    Builds the request generators of the scenarios.
+
+    Args:
+        pages (Dict[str, int]): The number of pages of every category.
+
+    Returns:
+        Dict[str, Callable[[random.Random], Request]]: The generator of every scenario.
+    """
+
+    def top_stories(_rng: random.Random) -> Request:
+        return "GET", "/top-stories", None
+
+    def category(rng: random.Random) -> Request:
+        name = rng.choice(CATEGORIES)
+        return "GET", f"/category/{name}/{rng.randint(1, min(3, pages[name]))}", None
+
+    def category_deep(rng: random.Random) -> Request:
+        name = rng.choice(CATEGORIES)
+        first = max(1, pages[name] - pages[name] // 10)
+        return "GET", f"/category/{name}/{rng.randint(first, pages[name])}", None
+
+    def post_article(rng: random.Random) -> Request:
+        article = make_article(rng, rng.randrange(1_000_000), datetime.now())
+        article["date"] = article["date"].isoformat()
+        article["user_submitted"] = 1
+        return "POST", "/article", article
+
+    return {
+        "top-stories": top_stories,
+        "category": category,
+        "category-deep": category_deep,
+        "post-article": post_article,
+    }
+
+
+async def run(app: Any, args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the selected scenarios against the application.
+
+    Args:
+        app (Any): The ASGI application.
+        args (argparse.Namespace): The command line arguments.
+
+    Returns:
+        Dict[str, Dict[str, float]]: The results of every scenario.
+    """
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    limits = httpx.Limits(max_connections=None)
+    async with app.router.lifespan_context(app), httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark", limits=limits
+    ) as client:
+        scenarios = build_scenarios(await category_pages(client))
+        for name in args.scenarios:
+            await run_scenario(client, scenarios[name], args.warmup, args.concurrency, args.seed)
+            results[name] = await run_scenario(
+                client, scenarios[name], args.requests, args.concurrency, args.seed
+            )
+            print_result(name, results[name])
+    return results
+
+
+def print_result(name: str, result: Dict[str, float]) -> None:
+    """Prints the result of a scenario as a table row."""
+    print(
+        f"{name:<16} {result['requests']:>8} {result['errors']:>7} {result['p50_ms']:>9.2f}"
+        f" {result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} {result['throughput_rps']:>10.1f}"
+    )
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float
+) -> List[str]:
+    """
+    Compares the p95 latency of every scenario with a baseline.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): The results of this run.
+        baseline (Dict[str, Dict[str, float]]): The results of the baseline run.
+        tolerance (float): The allowed slowdown as a fraction, e.g. 0.25.
+
+    Returns:
+        List[str]: A description of every scenario which got slower than allowed.
+    """
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None or before["p95_ms"] <= 0:
+            continue
+        if result["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {result['p95_ms']:.2f} ms, baseline {before['p95_ms']:.2f} ms"
+            )
+    return regressions
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the API under concurrent load")
+    parser.add_argument("--articles", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario")
+    parser.add_argument("--warmup", type=int, default=100, help="Unmeasured requests first")
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value: value.split(","),
+        default=SCENARIOS,
+        help=f"Comma separated subset of {','.join(SCENARIOS)}",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Disable the article cache (ARTICLES_CACHE_TTL=0)"
+    )
+    parser.add_argument("--mysql", action="store_true", help="Use the MySQL server of DB_*")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir())
+    parser.add_argument("--json", dest="json_path", help="Write the results to this file")
+    parser.add_argument("--baseline", help="Fail on regressions against this results file")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    if args.no_cache:
+        os.environ["ARTICLES_CACHE_TTL"] = "0"
+    # The stand-in only covers the mysql-connector based layer
+    os.environ["DB_DRIVER"] = os.environ.get("DB_DRIVER", "sync") if args.mysql else "sync"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    database = None
+    if not args.mysql:
+        # pylint: disable=import-outside-toplevel
+        from . import fake_mysql
+
+        database = prepare_fake_database(args.articles, args.seed, args.data_dir)
+        fake_mysql.install(database)
+    from src.app import app  # pylint: disable=import-outside-toplevel
+
+    try:
+        if args.mysql:
+            # pylint: disable=import-outside-toplevel
+            from src.db.setup.main import init_db
+
+            init_db()
+            seed_articles(args.articles, args.seed)
+        print(f"{args.articles} articles, {args.concurrency} concurrent clients")
+        print(
+            f"{'scenario':<16} {'requests':>8} {'errors':>7} {'p50 ms':>9} {'p95 ms':>9}"
+            f" {'p99 ms':>9} {'req/s':>10}"
+        )
+        results = asyncio.run(run(app, args))
+    finally:
+        if database is not None:
+            for path in (database, f"{database}-wal", f"{database}-shm"):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            regressions = find_regressions(results, json.load(file), args.max_regression)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+In-process stand-in for MySQL used by the API benchmarks.
+
+install() replaces mysql.connector.connect with a factory for connections to one SQLite database
+file, so connect_to_mysql(), the connection pools, init_db() and the sync data-access layer run
+unchanged against it. Each connection translates the MySQL dialect of the statements in the sql
+directories to SQLite on the fly. Only the sync driver is covered, aiomysql keeps talking to a
+real server.
+
+The stand-in is meant for tracking the cost of the application code (routing, pooling, caching,
+conversion and serialization) across changes. Its query plans and latencies are SQLite's, so
+database-bound numbers still need a run against MySQL, see api_load.py.
+"""
+
+from datetime import datetime
+import math
+import os
+import re
+import sqlite3
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+import mysql.connector
+from mysql.connector import errorcode
+
+_TRANSLATIONS: List[Tuple[re.Pattern, str]] = [
+    # SQLite divides integers without a fraction, MySQL does not
+    (re.compile(r" / %s"), " * 1.0 / %s"),
+    (re.compile(r"%s"), "?"),
+    (re.compile(r"ENGINE\s*=\s*InnoDB"), ""),
+    (re.compile(r"INSERT\s+IGNORE"), "INSERT OR IGNORE"),
+    (re.compile(r"ON DUPLICATE KEY\s+UPDATE.*", re.S), ""),
+    (re.compile(r"`id` int NOT NULL AUTO_INCREMENT"), "`id` INTEGER NOT NULL"),
+    (re.compile(r",\s*(UNIQUE\s+|FULLTEXT\s+)?KEY `[^`]+` \([^)]*\)"), ""),
+    (re.compile(r",\s*CONSTRAINT .*?ON UPDATE CASCADE", re.S), ""),
+    (re.compile(r"CURRENT_TIMESTAMP\(6\)"), "CURRENT_TIMESTAMP"),
+    # LEFT is a join keyword in SQLite, SUBSTR() counts characters from 1 like MySQL
+    (re.compile(r"\bLEFT\((\S+), \?\)"), r"SUBSTR(\1, 1, ?)"),
+]
+_CREATE_TABLE = re.compile(r"^\s*CREATE\s+TABLE\s+`?(\w+)", re.I)
+_INDEX_NAME = re.compile(r"^\s*CREATE\s+INDEX\s+`?(\w+)", re.I)
+
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(sep=" "))
+sqlite3.register_converter("datetime", lambda value: datetime.fromisoformat(value.decode()))
+
+
+def translate(sql: str) -> str:
+    """
+    Translates a MySQL statement of the sql directories to SQLite.
+
+    Args:
+        sql (str): The MySQL statement.
+
+    Returns:
+        str: The SQLite statement.
+    """
+    if re.match(r"\s*CREATE\s+FULLTEXT\s+INDEX", sql, re.I):
+        # SQLite has no FULLTEXT index, searches fall back to the memory backend
+        return "SELECT 1"
+    if "information_schema.COLUMNS" in sql:
+        # Every migrated column already has its final type in the SQLite schema
+        return "SELECT 'datetime' WHERE ? IS NOT NULL AND ? IS NOT NULL"
+    for pattern, replacement in _TRANSLATIONS:
+        sql = pattern.sub(replacement, sql)
+    return sql
+
+
+def _error(msg: str, errno: int) -> mysql.connector.Error:
+    return mysql.connector.Error(msg=msg, errno=errno)
+
+
+class FakeCursor:
+    """
+    A cursor of a FakeConnection, implementing the part of the mysql-connector cursor API the
+    data-access layer uses.
+    """
+
+    def __init__(self, connection: "FakeConnection") -> None:
+        self._connection = connection
+        self._cursor = connection.db.cursor()
+        self.rowcount = -1
+        self.lastrowid: Optional[int] = None
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def execute(self, sql: str, params: Optional[Sequence[Any]] = None) -> None:
+        """Executes a MySQL statement."""
+        statement = translate(sql)
+        table = _CREATE_TABLE.match(statement)
+        if table is not None and self._connection.has_object(table.group(1)):
+            raise _error(
+                f"Table '{table.group(1)}' already exists", errorcode.ER_TABLE_EXISTS_ERROR
+            )
+        index = _INDEX_NAME.match(statement)
+        if index is not None and self._connection.has_object(index.group(1)):
+            raise _error(f"Duplicate key name '{index.group(1)}'", errorcode.ER_DUP_KEYNAME)
+        try:
+            self._cursor.execute(statement, tuple(params or ()))
+        except sqlite3.OperationalError as e:
+            if "duplicate column" in str(e):
+                raise _error(str(e), errorcode.ER_DUP_FIELDNAME) from e
+            if "no such table" in str(e):
+                raise _error(str(e), errorcode.ER_NO_SUCH_TABLE) from e
+            raise _error(str(e), errorcode.ER_PARSE_ERROR) from e
+        self.rowcount = self._cursor.rowcount
+        self.lastrowid = self._cursor.lastrowid
+
+    def executemany(self, sql: str, seq_params: Iterable[Sequence[Any]]) -> None:
+        """Executes a MySQL statement once per parameter tuple."""
+        self._cursor.executemany(translate(sql), [tuple(params) for params in seq_params])
+        self.rowcount = self._cursor.rowcount
+
+    def fetchall(self) -> List[Tuple]:
+        """Returns the remaining rows."""
+        return self._cursor.fetchall()
+
+    def fetchmany(self, size: int = 1) -> List[Tuple]:
+        """Returns the next rows."""
+        return self._cursor.fetchmany(size)
+
+    def fetchone(self) -> Optional[Tuple]:
+        """Returns the next row."""
+        return self._cursor.fetchone()
+
+    @property
+    def description(self) -> Any:
+        """The column descriptions of the last statement."""
+        return self._cursor.description
+
+    def close(self) -> None:
+        """Closes the cursor."""
+        self._cursor.close()
+
+
+class FakeConnection:
+    """
+    A connection to the SQLite database file, implementing the part of the mysql-connector
+    connection API the connection pool and the data-access layer use.
+
+    Like a MySQL connection without autocommit, writes open a transaction which lasts until
+    commit() or rollback().
+    """
+
+    def __init__(self, path: str) -> None:
+        self.db = sqlite3.connect(
+            path,
+            timeout=30,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+        )
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.create_function("CEILING", 1, _ceiling, deterministic=True)
+        self.db.create_function("CEIL", 1, _ceiling, deterministic=True)
+        self.db.create_function("LEFT", 2, _left, deterministic=True)
+        self.db.create_function("GET_LOCK", 2, lambda _name, _timeout: 1)
+        self.db.create_function("RELEASE_LOCK", 1, lambda _name: 1)
+        self._closed = False
+
+    def has_object(self, name: str) -> bool:
+        """Whether a table or index of that name exists."""
+        row = self.db.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone()
+        return row is not None
+
+    def cursor(self, *_args: Any, **_kwargs: Any) -> FakeCursor:
+        """Returns a new cursor."""
+        return FakeCursor(self)
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction is open."""
+        return self.db.in_transaction
+
+    def commit(self) -> None:
+        """Commits the open transaction."""
+        self.db.commit()
+
+    def rollback(self) -> None:
+        """Rolls the open transaction back."""
+        self.db.rollback()
+
+    def is_connected(self) -> bool:
+        """Whether the connection is open."""
+        return not self._closed
+
+    def ping(self, *_args: Any, **_kwargs: Any) -> None:
+        """Does nothing, the database file is always reachable."""
+
+    def close(self) -> None:
+        """Closes the connection."""
+        self._closed = True
+        self.db.close()
+
+
+def _ceiling(value: Optional[float]) -> Optional[int]:
+    return None if value is None else math.ceil(value)
+
+
+def _left(value: Optional[str], length: int) -> Optional[str]:
+    return None if value is None else value[:length]
+
+
+def install(path: str) -> None:
+    """
+    Routes every mysql.connector.connect() call to the SQLite database file at path and sets
+    the connection settings the application requires to placeholder values.
+
+    Must be called before the application is imported.
+
+    Args:
+        path (str): The SQLite database file, created if missing.
+    """
+    mysql.connector.connect = lambda **_kwargs: FakeConnection(path)
+    for name, value in (
+        ("DB_USER", "benchmark"),
+        ("DB_USER_PASSWORD", "benchmark"),
+        ("DB_HOST", "localhost"),
+        ("DB_PORT", "3306"),
+        ("DB_NAME", "benchmark"),
+        ("ORIGIN_REGEX", ".*"),
+    ):
+        os.environ.setdefault(name, value)
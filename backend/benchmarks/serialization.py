@@ -0,0 +1,150 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Micro benchmark of the row-to-response path of the read endpoints.
+
+Compares the validating path (Article(**row) per row, then FastAPI validating the result against
+the response_model and encoding it via jsonable_encoder and json.dumps) with the trusted path
+(Article.model_construct() per row, rendered to bytes by the pydantic-core serializer) for a
+category page of 5 articles and the top-stories list of 6 articles.
+
+Run from the backend directory:
+
+    python -m benchmarks.serialization
+"""
+
+import argparse
+from datetime import datetime, timedelta
+import json
+import time
+from typing import Callable, List, Sequence, Tuple
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from src.db.api.main import row_to_article
+from src.rendering import render_articles, render_model
+from src.types import Article, GetCategoryArticlesResult
+
+CATEGORIES = ["Mathematics", "Physics", "Chemistry", "Medicine", "Biology", "IT"]
+
+
+def make_rows(count: int) -> List[Tuple]:
+    """
+    Builds rows as returned by the article select statements.
+
+    Args:
+        count (int): The number of rows.
+
+    Returns:
+        List[Tuple]: The rows.
+    """
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    return [
+        (
+            f"Article number {i} about something remarkable",
+            now - timedelta(days=i),
+            "Jane Doe",
+            "Lorem ipsum dolor sit amet. " * 70,
+            "Science Agency",
+            CATEGORIES[i % len(CATEGORIES)],
+            i % 2,
+        )
+        for i in range(count)
+    ]
+
+
+def validating_row_to_article(row: Sequence) -> Article:
+    """The row conversion used before the trusted path."""
+    return Article(
+        **{
+            "title": row[0],
+            "date": row[1],
+            "author": row[2],
+            "text": row[3],
+            "agency": row[4],
+            "category": row[5],
+            "user_submitted": row[6],
+        }
+    )
+
+
+def bench(name: str, func: Callable[[], bytes], iterations: int) -> float:
+    """
+    Times a function and prints the mean time per call.
+
+    Returns:
+        float: The mean time per call in microseconds.
+    """
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    micros = (time.perf_counter() - start) / iterations * 1e6
+    print(f"{name:<52} {micros:10.1f} us/request")
+    return micros
+
+
+def main() -> None:
+    """
+    Runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the row-to-response path")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    list_adapter = TypeAdapter(List[Article])
+    result_adapter = TypeAdapter(GetCategoryArticlesResult)
+    top_rows = make_rows(6)
+    page_rows = make_rows(5)
+
+    def top_validating() -> bytes:
+        articles = [validating_row_to_article(row) for row in top_rows]
+        validated = list_adapter.validate_python(articles, from_attributes=True)
+        return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+    def top_trusted() -> bytes:
+        return render_articles([row_to_article(row) for row in top_rows])
+
+    def page_validating() -> bytes:
+        result = GetCategoryArticlesResult(
+            articles=[validating_row_to_article(row) for row in page_rows], total_pages=3
+        )
+        validated = result_adapter.validate_python(result, from_attributes=True)
+        return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+    def page_trusted() -> bytes:
+        return render_model(
+            GetCategoryArticlesResult.model_construct(
+                articles=[row_to_article(row) for row in page_rows], total_pages=3
+            )
+        )
+
+    assert json.loads(top_validating()) == json.loads(top_trusted())
+    assert json.loads(page_validating()) == json.loads(page_trusted())
+
+    for name, validating, trusted in (
+        ("/top-stories (6 articles)", top_validating, top_trusted),
+        ("/category/{category}/{page} (5 articles)", page_validating, page_trusted),
+    ):
+        before = bench(f"{name} validating", validating, args.iterations)
+        after = bench(f"{name} trusted", trusted, args.iterations)
+        print(f"{'':<52} {(1 - after / before) * 100:9.1f} % less CPU\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,27 +21,189 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 This module contains the FastAPI application for a news article management system.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 import logging
+import math
 import os
-import sys
-from typing import Dict, List
-from fastapi import FastAPI, HTTPException, status
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from .article_stream import TooManySubscribersError, article_broadcaster
+from .db.api import async_main as async_db
+from .db.api.cache import articles_cache, search_cache
+from .db.api.events import add_article_listener
 from .db.api.main import (
+    LATEST_ARTICLES_DEPTH,
+    get_article,
     get_top_articles,
     get_category_articles,
+    get_category_articles_page,
     add_article,
+    add_articles,
+    get_projected_category_articles,
+    get_projected_top_articles,
+    search_articles,
 )
-from .db.setup.main import (
-    init_db,
+from .db.api.pagination import InvalidCursorError
+from .db.api.projection import EXCERPT_MAX_LENGTH, InvalidProjectionError, parse_projection
+from .db.api.versions import content_versions
+from .db.api.write_behind import QueueClosedError, QueueFullError, WriteBehindQueue
+from .db.common.async_connection import close_async_pool
+from .db.common.circuit_breaker import CircuitOpenError, get_circuit_breaker_stats
+from .db.common.connection import close_pools, get_pool_stats
+from .db.common.routing import read_router
+from .db.setup.main import DB_STARTUP_MODE, DB_STARTUP_RETRY_INTERVAL, prepare_db
+from .db.api.search import SEARCH_MAX_QUERY_LENGTH
+from .http_cache import (
+    CACHE_CONTROL_ARTICLE,
+    CACHE_CONTROL_CATEGORY,
+    CACHE_CONTROL_SEARCH,
+    CACHE_CONTROL_TOP_STORIES,
+    is_not_modified,
+    make_validators,
+    not_modified_response,
 )
-from .types import Article, Category, GetCategoryArticlesResult, HealthCheck
+from .ingest import MalformedBodyError, ingest_articles, is_ndjson
+from .metrics import (
+    METRICS_ENABLED,
+    MetricsMiddleware,
+    metrics_response,
+    release_process_metrics,
+)
+from .profiling import PROFILING_ENABLED, ProfilingMiddleware, get_recent_traces, mark_routed
+from .rendering import render_articles, render_json, render_model
+from .response_store import negotiate_encoding, response_store
+from .snapshots import SNAPSHOT_DIR, SnapshotPublisher, SnapshotStore
+from .structured_logging import configure_logging
+from .types import (
+    Article,
+    ArticleStreamStats,
+    BulkIngestResult,
+    CacheStats,
+    Category,
+    CircuitBreakerStats,
+    GetCategoryArticlesPageResult,
+    GetCategoryArticlesResult,
+    HealthCheck,
+    PoolStats,
+    ProfileTrace,
+    ReadRoutingStats,
+    ResponseStoreStats,
+    SnapshotStats,
+    SearchArticlesResult,
+    WriteBehindStats,
+)
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# "sync" runs the mysql-connector data-access layer on the threadpool, "async" awaits the
+# aiomysql based layer on the event loop
+DB_DRIVER = os.environ.get("DB_DRIVER", "sync").lower()
+if DB_DRIVER not in ("sync", "async"):
+    raise ValueError(f"Unsupported DB_DRIVER '{DB_DRIVER}', expected 'sync' or 'async'")
+USE_ASYNC_DB = DB_DRIVER == "async"
+
+# With write-behind enabled, POST /article queues the article and answers 202 Accepted
+WRITE_BEHIND = os.environ.get("WRITE_BEHIND", "false").lower() == "true"
+
+# Set once the database schema was verified, reported by the readiness probe
+database_ready = asyncio.Event()
+
+
+async def prepare_database() -> None:
+    """
+    Prepares the database in the background according to DB_STARTUP_MODE, retrying until the
+    schema is current, and then marks the process as ready.
+    """
+    while True:
+        try:
+            if await run_in_threadpool(prepare_db, DB_STARTUP_MODE):
+                database_ready.set()
+                return
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Preparing the database failed: %s", str(e))
+        await asyncio.sleep(DB_STARTUP_RETRY_INTERVAL)
+
+
+async def insert_articles(articles: List[Article]) -> None:
+    """
+    Adds a batch of articles to the database in one transaction using the configured driver.
+
+    Args:
+        articles (List[Article]): The articles to be added.
+    """
+    if USE_ASYNC_DB:
+        await async_db.add_articles(articles)
+    else:
+        await run_in_threadpool(add_articles, articles)
 
-logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 
-init_db()
+write_behind_queue: Optional[WriteBehindQueue] = None
+snapshot_publisher: Optional[SnapshotPublisher] = None
+
+# Frees the rendered bodies a write made stale, also one made through another worker process.
+# The bumped content version already keeps them from being served
+add_article_listener(lambda article: response_store.invalidate(article.category))
+content_versions.add_change_listener(response_store.invalidate)
+
+add_article_listener(article_broadcaster.publish_article)
+content_versions.add_change_listener(article_broadcaster.publish_change)
+
+
+def publish_snapshots(article: Article) -> None:
+    """
+    Schedules the static snapshots of the category of an added article for re-rendering.
+
+    Args:
+        article (Article): The article that was added.
+    """
+    if snapshot_publisher is not None:
+        snapshot_publisher.mark_dirty(article.category)
+
+
+add_article_listener(publish_snapshots)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """
+    Starts preparing the database, the write-behind writer, the article stream and the
+    snapshot publisher and, when the application shuts down, writes all queued articles,
+    publishes the pending snapshots, ends the article streams and releases the database
+    connection pools.
+
+    The database is prepared in the background, so the process answers the liveness probe right
+    away and the readiness probe once the schema is verified.
+    """
+    global write_behind_queue, snapshot_publisher  # pylint: disable=global-statement
+    preparation = asyncio.create_task(prepare_database())
+    article_broadcaster.start()
+    if WRITE_BEHIND:
+        write_behind_queue = WriteBehindQueue(insert=insert_articles)
+        write_behind_queue.start()
+    if SNAPSHOT_DIR:
+        snapshot_publisher = SnapshotPublisher(SnapshotStore(SNAPSHOT_DIR))
+        snapshot_publisher.start()
+    yield
+    preparation.cancel()
+    if write_behind_queue is not None:
+        await write_behind_queue.stop()
+    if snapshot_publisher is not None:
+        await snapshot_publisher.stop()
+    article_broadcaster.close()
+    if USE_ASYNC_DB:
+        await close_async_pool()
+    close_pools()
+    release_process_metrics()
 
-app = FastAPI()
+
+app = FastAPI(
+    lifespan=lifespan, dependencies=[Depends(mark_routed)] if PROFILING_ENABLED else None
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -52,62 +214,439 @@ app.add_middleware(
     ],
 )
 
+if PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+
+def database_unavailable(error: CircuitOpenError) -> HTTPException:
+    """
+    Builds the 503 Service Unavailable response for a request that failed fast because the
+    database circuit breaker is open.
+
+    Args:
+        error (CircuitOpenError): The error raised by the connection layer.
+
+    Returns:
+        HTTPException: The exception to raise, telling the client when to retry.
+    """
+    return HTTPException(
+        status_code=503,
+        detail="Database unavailable",
+        headers={"Retry-After": str(max(1, math.ceil(error.retry_after)))},
+    )
+
+
+async def stored_json_response(
+    request: Request,
+    variant: str,
+    category: Optional[Category],
+    cache_control: str,
+    render: Callable[[], Awaitable[bytes]],
+) -> Response:
+    """
+    Answers a read request from the rendered response store, rendering the body only if the
+    store holds none for the current content version.
+
+    Negotiates the content coding with Accept-Encoding and answers with 304 Not Modified if the
+    client's ETag or Last-Modified date is still current. The ETag names the content coding only
+    if the body is actually sent compressed.
+
+    Args:
+        request (Request): The incoming request.
+        variant (str): Identifies the route and its parameters.
+        category (Optional[Category]): The category the content belongs to, None if it spans
+            all of them.
+        cache_control (str): The Cache-Control header value of the route.
+        render (Callable[[], Awaitable[bytes]]): Loads and renders the JSON body.
+
+    Returns:
+        Response: The response.
+    """
+    version, modified_at = content_versions.get(category)
+    # The ETag depends on the coding actually sent, which depends on the size of the body
+    rendered = response_store.get(variant, version)
+    if rendered is None:
+        rendered = response_store.put(variant, category, version, await render())
+    encoding = rendered.content_coding(negotiate_encoding(request.headers.get("accept-encoding")))
+    validators = make_validators(
+        version, modified_at, variant=variant, cache_control=cache_control, encoding=encoding
+    )
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    return response_store.respond(rendered, encoding, validators.headers)
 
-@app.get("/top-stories")
-def get_top_stories() -> List[Article]:
+
+@app.get("/top-stories", response_model=List[Article])
+async def get_top_stories(
+    request: Request,
+    per_category: int = Query(1, ge=1, le=LATEST_ARTICLES_DEPTH),
+    fields: Optional[str] = None,
+    excerpt: Optional[int] = Query(None, ge=1, le=EXCERPT_MAX_LENGTH),
+) -> Union[List[Article], Response]:
     """
     Retrieves the top articles from the database.
 
+    Answers with 304 Not Modified if the client's ETag or Last-Modified date is still current.
+
+    Args:
+        per_category (int): The number of most recent articles per category. Defaults to 1.
+        fields (Optional[str]): Comma separated article fields to return, e.g.
+            "id,title,date". Defaults to all fields of an Article.
+        excerpt (Optional[int]): Cuts the text to at most this many characters. Defaults to
+            the full text.
+
     Returns:
-        List[Article]: A list of Article objects representing the top articles.
+        List[Article]: A list of Article objects representing the top articles, with only the
+            requested fields if fields or excerpt is given.
     """
     try:
-        top_stories = get_top_articles()
-        return top_stories
+        projection = parse_projection(fields, excerpt)
+    except InvalidProjectionError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    async def render() -> bytes:
+        if projection is not None:
+            if USE_ASYNC_DB:
+                projected = await async_db.get_projected_top_articles(per_category, projection)
+            else:
+                projected = await run_in_threadpool(
+                    get_projected_top_articles, per_category, projection
+                )
+            return render_json(projected)
+        if USE_ASYNC_DB:
+            top_stories = await async_db.get_top_articles(per_category)
+        else:
+            top_stories = await run_in_threadpool(get_top_articles, per_category)
+        return render_articles(top_stories)
+
+    variant = f"top-stories?per_category={per_category}"
+    if projection is not None:
+        variant += f"&{projection.key}"
+    try:
+        return await stored_json_response(
+            request,
+            variant=variant,
+            category=None,
+            cache_control=CACHE_CONTROL_TOP_STORIES,
+            render=render,
+        )
+    except CircuitOpenError as e:
+        raise database_unavailable(e) from e
     except Exception as e:
-        print(e)
+        logger.exception("Request failed: %s", str(e))
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
 
 
-@app.get("/category/{category}/{page}")
-def get_category_stories(category: Category, page: int) -> GetCategoryArticlesResult:
+@app.get("/category/{category}/{page}", response_model=GetCategoryArticlesResult)
+async def get_category_stories(
+    category: Category,
+    page: int,
+    request: Request,
+    fields: Optional[str] = None,
+    excerpt: Optional[int] = Query(None, ge=1, le=EXCERPT_MAX_LENGTH),
+) -> Union[GetCategoryArticlesResult, Response]:
     """
     Retrieves articles from the database for a given category.
 
+    Answers with 304 Not Modified if the client's ETag or Last-Modified date is still current.
+
     Args:
         category (str): The category of articles to retrieve.
+        fields (Optional[str]): Comma separated article fields to return, e.g.
+            "id,title,date". Defaults to all fields of an Article.
+        excerpt (Optional[int]): Cuts the text to at most this many characters. Defaults to
+            the full text.
 
     Returns:
         GetCategoryArticlesResult: A list of Article objects for the specified category
-            and the total number of article pages in this category.
+            and the total number of article pages in this category. The articles carry only
+            the requested fields if fields or excerpt is given.
     """
     try:
-        category_articles_result = get_category_articles(category, page)
-        return category_articles_result
+        projection = parse_projection(fields, excerpt)
+    except InvalidProjectionError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    async def render() -> bytes:
+        if projection is not None:
+            if USE_ASYNC_DB:
+                projected = await async_db.get_projected_category_articles(
+                    category, page, projection
+                )
+            else:
+                projected = await run_in_threadpool(
+                    get_projected_category_articles, category, page, projection
+                )
+            return render_json(projected)
+        if USE_ASYNC_DB:
+            category_articles_result = await async_db.get_category_articles(category, page)
+        else:
+            category_articles_result = await run_in_threadpool(
+                get_category_articles, category, page
+            )
+        return render_model(category_articles_result)
+
+    variant = f"category/{category}/{page}"
+    if projection is not None:
+        variant += f"?{projection.key}"
+    try:
+        return await stored_json_response(
+            request,
+            variant=variant,
+            category=category,
+            cache_control=CACHE_CONTROL_CATEGORY,
+            render=render,
+        )
+    except CircuitOpenError as e:
+        raise database_unavailable(e) from e
     except Exception as e:
-        print(e)
+        logger.exception("Request failed: %s", str(e))
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
 
 
-@app.post("/article")
-def post_article(article: Article) -> Dict[str, str]:
+@app.get("/category/{category}", response_model=GetCategoryArticlesPageResult)
+async def get_category_stories_page(
+    category: Category, request: Request, cursor: Optional[str] = None
+) -> Union[GetCategoryArticlesPageResult, Response]:
+    """
+    Retrieves a page of articles for a given category using cursor pagination.
+
+    Deep pages cost the same as the first one. Answers with 304 Not Modified if the client's
+    ETag or Last-Modified date is still current.
+
+    Args:
+        category (str): The category of articles to retrieve.
+        cursor (Optional[str]): The next_cursor of the previous page, omitted for the first
+            page.
+
+    Returns:
+        GetCategoryArticlesPageResult: A list of Article objects for the specified category
+            and the cursor of the next page, which is null on the last page.
+    """
+
+    async def render() -> bytes:
+        if USE_ASYNC_DB:
+            page_result = await async_db.get_category_articles_page(category, cursor)
+        else:
+            page_result = await run_in_threadpool(get_category_articles_page, category, cursor)
+        return render_model(page_result)
+
+    try:
+        return await stored_json_response(
+            request,
+            variant=f"category/{category}?cursor={cursor}",
+            category=category,
+            cache_control=CACHE_CONTROL_CATEGORY,
+            render=render,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+    except CircuitOpenError as e:
+        raise database_unavailable(e) from e
+    except Exception as e:
+        logger.exception("Request failed: %s", str(e))
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
+
+
+@app.get("/search", response_model=SearchArticlesResult)
+async def get_search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=SEARCH_MAX_QUERY_LENGTH),
+    category: Optional[Category] = None,
+    cursor: Optional[str] = None,
+) -> Union[SearchArticlesResult, Response]:
+    """
+    Searches the title and text of the articles, most relevant first.
+
+    Answers with 304 Not Modified if the client's ETag or Last-Modified date is still current.
+
+    Args:
+        q (str): The words to search for.
+        category (Optional[str]): Only search articles of this category.
+        cursor (Optional[str]): The next_cursor of the previous page, omitted for the first
+            page.
+
+    Returns:
+        SearchArticlesResult: The matching articles and the cursor of the next page, which is
+            null on the last page.
+    """
+
+    async def render() -> bytes:
+        if USE_ASYNC_DB:
+            search_result = await async_db.search_articles(q, category, cursor)
+        else:
+            search_result = await run_in_threadpool(search_articles, q, category, cursor)
+        return render_model(search_result)
+
+    try:
+        return await stored_json_response(
+            request,
+            variant=f"search?q={q}&category={category}&cursor={cursor}",
+            category=category,
+            cache_control=CACHE_CONTROL_SEARCH,
+            render=render,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+    except CircuitOpenError as e:
+        raise database_unavailable(e) from e
+    except Exception as e:
+        logger.exception("Request failed: %s", str(e))
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
+
+
+@app.get("/article/{article_id}", response_model=Article)
+async def get_single_article(article_id: int, request: Request) -> Union[Article, Response]:
+    """
+    Retrieves a single article with its full text, e.g. after listing articles with an excerpt.
+
+    Answers with 304 Not Modified if the client's ETag or Last-Modified date is still current.
+
+    Args:
+        article_id (int): The id of the article.
+
+    Returns:
+        Article: The article.
+    """
+
+    async def render() -> bytes:
+        if USE_ASYNC_DB:
+            article = await async_db.get_article(article_id)
+        else:
+            article = await run_in_threadpool(get_article, article_id)
+        if article is None:
+            raise HTTPException(status_code=404, detail="Article not found")
+        return render_model(article)
+
+    try:
+        return await stored_json_response(
+            request,
+            variant=f"article/{article_id}",
+            category=None,
+            cache_control=CACHE_CONTROL_ARTICLE,
+            render=render,
+        )
+    except HTTPException:
+        raise
+    except CircuitOpenError as e:
+        raise database_unavailable(e) from e
+    except Exception as e:
+        logger.exception("Request failed: %s", str(e))
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
+
+
+@app.get(
+    "/stream/articles",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_articles(
+    category: Optional[List[Category]] = Query(None),
+    last_event_id: Optional[str] = Header(None),
+) -> StreamingResponse:
+    """
+    Streams the articles added from now on as server-sent events, so clients do not need to
+    poll the lists.
+
+    Every added article is sent as an `article` event with the article as data. Articles added
+    through another worker process are announced as a `changed` event with their category, a
+    `reset` event asks the client to refetch the lists because events were lost. Comments are
+    sent as heartbeats. Reconnecting clients send the Last-Event-ID header to receive the events
+    they missed.
+
+    Args:
+        category (Optional[List[str]]): Only stream articles of these categories, can be
+            repeated. Defaults to all categories.
+        last_event_id (Optional[str]): The id of the last event received before reconnecting.
+
+    Returns:
+        StreamingResponse: The event stream.
+    """
+    try:
+        events = article_broadcaster.stream(category, last_event_id)
+    except TooManySubscribersError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many subscribers",
+            headers={"Retry-After": str(math.ceil(article_broadcaster.heartbeat_interval))},
+        ) from e
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/article", responses={202: {"description": "Article queued for writing"}})
+async def post_article(article: Article) -> Dict[str, str]:
     """
     Adds a new article to the database.
 
+    In write-behind mode the article is queued and the response is 202 Accepted with the id of
+    the submission, the article is committed shortly after as part of a batch.
+
     Args:
         article (Article): The Article object to be added to the database.
 
     Returns:
         Dict[str, str]: A dictionary with a success message.
     """
+    if write_behind_queue is not None:
+        try:
+            submission_id = await write_behind_queue.submit(article)
+        except (QueueFullError, QueueClosedError) as e:
+            raise HTTPException(
+                status_code=503, detail=str(e), headers={"Retry-After": "1"}
+            ) from e
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"message": "Article accepted", "id": submission_id},
+        )
     try:
-        add_article(article)
+        if USE_ASYNC_DB:
+            await async_db.add_article(article)
+        else:
+            await run_in_threadpool(add_article, article)
         return {"message": "Article added successfully"}
+    except CircuitOpenError as e:
+        raise database_unavailable(e) from e
     except Exception as e:
-        print(e)
+        logger.exception("Request failed: %s", str(e))
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
 
 
+@app.post(
+    "/articles",
+    response_model=BulkIngestResult,
+    responses={400: {"description": "Malformed body, with the rows stored before the error"}},
+)
+async def post_articles(request: Request) -> Union[BulkIngestResult, Response]:
+    """
+    Adds many articles to the database at once.
+
+    The body is either a JSON array of articles or, with a Content-Type of
+    application/x-ndjson, one article per line. It is processed as it streams in, each row is
+    validated on its own and valid rows are inserted in batched transactions.
+
+    If the body turns out to be malformed, the valid rows read before the error are stored
+    nonetheless and the 400 response reports them next to the error detail.
+
+    Returns:
+        BulkIngestResult: The number of inserted and rejected rows and the rejection reasons.
+    """
+    try:
+        return await ingest_articles(
+            request.stream(),
+            ndjson=is_ndjson(request.headers.get("content-type", "")),
+            insert=insert_articles,
+        )
+    except MalformedBodyError as e:
+        content = e.result.model_dump() if e.result is not None else {}
+        return JSONResponse(status_code=400, content={"detail": str(e), **content})
+
+
 @app.get(
     "/health",
     tags=["healthcheck"],
@@ -123,7 +662,229 @@ def get_health() -> HealthCheck:
     to ensure a robust container orchestration and management is in place. Other
     services which rely on proper functioning of the API service will not deploy if this
     endpoint returns any other HTTP status code except 200 (OK).
+
+    This is the liveness probe, it does not touch the database. Use /health/ready to decide
+    whether to route traffic to the process.
     Returns:
         HealthCheck: Returns a JSON response with the health status
     """
     return HealthCheck(status="OK")
+
+
+@app.get(
+    "/health/ready",
+    tags=["healthcheck"],
+    summary="Perform a Readiness Check",
+    response_description="Return HTTP Status Code 200 (OK) once the database is prepared",
+    status_code=status.HTTP_200_OK,
+    response_model=HealthCheck,
+)
+def get_health_ready() -> HealthCheck:
+    """
+    Returns whether the process is ready to serve requests, i.e. the database schema was
+    verified (or bootstrapped) according to DB_STARTUP_MODE.
+
+    Returns:
+        HealthCheck: Returns a JSON response with the readiness status.
+
+    Raises:
+        HTTPException: 503 while the database is not prepared yet.
+    """
+    if not database_ready.is_set():
+        raise HTTPException(
+            status_code=503, detail="Database not prepared", headers={"Retry-After": "1"}
+        )
+    return HealthCheck(status="OK")
+
+
+@app.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    """
+    Returns the Prometheus metrics of this process.
+
+    Returns:
+        Response: The metrics in the Prometheus text exposition format.
+
+    Raises:
+        HTTPException: 404 if metrics are disabled.
+    """
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return metrics_response()
+
+
+@app.get(
+    "/health/pool",
+    tags=["healthcheck"],
+    summary="Get database connection pool statistics",
+    response_model=PoolStats,
+)
+def get_health_pool() -> PoolStats:
+    """
+    Returns a snapshot of the database connection pool, e.g. to spot pool exhaustion.
+
+    Returns:
+        PoolStats: The current pool statistics.
+    """
+    return get_pool_stats()
+
+
+@app.get(
+    "/health/circuit",
+    tags=["healthcheck"],
+    summary="Get database circuit breaker states",
+    response_model=List[CircuitBreakerStats],
+)
+def get_health_circuit() -> List[CircuitBreakerStats]:
+    """
+    Returns the state and transition counters of the circuit breaker of every database
+    instance that was connected to.
+
+    Returns:
+        List[CircuitBreakerStats]: The current circuit breaker statistics.
+    """
+    return get_circuit_breaker_stats()
+
+
+@app.get(
+    "/health/traces",
+    tags=["healthcheck"],
+    summary="Get recent slow request profiles",
+    response_model=List[ProfileTrace],
+)
+def get_health_traces() -> List[ProfileTrace]:
+    """
+    Returns the kept profiles of slow or explicitly profiled requests, most recent first.
+
+    Returns:
+        List[ProfileTrace]: The request profiles.
+
+    Raises:
+        HTTPException: 404 if profiling is disabled.
+    """
+    if not PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+    return get_recent_traces()
+
+
+@app.get(
+    "/health/cache",
+    tags=["healthcheck"],
+    summary="Get article cache statistics",
+    response_model=CacheStats,
+)
+def get_health_cache() -> CacheStats:
+    """
+    Returns the hit, miss and eviction counters of the article cache.
+
+    Returns:
+        CacheStats: The current cache statistics.
+    """
+    return articles_cache.stats()
+
+
+@app.get(
+    "/health/cache/search",
+    tags=["healthcheck"],
+    summary="Get search result cache statistics",
+    response_model=CacheStats,
+)
+def get_health_search_cache() -> CacheStats:
+    """
+    Returns the hit, miss and eviction counters of the search result cache.
+
+    Returns:
+        CacheStats: The current cache statistics.
+    """
+    return search_cache.stats()
+
+
+@app.get(
+    "/health/responses",
+    tags=["healthcheck"],
+    summary="Get rendered response store statistics",
+    response_model=ResponseStoreStats,
+)
+def get_health_responses() -> ResponseStoreStats:
+    """
+    Returns the hit, miss and compression counters of the rendered response store.
+
+    Returns:
+        ResponseStoreStats: The current store statistics.
+    """
+    return response_store.stats()
+
+
+@app.get(
+    "/health/stream",
+    tags=["healthcheck"],
+    summary="Get article stream statistics",
+    response_model=ArticleStreamStats,
+)
+def get_health_stream() -> ArticleStreamStats:
+    """
+    Returns the subscriber and event counters of the article stream.
+
+    Returns:
+        ArticleStreamStats: The current stream statistics.
+    """
+    return article_broadcaster.stats()
+
+
+@app.get(
+    "/health/replicas",
+    tags=["healthcheck"],
+    summary="Get read routing statistics",
+    response_model=ReadRoutingStats,
+)
+def get_health_replicas() -> ReadRoutingStats:
+    """
+    Returns the state of the database readers and how reads were routed between them and the
+    writer.
+
+    Returns:
+        ReadRoutingStats: The current routing statistics.
+    """
+    return read_router.stats()
+
+
+@app.get(
+    "/health/write-behind",
+    tags=["healthcheck"],
+    summary="Get write-behind queue statistics",
+    response_model=WriteBehindStats,
+)
+def get_health_write_behind() -> WriteBehindStats:
+    """
+    Returns the depth and flush latency of the write-behind queue.
+
+    Returns:
+        WriteBehindStats: The current queue statistics.
+
+    Raises:
+        HTTPException: 404 if write-behind mode is disabled.
+    """
+    if write_behind_queue is None:
+        raise HTTPException(status_code=404, detail="Write-behind mode is disabled")
+    return write_behind_queue.stats()
+
+
+@app.get(
+    "/health/snapshots",
+    tags=["healthcheck"],
+    summary="Get static snapshot publisher statistics",
+    response_model=SnapshotStats,
+)
+def get_health_snapshots() -> SnapshotStats:
+    """
+    Returns the pending categories and publish counters of the static snapshot publisher.
+
+    Returns:
+        SnapshotStats: The current publisher statistics.
+
+    Raises:
+        HTTPException: 404 if SNAPSHOT_DIR is not set.
+    """
+    if snapshot_publisher is None:
+        raise HTTPException(status_code=404, detail="Snapshot publishing is disabled")
+    return snapshot_publisher.stats()
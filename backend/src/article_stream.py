@@ -0,0 +1,306 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Fan-out of newly added articles to the subscribers of GET /stream/articles (server-sent events).
+
+Every committed article is rendered once into an event frame, which is appended to the buffer of
+every subscriber whose category filter matches. A subscriber is an asyncio queue its response
+awaits, so an idle subscriber costs a pending future, and a single task sends the heartbeats of
+all of them.
+
+A subscriber whose buffer of STREAM_SUBSCRIBER_BUFFER frames is full is dropped rather than
+slowing down the others or growing without bound, its client reconnects. The last
+STREAM_REPLAY_EVENTS frames are kept, so a client reconnecting with Last-Event-ID receives what
+it missed. If the id was handed out by another process or is too old, the client gets a reset
+event and refetches the lists instead.
+
+Only the worker that wrote an article has it. Writes made through another worker process of
+python -m src.serve are announced as changed events with the category.
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+import os
+import threading
+from typing import Any, AsyncIterator, Callable, Deque, FrozenSet, List, Optional, Set
+import uuid
+from pydantic_core import to_json
+from .db.api.versions import content_versions
+from .rendering import render_model
+from .types import Article, ArticleStreamStats, Category
+
+STREAM_SUBSCRIBER_BUFFER = int(os.environ.get("STREAM_SUBSCRIBER_BUFFER", "64"))
+STREAM_REPLAY_EVENTS = int(os.environ.get("STREAM_REPLAY_EVENTS", "256"))
+STREAM_HEARTBEAT_INTERVAL = float(os.environ.get("STREAM_HEARTBEAT_INTERVAL", "15"))
+STREAM_MAX_SUBSCRIBERS = int(os.environ.get("STREAM_MAX_SUBSCRIBERS", "10000"))
+# Streams end after this many seconds and clients resume them, which also spreads them over new
+# tasks after a scale-out
+STREAM_MAX_DURATION = float(os.environ.get("STREAM_MAX_DURATION", "600"))
+# How often a worker looks for writes made through the other workers
+STREAM_SYNC_INTERVAL = 1.0
+
+# The reconnection delay clients use, in milliseconds
+RETRY_FRAME = b"retry: 3000\n\n"
+HEARTBEAT_FRAME = b": heartbeat\n\n"
+
+
+class TooManySubscribersError(Exception):
+    """Raised when a stream is requested while STREAM_MAX_SUBSCRIBERS are connected."""
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """
+    A published event, kept for replay.
+
+    Attributes:
+        seq (int): The sequence number of the event in this process.
+        category (Category): The category the event is about.
+        frame (bytes): The encoded event.
+    """
+
+    seq: int
+    category: Category
+    frame: bytes
+
+
+class Subscriber:
+    """
+    The buffer of frames not yet sent to a client.
+    """
+
+    def __init__(self, categories: Optional[FrozenSet[Category]], buffer: int) -> None:
+        self.categories = categories
+        self.queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(maxsize=buffer)
+        self.closed = False
+
+    def wants(self, category: Category) -> bool:
+        """Whether the subscriber's category filter matches."""
+        return self.categories is None or category in self.categories
+
+    def close(self) -> None:
+        """Ends the stream once the buffered frames are sent."""
+        self.closed = True
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # The stream checks closed after every frame
+            pass
+
+
+class ArticleBroadcaster:
+    """
+    Publishes article events to the subscribers of the article stream.
+
+    publish_article() and publish_change() may be called from any thread, the subscribers are
+    served on the event loop the broadcaster was started on.
+    """
+
+    def __init__(
+        self,
+        subscriber_buffer: int = STREAM_SUBSCRIBER_BUFFER,
+        replay_events: int = STREAM_REPLAY_EVENTS,
+        heartbeat_interval: float = STREAM_HEARTBEAT_INTERVAL,
+        max_subscribers: int = STREAM_MAX_SUBSCRIBERS,
+        max_duration: float = STREAM_MAX_DURATION,
+    ) -> None:
+        self.subscriber_buffer = subscriber_buffer
+        self.heartbeat_interval = heartbeat_interval
+        self.max_subscribers = max_subscribers
+        self.max_duration = max_duration
+        self.stream_id = uuid.uuid4().hex[:8]
+        self._seq = 0
+        self._replay: Deque[StreamEvent] = deque(maxlen=replay_events)
+        self._subscribers: Set[Subscriber] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._tasks: List["asyncio.Task[None]"] = []
+
+        self._published = 0
+        self._dropped = 0
+        self._resumed = 0
+        self._resets = 0
+
+    def start(self) -> None:
+        """
+        Starts serving subscribers on the running event loop.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._tasks.append(asyncio.create_task(self._send_heartbeats()))
+        if content_versions.shared:
+            self._tasks.append(asyncio.create_task(self._watch_other_workers()))
+
+    def close(self) -> None:
+        """
+        Stops publishing and ends all streams.
+        """
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        self._loop = None
+        for subscriber in self._subscribers:
+            subscriber.close()
+        self._subscribers.clear()
+
+    def publish_article(self, article: Article) -> None:
+        """
+        Sends an article to the subscribers of its category.
+
+        Args:
+            article (Article): The article that was added.
+        """
+        self._call(self._publish, article.category, "article", render_model(article))
+
+    def publish_change(self, category: Category) -> None:
+        """
+        Tells the subscribers of a category that another process added articles to it.
+
+        Args:
+            category (Category): The category that changed.
+        """
+        self._call(self._publish, category, "changed", to_json({"category": category}))
+
+    def _call(self, func: Callable[..., None], *args: Any) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        if threading.get_ident() == self._loop_thread:
+            func(*args)
+        else:
+            try:
+                loop.call_soon_threadsafe(func, *args)
+            except RuntimeError:
+                # The loop closed in the meantime
+                pass
+
+    def _frame(self, event: str, data: bytes) -> bytes:
+        return f"id: {self.stream_id}.{self._seq}\nevent: {event}\ndata: ".encode() + data + b"\n\n"
+
+    def _publish(self, category: Category, event: str, data: bytes) -> None:
+        self._seq += 1
+        self._published += 1
+        published = StreamEvent(self._seq, category, self._frame(event, data))
+        self._replay.append(published)
+        for subscriber in list(self._subscribers):
+            if subscriber.wants(category):
+                self._offer(subscriber, published.frame)
+
+    def _offer(self, subscriber: Subscriber, frame: bytes) -> None:
+        try:
+            subscriber.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            # A slow consumer, its client resumes from the replay buffer after reconnecting
+            self._subscribers.discard(subscriber)
+            self._dropped += 1
+            subscriber.close()
+
+    def _backlog(self, subscriber: Subscriber, last_event_id: Optional[str]) -> List[bytes]:
+        if last_event_id is None:
+            return []
+        stream_id, _, seq = last_event_id.partition(".")
+        oldest = self._replay[0].seq if self._replay else self._seq + 1
+        if stream_id == self.stream_id and seq.isdigit() and oldest - 1 <= int(seq) <= self._seq:
+            self._resumed += 1
+            return [
+                event.frame
+                for event in self._replay
+                if event.seq > int(seq) and subscriber.wants(event.category)
+            ]
+        self._resets += 1
+        return [self._frame("reset", b"{}")]
+
+    def stream(
+        self, categories: Optional[List[Category]], last_event_id: Optional[str]
+    ) -> AsyncIterator[bytes]:
+        """
+        Opens a stream of the articles added from now on, or since the event a reconnecting
+        client received last.
+
+        Args:
+            categories (Optional[List[Category]]): Only stream articles of these categories,
+                None for all of them.
+            last_event_id (Optional[str]): The Last-Event-ID header of a reconnecting client.
+
+        Returns:
+            AsyncIterator[bytes]: The event stream, which subscribes when iterated.
+
+        Raises:
+            TooManySubscribersError: If STREAM_MAX_SUBSCRIBERS are already connected.
+        """
+        if len(self._subscribers) >= self.max_subscribers:
+            raise TooManySubscribersError()
+        return self._stream(frozenset(categories) if categories else None, last_event_id)
+
+    async def _stream(
+        self, categories: Optional[FrozenSet[Category]], last_event_id: Optional[str]
+    ) -> AsyncIterator[bytes]:
+        subscriber = Subscriber(categories, self.subscriber_buffer)
+        backlog = self._backlog(subscriber, last_event_id)
+        self._subscribers.add(subscriber)
+        deadline = asyncio.get_running_loop().time() + self.max_duration
+        try:
+            yield RETRY_FRAME
+            for frame in backlog:
+                yield frame
+            while True:
+                frame = await subscriber.queue.get()
+                if frame is None:
+                    return
+                yield frame
+                if subscriber.closed and subscriber.queue.empty():
+                    return
+                if asyncio.get_running_loop().time() >= deadline:
+                    return
+        finally:
+            self._subscribers.discard(subscriber)
+
+    async def _send_heartbeats(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            for subscriber in list(self._subscribers):
+                self._offer(subscriber, HEARTBEAT_FRAME)
+
+    async def _watch_other_workers(self) -> None:
+        # Requests sync the versions as well, this covers workers that only serve streams
+        while True:
+            await asyncio.sleep(STREAM_SYNC_INTERVAL)
+            if self._subscribers:
+                content_versions.sync()
+
+    def stats(self) -> ArticleStreamStats:
+        """
+        Returns a snapshot of the broadcaster counters.
+
+        Returns:
+            ArticleStreamStats: The current stream statistics.
+        """
+        return ArticleStreamStats(
+            subscribers=len(self._subscribers),
+            max_subscribers=self.max_subscribers,
+            replay_events=len(self._replay),
+            published=self._published,
+            dropped=self._dropped,
+            resumed=self._resumed,
+            resets=self._resets,
+        )
+
+
+article_broadcaster = ArticleBroadcaster()
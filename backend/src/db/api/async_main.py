@@ -0,0 +1,416 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Async variants of the functions in main.py, built on the aiomysql pool. They run the same SQL
+statements and return the same types, so the routes in app.py can switch between the two
+implementations via the DB_DRIVER environment variable.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from ..common.async_connection import async_pooled_connection, async_read_connection
+from ..common.instrumentation import aexecute, aexecute_many, afetch_all
+from ..common.routing import GLOBAL_SCOPE
+from ...types import (
+    Article,
+    Category,
+    GetCategoryArticlesPageResult,
+    GetCategoryArticlesResult,
+    SearchArticlesResult,
+)
+from .cache import (
+    articles_cache,
+    category_cursor_key,
+    category_page_key,
+    search_cache,
+    search_key,
+    top_articles_key,
+)
+from .events import article_added, articles_added
+from .main import (
+    LATEST_ARTICLES_DEPTH,
+    PAGE_SIZE,
+    SQL_INCREMENT_CATEGORY_COUNT,
+    SQL_INSERT_ARTICLE,
+    SQL_INSERT_LATEST_ARTICLE,
+    SQL_SELECT_ARTICLE,
+    SQL_SELECT_CATEGORY_TOTAL_PAGES,
+    SQL_SELECT_LATEST_ARTICLE_IDS,
+    SQL_TRIM_LATEST_ARTICLES_CATEGORY,
+    article_to_row,
+    category_articles_query,
+    category_increments,
+    category_page_query,
+    category_page_result,
+    row_to_article,
+    rows_to_articles,
+    search_index_page,
+    search_page_query,
+    search_page_result,
+    top_articles_query,
+    trim_latest_articles_params,
+)
+from .projection import FULL_ARTICLE, Projection
+from .search import SEARCH_BACKEND, normalize_query
+
+
+async def get_top_articles(per_category: int = 1) -> List[Article]:
+    """
+    Retrieves the most recent articles of each category, from the cache if possible.
+
+    Args:
+        per_category (int, optional): The number of articles per category, at most
+            LATEST_ARTICLES_DEPTH. Defaults to 1.
+
+    Returns:
+        List[Article]: A list of Article objects representing the most recent articles of each
+            category.
+    """
+    return await articles_cache.aget_or_load(
+        top_articles_key(per_category), lambda: select_top_articles(per_category)
+    )
+
+
+async def select_top_articles(per_category: int = 1) -> List[Article]:
+    """
+    Retrieves the most recent articles of each category from the database.
+
+    Args:
+        per_category (int, optional): The number of articles per category, at most
+            LATEST_ARTICLES_DEPTH. Defaults to 1.
+
+    Returns:
+        List[Article]: A list of Article objects representing the most recent articles of each
+            category.
+    """
+    return rows_to_articles(await select_top_articles_rows(per_category, FULL_ARTICLE))
+
+
+async def select_top_articles_rows(per_category: int, projection: Projection) -> List[Sequence]:
+    """
+    Selects the projected columns of the most recent articles of each category.
+
+    Args:
+        per_category (int): The number of articles per category.
+        projection (Projection): The article fields to select.
+
+    Returns:
+        List[Sequence]: The rows.
+    """
+    sql, params = top_articles_query(per_category, projection)
+    async with async_read_connection(GLOBAL_SCOPE) as cnx, cnx.cursor() as cursor:
+        return await afetch_all(cursor, sql, params)
+
+
+async def get_projected_top_articles(
+    per_category: int, projection: Projection
+) -> List[Dict[str, Any]]:
+    """
+    Retrieves the projected fields of the most recent articles of each category, from the cache
+    if possible.
+
+    Args:
+        per_category (int): The number of articles per category.
+        projection (Projection): The article fields to return.
+
+    Returns:
+        List[Dict[str, Any]]: The projected articles.
+    """
+
+    async def load() -> List[Dict[str, Any]]:
+        rows = await select_top_articles_rows(per_category, projection)
+        return [projection.to_dict(row) for row in rows]
+
+    return await articles_cache.aget_or_load(top_articles_key(per_category, projection), load)
+
+
+async def get_category_articles(category: Category, page: int) -> GetCategoryArticlesResult:
+    """
+    Retrieves a page of articles for a given category, from the cache if possible.
+
+    Args:
+        category (str): The category for which to retrieve articles.
+        page (int): The 1-based page number.
+
+    Returns:
+       GetCategoryArticlesResult: The result including the list of articles as well as the total
+            number of pages in this category
+    """
+    return await articles_cache.aget_or_load(
+        category_page_key(category, page), lambda: select_category_articles(category, page)
+    )
+
+
+async def select_category_articles(
+    category: Category, page: int
+) -> GetCategoryArticlesResult:
+    """
+    Retrieves all articles for a given category from the database, ordered by date in descending
+    order.
+
+    Args:
+        category (str): The category for which to retrieve articles.
+        page (int): The 1-based page number.
+
+    Returns:
+       GetCategoryArticlesResult: The result including the list of articles as well as the total
+            number of pages in this category
+    """
+    rows, total_pages = await select_category_articles_rows(category, page, FULL_ARTICLE)
+    return GetCategoryArticlesResult.model_construct(
+        articles=rows_to_articles(rows), total_pages=total_pages
+    )
+
+
+async def select_category_articles_rows(
+    category: Category, page: int, projection: Projection
+) -> Tuple[List[Sequence], int]:
+    """
+    Selects the projected columns of a page of articles of a category and the total number of
+    pages in the category.
+
+    Args:
+        category (Category): The category for which to retrieve articles.
+        page (int): The 1-based page number.
+        projection (Projection): The article fields to select.
+
+    Returns:
+        Tuple[List[Sequence], int]: The rows and the total number of pages.
+    """
+    sql, params = category_articles_query(category, page, projection)
+    async with async_read_connection(category) as cnx, cnx.cursor() as cursor:
+        rows = await afetch_all(cursor, sql, params)
+
+        if rows:
+            total_pages = rows[0][len(projection.fields)]
+        else:
+            # Pages past the end carry no rows to read the page count from
+            total_pages = (
+                await afetch_all(cursor, SQL_SELECT_CATEGORY_TOTAL_PAGES, (PAGE_SIZE, category))
+            )[0][0]
+
+    # CEILING() returns a DECIMAL
+    return rows, int(total_pages)
+
+
+async def get_projected_category_articles(
+    category: Category, page: int, projection: Projection
+) -> Dict[str, Any]:
+    """
+    Retrieves the projected fields of a page of articles of a category, from the cache if
+    possible.
+
+    Args:
+        category (Category): The category for which to retrieve articles.
+        page (int): The 1-based page number.
+        projection (Projection): The article fields to return.
+
+    Returns:
+        Dict[str, Any]: The projected articles and the total number of pages, shaped like
+            GetCategoryArticlesResult.
+    """
+
+    async def load() -> Dict[str, Any]:
+        rows, total_pages = await select_category_articles_rows(category, page, projection)
+        return {
+            "articles": [projection.to_dict(row) for row in rows],
+            "total_pages": total_pages,
+        }
+
+    return await articles_cache.aget_or_load(
+        category_page_key(category, page, projection), load
+    )
+
+
+async def get_article(article_id: int) -> Optional[Article]:
+    """
+    Retrieves a single article with its full text.
+
+    Args:
+        article_id (int): The id of the article.
+
+    Returns:
+        Optional[Article]: The article, None if there is no article with that id.
+    """
+    async with async_read_connection(GLOBAL_SCOPE) as cnx, cnx.cursor() as cursor:
+        rows = await afetch_all(cursor, SQL_SELECT_ARTICLE, (article_id,))
+    return row_to_article(rows[0]) if rows else None
+
+
+async def get_category_articles_page(
+    category: Category, cursor: Optional[str] = None
+) -> GetCategoryArticlesPageResult:
+    """
+    Retrieves a page of articles for a given category using keyset pagination, from the cache
+    if possible.
+
+    Args:
+        category (Category): The category for which to retrieve articles.
+        cursor (Optional[str], optional): The next_cursor of the previous page, or None for the
+            first page. Defaults to None.
+
+    Returns:
+        GetCategoryArticlesPageResult: The articles of the page and the cursor of the next page.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    sql, params = category_page_query(category, cursor)
+    return await articles_cache.aget_or_load(
+        category_cursor_key(category, cursor),
+        lambda: select_category_articles_page(category, sql, params),
+    )
+
+
+async def select_category_articles_page(
+    category: Category, sql: str, params: Tuple
+) -> GetCategoryArticlesPageResult:
+    """
+    Runs a keyset pagination statement built by category_page_query().
+
+    Args:
+        category (Category): The category the statement reads from.
+        sql (str): The SQL statement.
+        params (Tuple): The statement parameters.
+
+    Returns:
+        GetCategoryArticlesPageResult: The articles of the page and the cursor of the next page.
+    """
+    async with async_read_connection(category) as cnx, cnx.cursor() as cursor:
+        return category_page_result(await afetch_all(cursor, sql, params))
+
+
+async def search_articles(
+    query: str, category: Optional[Category] = None, cursor: Optional[str] = None
+) -> SearchArticlesResult:
+    """
+    Searches the title and text of the articles, from the cache if possible.
+
+    The in-memory search index is queried on a worker thread, it is loaded through the sync
+    connection pool.
+
+    Args:
+        query (str): The search query.
+        category (Optional[Category], optional): The category to restrict the search to.
+            Defaults to None.
+        cursor (Optional[str], optional): The next_cursor of the previous page, or None for the
+            first page. Defaults to None.
+
+    Returns:
+        SearchArticlesResult: The matching articles, most relevant first, and the cursor of the
+            next page.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    query = normalize_query(query)
+    if SEARCH_BACKEND == "memory":
+        return await search_cache.aget_or_load(
+            search_key(query, category, cursor),
+            lambda: asyncio.to_thread(search_index_page, query, category, cursor),
+        )
+    sql, params = search_page_query(query, category, cursor)
+    return await search_cache.aget_or_load(
+        search_key(query, category, cursor),
+        lambda: select_search_articles(category, sql, params),
+    )
+
+
+async def select_search_articles(
+    category: Optional[Category], sql: str, params: Tuple
+) -> SearchArticlesResult:
+    """
+    Runs a full-text search statement built by search_page_query().
+
+    Args:
+        category (Optional[Category]): The category the search is restricted to, if any.
+        sql (str): The SQL statement.
+        params (Tuple): The statement parameters.
+
+    Returns:
+        SearchArticlesResult: The matching articles and the cursor of the next page.
+    """
+    async with async_read_connection(category or GLOBAL_SCOPE) as cnx, cnx.cursor() as cursor:
+        return search_page_result(await afetch_all(cursor, sql, params))
+
+
+async def add_article(article: Article) -> None:
+    """
+    Adds a new article to the database. The article count and the latest articles of its
+    category are updated in the same transaction.
+
+    Args:
+        article (Article): The Article object representing the new article to be added.
+    """
+    async with async_pooled_connection() as cnx, cnx.cursor() as cursor:
+        await cnx.begin()
+        try:
+            # The article count first, see add_article() in main.py
+            await aexecute(cursor, SQL_INCREMENT_CATEGORY_COUNT, (1, article.category))
+            await aexecute(cursor, SQL_INSERT_ARTICLE, article_to_row(article))
+            await aexecute(
+                cursor, SQL_INSERT_LATEST_ARTICLE, (article.category, cursor.lastrowid)
+            )
+            await aexecute(
+                cursor,
+                SQL_TRIM_LATEST_ARTICLES_CATEGORY,
+                trim_latest_articles_params(article.category),
+            )
+            await cnx.commit()
+        except BaseException:
+            await cnx.rollback()
+            raise
+    article_added(article)
+
+
+async def add_articles(articles: Sequence[Article]) -> None:
+    """
+    Adds a batch of articles to the database in a single transaction.
+
+    Args:
+        articles (Sequence[Article]): The Article objects to be added.
+    """
+    if not articles:
+        return
+    async with async_pooled_connection() as cnx, cnx.cursor() as cursor:
+        await cnx.begin()
+        try:
+            for increment in category_increments(articles):
+                await aexecute(cursor, SQL_INCREMENT_CATEGORY_COUNT, increment)
+            await aexecute_many(
+                cursor, SQL_INSERT_ARTICLE, [article_to_row(article) for article in articles]
+            )
+            # The newest ids by a non-locking read, see add_articles() in main.py
+            for category in sorted({article.category for article in articles}):
+                rows = await afetch_all(
+                    cursor, SQL_SELECT_LATEST_ARTICLE_IDS, (category, LATEST_ARTICLES_DEPTH)
+                )
+                await aexecute_many(
+                    cursor, SQL_INSERT_LATEST_ARTICLE, [(category, row[0]) for row in rows]
+                )
+                await aexecute(
+                    cursor,
+                    SQL_TRIM_LATEST_ARTICLES_CATEGORY,
+                    trim_latest_articles_params(category),
+                )
+            await cnx.commit()
+        except BaseException:
+            await cnx.rollback()
+            raise
+    articles_added(articles)
@@ -0,0 +1,136 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+The caches in front of the article read functions and their invalidation on writes.
+
+Search results live in a cache of their own, so a stream of distinct queries only evicts other
+search results and never the top stories and category pages.
+
+The caches are per process. The workers of python -m src.serve drop their entries of a category
+as soon as they see its shared content version move. Other tasks serving the same database only
+see a new article once their entries expire, so ARTICLES_CACHE_TTL and SEARCH_CACHE_TTL bound
+how stale a page can get.
+"""
+
+import os
+from typing import Hashable, Optional, Tuple
+from ..common.cache import TTLCache
+from ...types import Category
+from .projection import Projection
+
+ARTICLES_CACHE_MAX_ENTRIES = int(os.environ.get("ARTICLES_CACHE_MAX_ENTRIES", "1024"))
+ARTICLES_CACHE_TTL = float(os.environ.get("ARTICLES_CACHE_TTL", "30"))
+
+SEARCH_CACHE_MAX_ENTRIES = int(os.environ.get("SEARCH_CACHE_MAX_ENTRIES", "256"))
+SEARCH_CACHE_TTL = float(os.environ.get("SEARCH_CACHE_TTL", str(ARTICLES_CACHE_TTL)))
+
+articles_cache = TTLCache(max_entries=ARTICLES_CACHE_MAX_ENTRIES, ttl=ARTICLES_CACHE_TTL)
+search_cache = TTLCache(max_entries=SEARCH_CACHE_MAX_ENTRIES, ttl=SEARCH_CACHE_TTL)
+
+
+def top_articles_key(per_category: int, projection: Optional[Projection] = None) -> Tuple:
+    """
+    Returns the cache key of the top articles.
+
+    Args:
+        per_category (int): The number of articles per category.
+        projection (Optional[Projection], optional): The projected fields, None for full
+            Articles. Defaults to None.
+
+    Returns:
+        Tuple: The cache key.
+    """
+    if projection is None:
+        return ("top", per_category)
+    return ("top", per_category, projection.key)
+
+
+def category_page_key(
+    category: Category, page: int, projection: Optional[Projection] = None
+) -> Tuple:
+    """
+    Returns the cache key of a category page.
+
+    Args:
+        category (Category): The category of the page.
+        page (int): The 1-based page number.
+        projection (Optional[Projection], optional): The projected fields, None for full
+            Articles. Defaults to None.
+
+    Returns:
+        Tuple: The cache key.
+    """
+    if projection is None:
+        return ("category", category, page)
+    return ("category", category, page, projection.key)
+
+
+def category_cursor_key(
+    category: Category, cursor: Optional[str]
+) -> Tuple[str, Category, str, Optional[str]]:
+    """
+    Returns the cache key of a keyset paginated category page.
+
+    Args:
+        category (Category): The category of the page.
+        cursor (Optional[str]): The cursor of the page, or None for the first page.
+
+    Returns:
+        Tuple[str, Category, str, Optional[str]]: The cache key.
+    """
+    return ("category", category, "cursor", cursor)
+
+
+def search_key(
+    query: str, category: Optional[Category], cursor: Optional[str]
+) -> Tuple[str, str, str, Optional[str]]:
+    """
+    Returns the search_cache key of a page of search results.
+
+    Args:
+        query (str): The normalized search query.
+        category (Optional[Category]): The category the search is restricted to, if any.
+        cursor (Optional[str]): The cursor of the page, or None for the first page.
+
+    Returns:
+        Tuple[str, str, str, Optional[str]]: The cache key.
+    """
+    return ("search", category or "*", query, cursor)
+
+
+def invalidate_category(category: Category) -> int:
+    """
+    Removes the cached top articles, all cached pages of a category and the search results that
+    may include it after a write to it.
+
+    Args:
+        category (Category): The category an article was added to.
+
+    Returns:
+        int: The number of removed entries.
+    """
+
+    def is_affected(key: Hashable) -> bool:
+        if key[0] == "top":
+            return True
+        return key[0] == "category" and key[1] == category
+
+    return articles_cache.invalidate(is_affected) + search_cache.invalidate(
+        lambda key: key[1] in (category, "*")
+    )
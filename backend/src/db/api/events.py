@@ -0,0 +1,100 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Notifications about writes to the articles table.
+
+add_article() and add_articles() in main.py and async_main.py call article_added() or
+articles_added() after their transaction committed. The derived state kept in the process
+(read routing, cached pages, content versions) is updated here, and further listeners can
+subscribe via add_article_listener(). When the content versions report a write made by another
+worker process, the read routing and cached pages of the category are updated the same way.
+"""
+
+import logging
+from typing import Callable, List, Sequence
+from ..common.routing import read_router
+from ...types import Article, Category
+from .cache import invalidate_category
+from .versions import content_versions
+
+logger = logging.getLogger(__name__)
+
+ArticleListener = Callable[[Article], None]
+
+_listeners: List[ArticleListener] = []
+
+
+def add_article_listener(listener: ArticleListener) -> None:
+    """
+    Registers a function to call for every committed article.
+
+    Listeners run on the writing thread or event loop and must not block.
+
+    Args:
+        listener (ArticleListener): The function to call with the added article.
+    """
+    _listeners.append(listener)
+
+
+def article_added(article: Article) -> None:
+    """
+    Updates the derived state after an article was committed.
+
+    Args:
+        article (Article): The article that was added.
+    """
+    articles_added([article])
+
+
+def articles_added(articles: Sequence[Article]) -> None:
+    """
+    Updates the derived state after a batch of articles was committed.
+
+    Reads of the category are pinned to the writer before the cache is invalidated, so the
+    cache is not refilled from a reader that has not caught up yet. The cache is invalidated
+    before the version is bumped, so a request that sees the new version never gets served a
+    cached page from before the write.
+
+    Args:
+        articles (Sequence[Article]): The articles that were added.
+    """
+    for category in sorted({article.category for article in articles}):
+        read_router.record_write(category)
+        invalidate_category(category)
+        content_versions.bump(category)
+    for article in articles:
+        for listener in _listeners:
+            try:
+                listener(article)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.exception("Article listener failed: %s", str(e))
+
+
+def category_changed_elsewhere(category: Category) -> None:
+    """
+    Updates the derived state after another worker process committed articles to a category.
+
+    Args:
+        category (Category): The category that changed.
+    """
+    read_router.record_write(category)
+    invalidate_category(category)
+
+
+content_versions.add_change_listener(category_changed_elsewhere)
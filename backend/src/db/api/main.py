@@ -17,127 +17,683 @@ IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+from collections import Counter
 import os
-from typing import Dict, List
-from ..common.connection import connect_to_mysql
-from ..common.file import read_text_file
-from ...types import Article, Category, GetCategoryArticlesResult
-
-PAGE_SIZE = 5
-
-SQL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sql")
-SQL_SELECT_TOP_ARTICLES = read_text_file(
-    path=os.path.join(SQL_PATH, "select_top_articles.sql")
-)
-SQL_SELECT_CATEGORY_ARTICLES = read_text_file(
-    path=os.path.join(SQL_PATH, "select_category_articles.sql")
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from ..common.connection import pooled_connection, read_connection
+from ..common.instrumentation import execute, execute_many, fetch_all
+from ..common.routing import GLOBAL_SCOPE
+from ..common.statements import api_statements, statement_cursor
+from ...profiling import CONVERT, span
+from ...types import (
+    Article,
+    Category,
+    GetCategoryArticlesPageResult,
+    GetCategoryArticlesResult,
+    SearchArticlesResult,
 )
-SQL_SELECT_CATEGORY_TOTAL_PAGES = read_text_file(
-    path=os.path.join(SQL_PATH, "select_category_total_pages.sql")
+from .cache import (
+    articles_cache,
+    category_cursor_key,
+    category_page_key,
+    search_cache,
+    search_key,
+    top_articles_key,
 )
-SQL_INSERT_ARTICLE = read_text_file(
-    path=os.path.join(SQL_PATH, "insert_article.sql")
+from .events import add_article_listener, article_added, articles_added
+from .pagination import (
+    decode_cursor,
+    decode_search_cursor,
+    encode_cursor,
+    encode_search_cursor,
 )
+from .projection import FULL_ARTICLE, Projection
+from .search import SEARCH_BACKEND, SEARCH_PAGE_SIZE, InvertedIndex, normalize_query
+
+PAGE_SIZE = 5
+
+# The number of newest articles per category kept in the 'latest_articles' table, which bounds
+# the number of top articles per category that can be requested
+LATEST_ARTICLES_DEPTH = int(os.environ.get("LATEST_ARTICLES_DEPTH", "5"))
+
+SQL_SELECT_ARTICLE = api_statements["select_article.sql"]
+SQL_SELECT_CATEGORY_ARTICLES_FIRST = api_statements["select_category_articles_first.sql"]
+SQL_SELECT_CATEGORY_ARTICLES_AFTER = api_statements["select_category_articles_after.sql"]
+SQL_SELECT_CATEGORY_TOTAL_PAGES = api_statements["select_category_total_pages.sql"]
+SQL_INSERT_ARTICLE = api_statements["insert_article.sql"]
+SQL_INCREMENT_CATEGORY_COUNT = api_statements["increment_category_count.sql"]
+SQL_INSERT_LATEST_ARTICLE = api_statements["insert_latest_article.sql"]
+SQL_SELECT_LATEST_ARTICLE_IDS = api_statements["select_latest_article_ids.sql"]
+SQL_TRIM_LATEST_ARTICLES_CATEGORY = api_statements["trim_latest_articles_category.sql"]
+SQL_SEARCH_ARTICLES_FIRST = api_statements["search_articles_first.sql"]
+SQL_SEARCH_ARTICLES_AFTER = api_statements["search_articles_after.sql"]
+SQL_SELECT_ALL_ARTICLES = api_statements["select_all_articles.sql"]
+
+_search_index: Optional[InvertedIndex] = None
+_search_index_lock = threading.Lock()
+
+
+def row_to_article(row: Sequence) -> Article:
+    """
+    Converts a row of the article select statements into an Article.
+
+    The rows were validated by the Article model when they were written and the driver already
+    returns them with the right Python types, so the Article is built without validating it
+    again.
+
+    Args:
+        row (Sequence): The row as returned by the cursor, in the column order of
+            select_top_articles.sql and select_category_articles.sql.
 
+    Returns:
+        Article: The article represented by the row.
+    """
+    return Article.model_construct(
+        title=row[0],
+        date=row[1],
+        author=row[2],
+        text=row[3],
+        agency=row[4],
+        category=row[5],
+        user_submitted=row[6],
+    )
 
-def get_top_articles() -> List[Article]:
+
+def rows_to_articles(rows: Sequence[Sequence]) -> List[Article]:
     """
-    Retrieves the most recent article for each category from the database.
+    Converts the rows of an article select statement into Articles, see row_to_article().
+
+    Args:
+        rows (Sequence[Sequence]): The rows as returned by the cursor.
 
     Returns:
-        List[Article]: A list of Article objects representing the most recent article for each
+        List[Article]: The articles represented by the rows.
+    """
+    with span(CONVERT):
+        return [row_to_article(row) for row in rows]
+
+
+def article_to_row(article: Article) -> Tuple:
+    """
+    Converts an Article into the parameters of insert_article.sql.
+
+    Args:
+        article (Article): The article to convert.
+
+    Returns:
+        Tuple: The insert parameters.
+    """
+    return (
+        article.title,
+        article.date,
+        article.author,
+        article.text,
+        article.agency,
+        article.category,
+        article.user_submitted,
+    )
+
+
+def get_top_articles(per_category: int = 1) -> List[Article]:
+    """
+    Retrieves the most recent articles of each category, from the cache if possible.
+
+    Args:
+        per_category (int, optional): The number of articles per category, at most
+            LATEST_ARTICLES_DEPTH. Defaults to 1.
+
+    Returns:
+        List[Article]: A list of Article objects representing the most recent articles of each
             category.
     """
-    cnx = connect_to_mysql(attempts=3)
-    with cnx.cursor() as cursor:
-        cursor.execute(SQL_SELECT_TOP_ARTICLES)
-        articles = cursor.fetchall()
-        return [
-            Article(
-                **{
-                    "title": article[0],
-                    "date": article[1],
-                    "author": article[2],
-                    "text": article[3],
-                    "agency": article[4],
-                    "category": article[5],
-                    "user_submitted": article[6],
-                }
-            )
-            for article in articles
-        ]
+    return articles_cache.get_or_load(
+        top_articles_key(per_category), lambda: select_top_articles(per_category)
+    )
 
 
-def get_category_articles(category: Category, page: int) -> Dict:
+def select_top_articles(per_category: int = 1) -> List[Article]:
+    """
+    Retrieves the most recent articles of each category from the database.
+
+    The articles are looked up by primary key from the 'latest_articles' table, so the cost
+    depends on the number of categories rather than the size of the 'articles' table.
+
+    Args:
+        per_category (int, optional): The number of articles per category, at most
+            LATEST_ARTICLES_DEPTH. Defaults to 1.
+
+    Returns:
+        List[Article]: A list of Article objects representing the most recent articles of each
+            category.
+    """
+    return rows_to_articles(select_top_articles_rows(per_category, FULL_ARTICLE))
+
+
+def top_articles_query(per_category: int, projection: Projection) -> Tuple[str, Tuple]:
+    """
+    Returns the top articles statement for a projection and its parameters.
+
+    Args:
+        per_category (int): The number of articles per category.
+        projection (Projection): The article fields to select.
+
+    Returns:
+        Tuple[str, Tuple]: The SQL statement and its parameters.
+    """
+    sql = api_statements.render("select_top_articles.sql", columns=projection.columns)
+    return sql, projection.params + (per_category,)
+
+
+def select_top_articles_rows(per_category: int, projection: Projection) -> List[Sequence]:
+    """
+    Selects the projected columns of the most recent articles of each category.
+
+    Args:
+        per_category (int): The number of articles per category.
+        projection (Projection): The article fields to select.
+
+    Returns:
+        List[Sequence]: The rows.
+    """
+    sql, params = top_articles_query(per_category, projection)
+    with read_connection(GLOBAL_SCOPE) as cnx, statement_cursor(cnx, sql) as cursor:
+        return fetch_all(cursor, sql, params)
+
+
+def get_projected_top_articles(
+    per_category: int, projection: Projection
+) -> List[Dict[str, Any]]:
+    """
+    Retrieves the projected fields of the most recent articles of each category, from the cache
+    if possible.
+
+    Args:
+        per_category (int): The number of articles per category.
+        projection (Projection): The article fields to return.
+
+    Returns:
+        List[Dict[str, Any]]: The projected articles.
+    """
+    return articles_cache.get_or_load(
+        top_articles_key(per_category, projection),
+        lambda: [
+            projection.to_dict(row) for row in select_top_articles_rows(per_category, projection)
+        ],
+    )
+
+
+def get_category_articles(category: Category, page: int) -> GetCategoryArticlesResult:
+    """
+    Retrieves a page of articles for a given category, from the cache if possible.
+
+    Args:
+        category (str): The category for which to retrieve articles.
+        page (int): The 1-based page number.
+
+    Returns:
+       GetCategoryArticlesResult: The result including the list of articles as well as the total
+            number of pages in this category
+    """
+    return articles_cache.get_or_load(
+        category_page_key(category, page), lambda: select_category_articles(category, page)
+    )
+
+
+def select_category_articles(category: Category, page: int) -> GetCategoryArticlesResult:
     """
     Retrieves all articles for a given category from the database, ordered by date in descending
     order.
 
+    The total number of pages is read from the maintained 'categories.article_count' counter
+    within the same query, so a page costs a single round-trip.
+
     Args:
         category (str): The category for which to retrieve articles.
+        page (int): The 1-based page number.
 
     Returns:
        GetCategoryArticlesResult: The result including the list of articles as well as the total
             number of pages in this category
     """
-    cnx = connect_to_mysql(attempts=3)
+    rows, total_pages = select_category_articles_rows(category, page, FULL_ARTICLE)
+    return GetCategoryArticlesResult.model_construct(
+        articles=rows_to_articles(rows), total_pages=total_pages
+    )
+
+
+def category_articles_query(
+    category: Category, page: int, projection: Projection
+) -> Tuple[str, Tuple]:
+    """
+    Returns the category page statement for a projection and its parameters.
+
+    Args:
+        category (Category): The category for which to retrieve articles.
+        page (int): The 1-based page number.
+        projection (Projection): The article fields to select.
+
+    Returns:
+        Tuple[str, Tuple]: The SQL statement and its parameters.
+    """
+    sql = api_statements.render("select_category_articles.sql", columns=projection.columns)
+    return sql, projection.params + (PAGE_SIZE, category, PAGE_SIZE, (page - 1) * PAGE_SIZE)
+
+
+def select_category_articles_rows(
+    category: Category, page: int, projection: Projection
+) -> Tuple[List[Sequence], int]:
+    """
+    Selects the projected columns of a page of articles of a category and the total number of
+    pages in the category.
+
+    Args:
+        category (Category): The category for which to retrieve articles.
+        page (int): The 1-based page number.
+        projection (Projection): The article fields to select.
 
-    articles_list: List[Article] = []
-    total_pages = 0
+    Returns:
+        Tuple[List[Sequence], int]: The rows and the total number of pages.
+    """
+    sql, params = category_articles_query(category, page, projection)
+    with read_connection(category) as cnx:
+        with statement_cursor(cnx, sql) as cursor:
+            rows = fetch_all(cursor, sql, params)
+
+        if rows:
+            total_pages = rows[0][len(projection.fields)]
+        else:
+            # Pages past the end carry no rows to read the page count from
+            with statement_cursor(cnx, SQL_SELECT_CATEGORY_TOTAL_PAGES) as cursor:
+                total_pages = fetch_all(
+                    cursor, SQL_SELECT_CATEGORY_TOTAL_PAGES, (PAGE_SIZE, category)
+                )[0][0]
+
+    # CEILING() returns a DECIMAL
+    return rows, int(total_pages)
+
+
+def get_projected_category_articles(
+    category: Category, page: int, projection: Projection
+) -> Dict[str, Any]:
+    """
+    Retrieves the projected fields of a page of articles of a category, from the cache if
+    possible.
 
-    with cnx.cursor() as cursor:
-        cursor.execute(
-            SQL_SELECT_CATEGORY_ARTICLES, (category, PAGE_SIZE, (page - 1) * PAGE_SIZE)
+    Args:
+        category (Category): The category for which to retrieve articles.
+        page (int): The 1-based page number.
+        projection (Projection): The article fields to return.
+
+    Returns:
+        Dict[str, Any]: The projected articles and the total number of pages, shaped like
+            GetCategoryArticlesResult.
+    """
+
+    def load() -> Dict[str, Any]:
+        rows, total_pages = select_category_articles_rows(category, page, projection)
+        return {
+            "articles": [projection.to_dict(row) for row in rows],
+            "total_pages": total_pages,
+        }
+
+    return articles_cache.get_or_load(category_page_key(category, page, projection), load)
+
+
+def get_article(article_id: int) -> Optional[Article]:
+    """
+    Retrieves a single article with its full text.
+
+    Args:
+        article_id (int): The id of the article.
+
+    Returns:
+        Optional[Article]: The article, None if there is no article with that id.
+    """
+    with read_connection(GLOBAL_SCOPE) as cnx, statement_cursor(
+        cnx, SQL_SELECT_ARTICLE
+    ) as cursor:
+        rows = fetch_all(cursor, SQL_SELECT_ARTICLE, (article_id,))
+    return row_to_article(rows[0]) if rows else None
+
+
+def category_page_query(
+    category: Category, cursor: Optional[str]
+) -> Tuple[str, Tuple]:
+    """
+    Returns the keyset pagination statement and its parameters for a page of a category.
+
+    One row more than PAGE_SIZE is requested to find out whether there is a next page.
+
+    Args:
+        category (Category): The category for which to retrieve articles.
+        cursor (Optional[str]): The cursor of the page, or None for the first page.
+
+    Returns:
+        Tuple[str, Tuple]: The SQL statement and its parameters.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    if cursor is None:
+        return SQL_SELECT_CATEGORY_ARTICLES_FIRST, (category, PAGE_SIZE + 1)
+    date, article_id = decode_cursor(cursor)
+    return SQL_SELECT_CATEGORY_ARTICLES_AFTER, (
+        category,
+        date,
+        date,
+        article_id,
+        PAGE_SIZE + 1,
+    )
+
+
+def category_page_result(rows: Sequence[Sequence]) -> GetCategoryArticlesPageResult:
+    """
+    Converts the rows of a keyset pagination statement into a page result.
+
+    Args:
+        rows (Sequence[Sequence]): The rows, including the look-ahead row.
+
+    Returns:
+        GetCategoryArticlesPageResult: The articles of the page and the cursor of the next page.
+    """
+    page_rows = rows[:PAGE_SIZE]
+    next_cursor = None
+    if len(rows) > PAGE_SIZE:
+        last = page_rows[-1]
+        next_cursor = encode_cursor(last[1], last[7])
+    return GetCategoryArticlesPageResult.model_construct(
+        articles=rows_to_articles(page_rows), next_cursor=next_cursor
+    )
+
+
+def get_category_articles_page(
+    category: Category, cursor: Optional[str] = None
+) -> GetCategoryArticlesPageResult:
+    """
+    Retrieves a page of articles for a given category using keyset pagination, from the cache
+    if possible.
+
+    In contrast to get_category_articles(), the cost of a page does not grow with its depth.
+
+    Args:
+        category (Category): The category for which to retrieve articles.
+        cursor (Optional[str], optional): The next_cursor of the previous page, or None for the
+            first page. Defaults to None.
+
+    Returns:
+        GetCategoryArticlesPageResult: The articles of the page and the cursor of the next page.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    sql, params = category_page_query(category, cursor)
+    return articles_cache.get_or_load(
+        category_cursor_key(category, cursor),
+        lambda: select_category_articles_page(category, sql, params),
+    )
+
+
+def select_category_articles_page(
+    category: Category, sql: str, params: Tuple
+) -> GetCategoryArticlesPageResult:
+    """
+    Runs a keyset pagination statement built by category_page_query().
+
+    Args:
+        category (Category): The category the statement reads from.
+        sql (str): The SQL statement.
+        params (Tuple): The statement parameters.
+
+    Returns:
+        GetCategoryArticlesPageResult: The articles of the page and the cursor of the next page.
+    """
+    with read_connection(category) as cnx, statement_cursor(cnx, sql) as cursor:
+        return category_page_result(fetch_all(cursor, sql, params))
+
+
+def search_page_query(
+    query: str, category: Optional[Category], cursor: Optional[str]
+) -> Tuple[str, Tuple]:
+    """
+    Returns the full-text search statement and its parameters for a page of search results.
+
+    One row more than SEARCH_PAGE_SIZE is requested to find out whether there is a next page.
+
+    Args:
+        query (str): The normalized search query.
+        category (Optional[Category]): The category to restrict the search to, if any.
+        cursor (Optional[str]): The cursor of the page, or None for the first page.
+
+    Returns:
+        Tuple[str, Tuple]: The SQL statement and its parameters.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    if cursor is None:
+        return SQL_SEARCH_ARTICLES_FIRST, (
+            query,
+            query,
+            category,
+            category,
+            SEARCH_PAGE_SIZE + 1,
         )
-        query_result = cursor.fetchall()
-        articles_list = [
-            Article(
-                **{
-                    "title": article[0],
-                    "date": article[1],
-                    "author": article[2],
-                    "text": article[3],
-                    "agency": article[4],
-                    "category": article[5],
-                    "user_submitted": article[6],
-                }
-            )
-            for article in query_result
-        ]
-
-    with cnx.cursor() as cursor:
-        cursor.execute(
-            SQL_SELECT_CATEGORY_TOTAL_PAGES,
-            (
-                PAGE_SIZE,
-                category,
-            ),
+    score, article_id = decode_search_cursor(cursor)
+    return SQL_SEARCH_ARTICLES_AFTER, (
+        query,
+        query,
+        category,
+        category,
+        score,
+        score,
+        article_id,
+        SEARCH_PAGE_SIZE + 1,
+    )
+
+
+def search_page_result(rows: Sequence[Sequence]) -> SearchArticlesResult:
+    """
+    Converts the rows of a search statement into a page of search results.
+
+    Args:
+        rows (Sequence[Sequence]): The rows, including the look-ahead row.
+
+    Returns:
+        SearchArticlesResult: The matching articles and the cursor of the next page.
+    """
+    page_rows = rows[:SEARCH_PAGE_SIZE]
+    next_cursor = None
+    if len(rows) > SEARCH_PAGE_SIZE:
+        last = page_rows[-1]
+        next_cursor = encode_search_cursor(last[8], last[7])
+    return SearchArticlesResult.model_construct(
+        articles=rows_to_articles(page_rows), next_cursor=next_cursor
+    )
+
+
+def get_search_index() -> InvertedIndex:
+    """
+    Returns the in-memory search index, loading it from the articles table on first use.
+
+    Articles added afterwards are indexed via the article events. Articles written by other
+    processes, or committed while the index is loading, are not picked up until a restart.
+
+    Returns:
+        InvertedIndex: The index of all articles.
+    """
+    global _search_index  # pylint: disable=global-statement
+    if _search_index is None:
+        with _search_index_lock:
+            if _search_index is None:
+                index = InvertedIndex()
+                with read_connection(GLOBAL_SCOPE) as cnx, cnx.cursor() as cursor:
+                    execute(cursor, SQL_SELECT_ALL_ARTICLES)
+                    while rows := cursor.fetchmany(1000):
+                        for row in rows:
+                            index.add(row)
+                add_article_listener(
+                    lambda article: index.add_without_id(article_to_row(article))
+                )
+                _search_index = index
+    return _search_index
+
+
+def search_index_page(
+    query: str, category: Optional[Category], cursor: Optional[str]
+) -> SearchArticlesResult:
+    """
+    Answers a search from the in-memory search index.
+
+    Args:
+        query (str): The normalized search query.
+        category (Optional[Category]): The category to restrict the search to, if any.
+        cursor (Optional[str]): The cursor of the page, or None for the first page.
+
+    Returns:
+        SearchArticlesResult: The matching articles and the cursor of the next page.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    after = decode_search_cursor(cursor) if cursor is not None else None
+    rows = get_search_index().search(query, category, after, SEARCH_PAGE_SIZE + 1)
+    return search_page_result(rows)
+
+
+def search_articles(
+    query: str, category: Optional[Category] = None, cursor: Optional[str] = None
+) -> SearchArticlesResult:
+    """
+    Searches the title and text of the articles, from the cache if possible.
+
+    Args:
+        query (str): The search query.
+        category (Optional[Category], optional): The category to restrict the search to.
+            Defaults to None.
+        cursor (Optional[str], optional): The next_cursor of the previous page, or None for the
+            first page. Defaults to None.
+
+    Returns:
+        SearchArticlesResult: The matching articles, most relevant first, and the cursor of the
+            next page.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    query = normalize_query(query)
+    if SEARCH_BACKEND == "memory":
+        return search_cache.get_or_load(
+            search_key(query, category, cursor),
+            lambda: search_index_page(query, category, cursor),
         )
-        query_result = cursor.fetchone()
-        total_pages = query_result[0]
+    sql, params = search_page_query(query, category, cursor)
+    return search_cache.get_or_load(
+        search_key(query, category, cursor),
+        lambda: select_search_articles(category, sql, params),
+    )
 
-    return GetCategoryArticlesResult(articles=articles_list, total_pages=total_pages)
+
+def select_search_articles(
+    category: Optional[Category], sql: str, params: Tuple
+) -> SearchArticlesResult:
+    """
+    Runs a full-text search statement built by search_page_query().
+
+    Args:
+        category (Optional[Category]): The category the search is restricted to, if any.
+        sql (str): The SQL statement.
+        params (Tuple): The statement parameters.
+
+    Returns:
+        SearchArticlesResult: The matching articles and the cursor of the next page.
+    """
+    with read_connection(category or GLOBAL_SCOPE) as cnx, statement_cursor(cnx, sql) as cursor:
+        return search_page_result(fetch_all(cursor, sql, params))
 
 
 def add_article(article: Article) -> None:
     """
-    Adds a new article to the database.
+    Adds a new article to the database. The article count and the latest articles of its
+    category are updated in the same transaction.
+
+    The article count is updated first. Its exclusive lock on the category row serializes
+    writers of the category before the INSERT takes a shared lock on the same row through the
+    foreign key, which would otherwise let two writers deadlock upgrading their shared locks.
 
     Args:
         article (Article): The Article object representing the new article to be added.
     """
-    cnx = connect_to_mysql(attempts=3)
-    with cnx.cursor() as cursor:
-        cursor.execute(
-            SQL_INSERT_ARTICLE,
-            (
-                article.title,
-                article.date,
-                article.author,
-                article.text,
-                article.agency,
-                article.category,
-                article.user_submitted,
-            ),
+    with pooled_connection() as cnx, cnx.cursor() as cursor:
+        execute(cursor, SQL_INCREMENT_CATEGORY_COUNT, (1, article.category))
+        execute(cursor, SQL_INSERT_ARTICLE, article_to_row(article))
+        # From the new id rather than by re-reading the newest articles, which would lock them
+        execute(cursor, SQL_INSERT_LATEST_ARTICLE, (article.category, cursor.lastrowid))
+        execute(
+            cursor, SQL_TRIM_LATEST_ARTICLES_CATEGORY, trim_latest_articles_params(article.category)
         )
         cnx.commit()
+    article_added(article)
+
+
+def trim_latest_articles_params(category: Category) -> Tuple[Category, Category, int]:
+    """
+    Returns the parameters of trim_latest_articles_category.sql, which drops the rows of a
+    category beyond the newest LATEST_ARTICLES_DEPTH.
+
+    Args:
+        category (Category): The category articles were added to.
+
+    Returns:
+        Tuple[Category, Category, int]: The statement parameters.
+    """
+    return (category, category, LATEST_ARTICLES_DEPTH - 1)
+
+
+def category_increments(articles: Sequence[Article]) -> List[Tuple[int, Category]]:
+    """
+    Returns the parameters of increment_category_count.sql for a batch of articles.
+
+    The categories are sorted so concurrent batches lock the counter rows in the same order.
+
+    Args:
+        articles (Sequence[Article]): The articles to be added.
+
+    Returns:
+        List[Tuple[int, Category]]: The number of added articles per category.
+    """
+    counts = Counter(article.category for article in articles)
+    return [(counts[category], category) for category in sorted(counts)]
+
+
+def add_articles(articles: Sequence[Article]) -> None:
+    """
+    Adds a batch of articles to the database in a single transaction.
+
+    The articles are sent as one multi-row INSERT, the article count and the latest articles of
+    every affected category are updated once. As in add_article(), the article counts are
+    updated before the INSERT, so the category rows are locked exclusively from the start.
+
+    Args:
+        articles (Sequence[Article]): The Article objects to be added.
+    """
+    if not articles:
+        return
+    with pooled_connection() as cnx, cnx.cursor() as cursor:
+        for increment in category_increments(articles):
+            execute(cursor, SQL_INCREMENT_CATEGORY_COUNT, increment)
+        execute_many(
+            cursor, SQL_INSERT_ARTICLE, [article_to_row(article) for article in articles]
+        )
+        for category in sorted({article.category for article in articles}):
+            # A plain SELECT is a non-locking read, it neither waits for nor locks the rows of
+            # other writers and sees the rows just inserted
+            rows = fetch_all(
+                cursor, SQL_SELECT_LATEST_ARTICLE_IDS, (category, LATEST_ARTICLES_DEPTH)
+            )
+            execute_many(cursor, SQL_INSERT_LATEST_ARTICLE, [(category, row[0]) for row in rows])
+            execute(
+                cursor, SQL_TRIM_LATEST_ARTICLES_CATEGORY, trim_latest_articles_params(category)
+            )
+        cnx.commit()
+    articles_added(articles)
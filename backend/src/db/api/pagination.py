@@ -0,0 +1,121 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Opaque cursors for keyset pagination of the category listings and search results.
+
+A cursor encodes the (date, id) of the last article of a page. The next page then continues
+strictly after that position in the (category, date, id) index instead of skipping OFFSET rows.
+Search results are ordered by relevance instead, so their cursors encode the (score, id) of the
+last match.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+import json
+from typing import Tuple, Union
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(date: Union[str, datetime], article_id: int) -> str:
+    """
+    Encodes the position of an article into an opaque cursor.
+
+    Args:
+        date (Union[str, datetime]): The date column of the article, as stored.
+        article_id (int): The id of the article.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+    if isinstance(date, datetime):
+        date = date.isoformat(sep=" ")
+    payload = json.dumps([date, article_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'") from e
+    if not isinstance(payload, list) or len(payload) != 2:
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'")
+    return payload
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decodes a cursor created by encode_cursor().
+
+    Args:
+        cursor (str): The cursor.
+
+    Returns:
+        Tuple[str, int]: The date and id of the article the cursor points after.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    date, article_id = _decode(cursor)
+    if not isinstance(date, str) or not isinstance(article_id, int):
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'")
+    try:
+        datetime.fromisoformat(date)
+    except ValueError as e:
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'") from e
+    return date, article_id
+
+
+def encode_search_cursor(score: float, article_id: int) -> str:
+    """
+    Encodes the position of a search match into an opaque cursor.
+
+    Args:
+        score (float): The relevance of the match.
+        article_id (int): The id of the article.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+    payload = json.dumps([float(score), article_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Decodes a cursor created by encode_search_cursor().
+
+    Args:
+        cursor (str): The cursor.
+
+    Returns:
+        Tuple[float, int]: The relevance and id of the match the cursor points after.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    score, article_id = _decode(cursor)
+    if not isinstance(score, float) or not isinstance(article_id, int):
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'")
+    return score, article_id
@@ -0,0 +1,118 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Field projections and text excerpts of the article list endpoints.
+
+A list view rarely needs the full text of every article. A projection names the article fields
+to return, optionally with the text cut to an excerpt, and renders the select list of the list
+statement templates from it, so only the requested columns are read and shipped. Projected rows
+are returned as plain dicts with only those fields, the full article is available from
+GET /article/{id}.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+# The projectable fields in the order they are selected and returned
+ARTICLE_FIELDS = ("id", "title", "date", "author", "text", "agency", "category", "user_submitted")
+# The columns of a full Article, in the order row_to_article() expects
+FULL_ARTICLE_FIELDS = ARTICLE_FIELDS[1:]
+EXCERPT_MAX_LENGTH = 2000
+
+
+class InvalidProjectionError(ValueError):
+    """Raised when a fields parameter names unknown fields."""
+
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    The article fields a list endpoint returns.
+
+    Attributes:
+        fields (Tuple[str, ...]): The fields, in the order of ARTICLE_FIELDS.
+        excerpt (Optional[int]): The maximum length of the text, None for the full text.
+    """
+
+    fields: Tuple[str, ...]
+    excerpt: Optional[int] = None
+
+    @property
+    def columns(self) -> str:
+        """The select list of the projection."""
+        return ",\n    ".join(
+            "LEFT(articles.text, %s) AS text"
+            if field == "text" and self.excerpt is not None
+            else f"articles.{field}"
+            for field in self.fields
+        )
+
+    @property
+    def params(self) -> Tuple:
+        """The parameters of the select list, which precede those of the statement."""
+        return (self.excerpt,) if self.excerpt is not None and "text" in self.fields else ()
+
+    def to_dict(self, row: Sequence) -> Dict[str, Any]:
+        """
+        Converts a row selected with this projection into a dict of the projected fields.
+
+        Args:
+            row (Sequence): The row, starting with the projected columns.
+
+        Returns:
+            Dict[str, Any]: The projected fields.
+        """
+        return dict(zip(self.fields, row))
+
+    @property
+    def key(self) -> str:
+        """Identifies the projection in cache keys and ETags."""
+        return f"fields={','.join(self.fields)}&excerpt={self.excerpt}"
+
+
+FULL_ARTICLE = Projection(fields=FULL_ARTICLE_FIELDS)
+
+
+def parse_projection(fields: Optional[str], excerpt: Optional[int]) -> Optional[Projection]:
+    """
+    Builds the projection of the fields and excerpt query parameters.
+
+    Args:
+        fields (Optional[str]): Comma separated field names, None for the fields of a full
+            Article.
+        excerpt (Optional[int]): The maximum length of the text, None for the full text.
+
+    Returns:
+        Optional[Projection]: The projection, None if neither parameter was given.
+
+    Raises:
+        InvalidProjectionError: If a field is unknown or no field is named.
+    """
+    if fields is None and excerpt is None:
+        return None
+    if fields is None:
+        return Projection(fields=FULL_ARTICLE_FIELDS, excerpt=excerpt)
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = names - set(ARTICLE_FIELDS)
+    if unknown:
+        raise InvalidProjectionError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    if not names:
+        raise InvalidProjectionError("No fields requested")
+    selected = tuple(field for field in ARTICLE_FIELDS if field in names)
+    return Projection(fields=selected, excerpt=excerpt if "text" in names else None)
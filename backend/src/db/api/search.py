@@ -0,0 +1,164 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Full-text search over the title and text of the articles.
+
+By default GET /search runs against the FULLTEXT index on articles(title, text) in natural
+language mode. With SEARCH_BACKEND=memory it uses an InvertedIndex held in the process instead,
+which is loaded from the articles table on first use and kept current via the article events.
+It is meant for local runs and benchmarks: its scores approximate, but do not equal, the InnoDB
+relevance ranking.
+"""
+
+from collections import Counter
+import math
+import re
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+SEARCH_BACKEND = os.environ.get("SEARCH_BACKEND", "mysql")
+SEARCH_PAGE_SIZE = int(os.environ.get("SEARCH_PAGE_SIZE", "10"))
+SEARCH_MAX_QUERY_LENGTH = 200
+
+# Same as the innodb_ft_min_token_size default, shorter words are not indexed
+SEARCH_MIN_TOKEN_LENGTH = 3
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalizes a search query so equivalent queries share a cache entry.
+
+    Args:
+        query (str): The query as sent by the client.
+
+    Returns:
+        str: The lower-cased query with runs of whitespace collapsed.
+    """
+    return " ".join(query.lower().split())
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits a text into the lower-cased words that are indexed.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        List[str]: The words, in order and with repetitions.
+    """
+    return [
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if len(token) >= SEARCH_MIN_TOKEN_LENGTH
+    ]
+
+
+class InvertedIndex:
+    """
+    A thread-safe in-memory inverted index over article rows.
+
+    Rows have the column order of select_all_articles.sql, i.e. the article columns followed by
+    the id. Matches are ranked like InnoDB does, by the sum over the query words of the term
+    frequency times the squared inverse document frequency, with the latter smoothed so a word
+    found in every article still counts.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._rows: Dict[int, Tuple] = {}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._max_id = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _insert(self, columns: Tuple, article_id: Optional[int]) -> None:
+        counts = Counter(tokenize(f"{columns[0]} {columns[3]}"))
+        with self._lock:
+            if article_id is None:
+                article_id = self._max_id + 1
+            self._rows[article_id] = columns + (article_id,)
+            self._max_id = max(self._max_id, article_id)
+            for token, count in counts.items():
+                self._postings.setdefault(token, {})[article_id] = count
+
+    def add(self, row: Sequence) -> None:
+        """
+        Indexes an article row.
+
+        Args:
+            row (Sequence): The article columns followed by the id.
+        """
+        self._insert(tuple(row[:7]), row[7])
+
+    def add_without_id(self, columns: Sequence) -> None:
+        """
+        Indexes an article whose id is unknown, e.g. one announced by an article event, under
+        the next id after the largest one seen.
+
+        Args:
+            columns (Sequence): The article columns, without the id.
+        """
+        self._insert(tuple(columns[:7]), None)
+
+    def search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        after: Optional[Tuple[float, int]] = None,
+        limit: int = SEARCH_PAGE_SIZE,
+    ) -> List[Tuple]:
+        """
+        Finds the articles matching any word of a query.
+
+        Args:
+            query (str): The search query.
+            category (Optional[str], optional): Only match articles of this category.
+                Defaults to None.
+            after (Optional[Tuple[float, int]], optional): Only return matches ranked after
+                this (score, id) position. Defaults to None.
+            limit (int, optional): The maximum number of matches. Defaults to SEARCH_PAGE_SIZE.
+
+        Returns:
+            List[Tuple]: Rows in the column order of search_articles_first.sql, ordered by
+                descending score and id.
+        """
+        scores: Dict[int, float] = {}
+        with self._lock:
+            total = len(self._rows)
+            for token in set(tokenize(query)):
+                postings = self._postings.get(token)
+                if not postings:
+                    continue
+                idf = math.log10(1 + total / len(postings))
+                for article_id, count in postings.items():
+                    scores[article_id] = scores.get(article_id, 0.0) + count * idf * idf
+            matches = [
+                (score, article_id)
+                for article_id, score in scores.items()
+                if category is None or self._rows[article_id][5] == category
+            ]
+            if after is not None:
+                matches = [match for match in matches if match < after]
+            matches.sort(reverse=True)
+            return [self._rows[article_id] + (score,) for score, article_id in matches[:limit]]
@@ -0,0 +1,6 @@
+UPDATE
+    categories
+SET
+    article_count = article_count + %s
+WHERE
+    category = %s;
\ No newline at end of file
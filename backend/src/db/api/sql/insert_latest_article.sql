@@ -0,0 +1,4 @@
+INSERT
+    IGNORE INTO latest_articles (category, article_id)
+VALUES
+    (%s, %s);
\ No newline at end of file
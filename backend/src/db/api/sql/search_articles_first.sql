@@ -0,0 +1,23 @@
+SELECT
+    title,
+    date,
+    author,
+    text,
+    agency,
+    category,
+    user_submitted,
+    id,
+    MATCH (title, text) AGAINST (%s IN NATURAL LANGUAGE MODE) AS score
+FROM
+    articles
+WHERE
+    MATCH (title, text) AGAINST (%s IN NATURAL LANGUAGE MODE)
+    AND (
+        %s IS NULL
+        OR category = %s
+    )
+ORDER BY
+    score DESC,
+    id DESC
+LIMIT
+    %s;
\ No newline at end of file
@@ -0,0 +1,11 @@
+SELECT
+    title,
+    date,
+    author,
+    text,
+    agency,
+    category,
+    user_submitted,
+    id
+FROM
+    articles;
\ No newline at end of file
@@ -0,0 +1,12 @@
+SELECT
+    title,
+    date,
+    author,
+    text,
+    agency,
+    category,
+    user_submitted
+FROM
+    articles
+WHERE
+    id = %s;
\ No newline at end of file
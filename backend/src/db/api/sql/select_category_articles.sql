@@ -1,16 +1,19 @@
 SELECT
-    title,
-    date,
-    author,
-    text,
-    agency,
-    category,
-    user_submitted
+    {columns},
+    (
+        SELECT
+            CEILING(article_count / %s)
+        FROM
+            categories
+        WHERE
+            categories.category = articles.category
+    ) AS total_pages
 FROM
     articles
 WHERE
     category = %s
 ORDER BY
-    date DESC
+    date DESC,
+    id DESC
 LIMIT
     %s OFFSET %s;
\ No newline at end of file
@@ -0,0 +1,25 @@
+SELECT
+    title,
+    date,
+    author,
+    text,
+    agency,
+    category,
+    user_submitted,
+    id
+FROM
+    articles
+WHERE
+    category = %s
+    AND (
+        date < %s
+        OR (
+            date = %s
+            AND id < %s
+        )
+    )
+ORDER BY
+    date DESC,
+    id DESC
+LIMIT
+    %s;
\ No newline at end of file
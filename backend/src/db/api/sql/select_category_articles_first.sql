@@ -0,0 +1,18 @@
+SELECT
+    title,
+    date,
+    author,
+    text,
+    agency,
+    category,
+    user_submitted,
+    id
+FROM
+    articles
+WHERE
+    category = %s
+ORDER BY
+    date DESC,
+    id DESC
+LIMIT
+    %s;
\ No newline at end of file
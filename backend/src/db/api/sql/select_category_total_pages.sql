@@ -1,6 +1,6 @@
 SELECT
-    CEILING(COUNT(*) / %s)
+    CEILING(article_count / %s)
 FROM
-    articles
+    categories
 WHERE
     category = %s;
\ No newline at end of file
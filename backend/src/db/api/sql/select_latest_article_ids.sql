@@ -0,0 +1,10 @@
+SELECT
+    id
+FROM
+    articles
+WHERE
+    category = %s
+ORDER BY
+    id DESC
+LIMIT
+    %s;
\ No newline at end of file
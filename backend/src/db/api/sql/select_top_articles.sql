@@ -1,19 +1,20 @@
 SELECT
-    title,
-    date,
-    author,
-    text,
-    agency,
-    category,
-    user_submitted
+    {columns}
 FROM
-    articles
-WHERE
-    id IN (
+    (
         SELECT
-            MAX(id)
+            article_id,
+            ROW_NUMBER() OVER (
+                PARTITION BY category
+                ORDER BY
+                    article_id DESC
+            ) AS position
         FROM
-            articles
-        GROUP BY
-            category
-    );
\ No newline at end of file
+            latest_articles
+    ) AS latest
+    JOIN articles ON articles.id = latest.article_id
+WHERE
+    latest.position <= %s
+ORDER BY
+    articles.category,
+    articles.id DESC;
\ No newline at end of file
@@ -0,0 +1,21 @@
+DELETE FROM
+    latest_articles
+WHERE
+    category = %s
+    AND article_id < (
+        SELECT
+            article_id
+        FROM
+            (
+                SELECT
+                    article_id
+                FROM
+                    latest_articles
+                WHERE
+                    category = %s
+                ORDER BY
+                    article_id DESC
+                LIMIT
+                    1 OFFSET %s
+            ) AS boundary
+    );
\ No newline at end of file
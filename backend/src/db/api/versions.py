@@ -0,0 +1,168 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Content version tokens for the article read endpoints.
+
+Every category has a version that add_article() bumps, and a global version covers the top
+stories, which span all categories. The HTTP layer derives ETag and Last-Modified headers from
+these tokens, so revalidation requests can be answered without querying the articles.
+
+Versions live in the process, or in the counters the workers of python -m src.serve share, so
+all workers of a task hand out the same tokens. A worker that sees a version moved by another
+worker notifies the listeners registered with add_change_listener(), which drop what the worker
+derived from the old content. The tokens include a random boot id so two processes or tasks
+never hand out the same ETag for different content, and roll over every VERSION_EPOCH_SECONDS
+(defaulting to the article cache TTL) so writes made through other tasks become visible as well.
+"""
+
+import os
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple, get_args
+from ...types import Category
+from ..common.shared_counters import SharedCounters, open_shared_counters
+from .cache import ARTICLES_CACHE_TTL
+
+VERSION_EPOCH_SECONDS = float(os.environ.get("VERSION_EPOCH_SECONDS", str(ARTICLES_CACHE_TTL)))
+
+GLOBAL_SCOPE = "*"
+
+SCOPES = (*get_args(Category), GLOBAL_SCOPE)
+
+ChangeListener = Callable[[Category], None]
+
+
+class ContentVersions:
+    """
+    Per-category and global version counters with the time of their last change.
+    """
+
+    def __init__(
+        self,
+        epoch_seconds: float = VERSION_EPOCH_SECONDS,
+        shared: Optional[SharedCounters] = None,
+    ) -> None:
+        self.epoch_seconds = epoch_seconds
+        self._shared = shared
+        self._lock = threading.Lock()
+        if shared is None:
+            self.boot_id = uuid.uuid4().hex[:8]
+            self._started_at = time.time()
+        else:
+            self.boot_id = shared.boot_id
+            self._started_at = shared.created_at
+        self._versions: Dict[str, int] = {}
+        self._modified_at: Dict[str, float] = {}
+        self._listeners: List[ChangeListener] = []
+
+    @property
+    def shared(self) -> bool:
+        """Whether the versions are shared with other worker processes."""
+        return self._shared is not None
+
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """
+        Registers a function to call when another worker changed a category.
+
+        Args:
+            listener (ChangeListener): The function to call with the category.
+        """
+        self._listeners.append(listener)
+
+    def bump(self, category: Category) -> None:
+        """
+        Records a change to a category, which also changes the global version.
+
+        Args:
+            category (Category): The category that changed.
+        """
+        if self._shared is not None:
+            for scope in (category, GLOBAL_SCOPE):
+                version, modified_at = self._shared.increment(scope)
+                with self._lock:
+                    # Unless another worker bumped the scope in between, which sync() reports
+                    if version == self._versions.get(scope, 0) + 1:
+                        self._versions[scope] = version
+                        self._modified_at[scope] = modified_at
+            self.sync()
+            return
+        now = time.time()
+        with self._lock:
+            for scope in (category, GLOBAL_SCOPE):
+                self._versions[scope] = self._versions.get(scope, 0) + 1
+                self._modified_at[scope] = now
+
+    def sync(self) -> None:
+        """
+        Takes over the versions changed by other workers and notifies the change listeners.
+
+        The listeners run before the new versions are handed out, so nothing derived from the
+        old content gets stored under a new version.
+        """
+        if self._shared is None:
+            return
+        snapshot = self._shared.snapshot()
+        with self._lock:
+            changed = {
+                scope: entry
+                for scope, entry in snapshot.items()
+                if entry[0] > self._versions.get(scope, 0)
+            }
+        if not changed:
+            return
+        self._notify([scope for scope in changed if scope != GLOBAL_SCOPE])
+        with self._lock:
+            for scope, (version, modified_at) in changed.items():
+                # A concurrent sync may have taken over an even newer version
+                if version > self._versions.get(scope, 0):
+                    self._versions[scope] = version
+                    self._modified_at[scope] = modified_at
+
+    def _notify(self, categories: List[Category]) -> None:
+        for category in categories:
+            for listener in self._listeners:
+                listener(category)
+
+    def get(self, category: Optional[Category] = None) -> Tuple[str, float]:
+        """
+        Returns the version token and last modification time of a category.
+
+        Args:
+            category (Optional[Category], optional): The category, or None for the global
+                version. Defaults to None.
+
+        Returns:
+            Tuple[str, float]: The opaque version token and the Unix timestamp of the last
+                change.
+        """
+        scope = category or GLOBAL_SCOPE
+        self.sync()
+        with self._lock:
+            version = self._versions.get(scope, 0)
+            modified_at = self._modified_at.get(scope, self._started_at)
+        if self.epoch_seconds > 0:
+            epoch = int(time.time() // self.epoch_seconds)
+            modified_at = max(modified_at, epoch * self.epoch_seconds)
+        else:
+            epoch = 0
+        return f"{self.boot_id}.{epoch}.{version}", modified_at
+
+
+content_versions = ContentVersions(shared=open_shared_counters(SCOPES))
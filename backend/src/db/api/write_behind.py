@@ -0,0 +1,295 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Write-behind queue for single article submissions.
+
+Instead of waiting for its own INSERT and commit, POST /article puts the article into a bounded
+in-process queue and answers right away. A background task drains the queue and stores the
+articles in group-committed batches, flushing once WRITE_BEHIND_BATCH_SIZE articles are waiting
+or WRITE_BEHIND_MAX_DELAY seconds after the first article of a batch arrived, whichever comes
+first. When the queue is full, submitters wait up to WRITE_BEHIND_ENQUEUE_TIMEOUT seconds for
+room before being turned away. On shutdown the queue is drained before the process exits.
+
+Accepted articles live only in memory until their batch is committed. Failures known to leave
+nothing committed, such as an unreachable database or a deadlock, are retried as a whole until
+the batch is stored, backing off up to WRITE_BEHIND_MAX_BACKOFF seconds, or for as long as the
+circuit breaker of the writer stays open. Meanwhile the queue fills up and turns submitters away,
+so an outage pushes back on clients instead of losing accepted articles. A batch the database
+rejects is split in halves until only the offending articles are left, which are logged and
+dropped. A batch whose connection was lost may or may not have been committed, so it is logged
+and not retried to never store it twice.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, List, Optional, Tuple
+import uuid
+import mysql.connector
+from mysql.connector import errorcode
+import pymysql
+from ...types import Article, WriteBehindStats
+from ..common.circuit_breaker import CircuitOpenError
+from ..common.connection import PoolTimeoutError
+
+logger = logging.getLogger(__name__)
+
+WRITE_BEHIND_QUEUE_SIZE = int(os.environ.get("WRITE_BEHIND_QUEUE_SIZE", "10000"))
+WRITE_BEHIND_BATCH_SIZE = int(os.environ.get("WRITE_BEHIND_BATCH_SIZE", "200"))
+WRITE_BEHIND_MAX_DELAY = float(os.environ.get("WRITE_BEHIND_MAX_DELAY", "0.05"))
+WRITE_BEHIND_ENQUEUE_TIMEOUT = float(os.environ.get("WRITE_BEHIND_ENQUEUE_TIMEOUT", "1"))
+WRITE_BEHIND_MAX_BACKOFF = float(os.environ.get("WRITE_BEHIND_MAX_BACKOFF", "2"))
+
+
+# Errors raised before the transaction could commit anything, after which it can be repeated
+RETRYABLE_ERRNOS = {
+    errorcode.ER_LOCK_DEADLOCK,
+    errorcode.ER_LOCK_WAIT_TIMEOUT,
+    errorcode.ER_CON_COUNT_ERROR,
+    errorcode.CR_CONNECTION_ERROR,
+    errorcode.CR_CONN_HOST_ERROR,
+}
+# Errors which may have happened after the commit reached the server
+AMBIGUOUS_ERRNOS = {
+    errorcode.CR_SERVER_GONE_ERROR,
+    errorcode.CR_SERVER_LOST,
+    errorcode.CR_SERVER_LOST_EXTENDED,
+}
+
+
+def _error_code(error: Exception) -> Optional[int]:
+    # PyMySQL passes the MySQL error number as the first argument
+    if isinstance(error, mysql.connector.Error):
+        return error.errno
+    if isinstance(error, pymysql.err.MySQLError) and error.args:
+        code = error.args[0]
+        return code if isinstance(code, int) else None
+    return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Tells whether a failed insert is known to have left nothing committed.
+
+    Args:
+        error (Exception): The error raised by the insert.
+
+    Returns:
+        bool: True if the insert can safely be repeated.
+    """
+    if isinstance(error, (CircuitOpenError, PoolTimeoutError)):
+        return True
+    return _error_code(error) in RETRYABLE_ERRNOS
+
+
+def is_ambiguous(error: Exception) -> bool:
+    """
+    Tells whether a failed insert may nevertheless have been committed.
+
+    Args:
+        error (Exception): The error raised by the insert.
+
+    Returns:
+        bool: True if the connection was lost with the outcome of the transaction unknown.
+    """
+    return _error_code(error) in AMBIGUOUS_ERRNOS
+
+
+class QueueFullError(Exception):
+    """Raised when an article could not be queued because the queue stayed full."""
+
+
+class QueueClosedError(Exception):
+    """Raised when an article is submitted after the queue was stopped."""
+
+
+class WriteBehindQueue:
+    """
+    A bounded queue of articles with a background writer doing group commits.
+    """
+
+    def __init__(
+        self,
+        insert: Callable[[List[Article]], Awaitable[None]],
+        max_size: int = WRITE_BEHIND_QUEUE_SIZE,
+        batch_size: int = WRITE_BEHIND_BATCH_SIZE,
+        max_delay: float = WRITE_BEHIND_MAX_DELAY,
+        enqueue_timeout: float = WRITE_BEHIND_ENQUEUE_TIMEOUT,
+        max_backoff: float = WRITE_BEHIND_MAX_BACKOFF,
+    ) -> None:
+        self._insert = insert
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.enqueue_timeout = enqueue_timeout
+        self.max_backoff = max_backoff
+
+        self._queue: "asyncio.Queue[Tuple[str, Article]]" = asyncio.Queue(maxsize=max_size)
+        self._writer: Optional["asyncio.Task[None]"] = None
+        self._closed = False
+
+        self._accepted = 0
+        self._rejected = 0
+        self._written = 0
+        self._dropped = 0
+        self._flushes = 0
+        self._flush_seconds_total = 0.0
+        self._flush_seconds_max = 0.0
+        self._last_flush_seconds = 0.0
+
+    def start(self) -> None:
+        """
+        Starts the background writer on the running event loop.
+        """
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._run(), name="write-behind-writer")
+
+    async def submit(self, article: Article) -> str:
+        """
+        Queues an article for writing.
+
+        Args:
+            article (Article): The article to be added.
+
+        Returns:
+            str: The id assigned to the submission.
+
+        Raises:
+            QueueClosedError: If the queue was stopped.
+            QueueFullError: If the queue stayed full for the enqueue timeout.
+        """
+        if self._closed:
+            raise QueueClosedError("The write-behind queue is shutting down")
+        submission_id = uuid.uuid4().hex
+        try:
+            await asyncio.wait_for(
+                self._queue.put((submission_id, article)), timeout=self.enqueue_timeout
+            )
+        except asyncio.TimeoutError as e:
+            self._rejected += 1
+            raise QueueFullError("The write-behind queue is full") from e
+        self._accepted += 1
+        return submission_id
+
+    async def _next_batch(self) -> List[Tuple[str, Article]]:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def _drop(self, batch: List[Tuple[str, Article]], reason: str, error: Exception) -> int:
+        self._dropped += len(batch)
+        logger.error(
+            "Dropping %d queued articles (%s), %s: %s",
+            len(batch),
+            ", ".join(submission_id for submission_id, _article in batch),
+            reason,
+            str(error),
+        )
+        return 0
+
+    async def _store(self, batch: List[Tuple[str, Article]]) -> int:
+        articles = [article for _submission_id, article in batch]
+        delay = min(0.1, self.max_backoff)
+        while True:
+            try:
+                await self._insert(articles)
+                return len(batch)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                if isinstance(e, CircuitOpenError):
+                    # Waits out the outage without failing the batch, the breaker paces the probes
+                    logger.warning("Holding %d queued articles: %s", len(batch), str(e))
+                    await asyncio.sleep(e.retry_after)
+                    continue
+                if is_retryable(e):
+                    logger.warning(
+                        "Retrying %d queued articles in %.1fs: %s", len(batch), delay, str(e)
+                    )
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.max_backoff)
+                    continue
+                if is_ambiguous(e):
+                    return self._drop(batch, "which may or may not have been stored", e)
+                if len(batch) == 1:
+                    return self._drop(batch, "rejected by the database", e)
+                # Finds the articles the database rejects without giving up the others
+                middle = len(batch) // 2
+                return await self._store(batch[:middle]) + await self._store(batch[middle:])
+
+    async def _flush(self, batch: List[Tuple[str, Article]]) -> None:
+        started_at = time.perf_counter()
+        written = await self._store(batch)
+        elapsed = time.perf_counter() - started_at
+        self._written += written
+        self._flushes += 1
+        self._flush_seconds_total += elapsed
+        self._flush_seconds_max = max(self._flush_seconds_max, elapsed)
+        self._last_flush_seconds = elapsed
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def stop(self) -> None:
+        """
+        Stops accepting articles, writes all queued articles and stops the writer.
+        """
+        self._closed = True
+        if self._writer is None:
+            return
+        await self._queue.join()
+        self._writer.cancel()
+        try:
+            await self._writer
+        except asyncio.CancelledError:
+            pass
+        self._writer = None
+
+    def stats(self) -> WriteBehindStats:
+        """
+        Returns a snapshot of the queue counters.
+
+        Returns:
+            WriteBehindStats: The current queue statistics.
+        """
+        return WriteBehindStats(
+            depth=self._queue.qsize(),
+            max_size=self.max_size,
+            accepted=self._accepted,
+            rejected=self._rejected,
+            written=self._written,
+            dropped=self._dropped,
+            flushes=self._flushes,
+            last_flush_seconds=self._last_flush_seconds,
+            avg_flush_seconds=self._flush_seconds_total / self._flushes if self._flushes else 0,
+            max_flush_seconds=self._flush_seconds_max,
+        )
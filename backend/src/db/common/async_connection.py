@@ -0,0 +1,218 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Async counterpart of connection.py for the async data-access layer in db/api/async_main.py.
+
+The aiomysql pool lives on the event loop of the running application, so connections are
+awaited rather than holding one of the threads of the anyio threadpool while waiting on the
+database. The pool limits are shared with the sync pool (DB_POOL_* environment variables).
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+import os
+import time
+from typing import AsyncIterator, Dict, Optional, Tuple
+import aiomysql
+import pymysql
+from ...metrics import observe_connection_acquire
+from ...profiling import CONNECTION, record_span
+from .connection import (
+    CONNECTION_ERRNOS,
+    DB_POOL_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    PoolTimeoutError,
+    WRITER,
+)
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+from .routing import Endpoint, read_router
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[aiomysql.Pool] = None
+_reader_pools: Dict[Endpoint, aiomysql.Pool] = {}
+_pool_lock: Optional[asyncio.Lock] = None
+
+
+async def _create_pool(endpoint: Optional[Endpoint]) -> aiomysql.Pool:
+    return await aiomysql.create_pool(
+        minsize=1,
+        maxsize=DB_POOL_SIZE + DB_POOL_MAX_OVERFLOW,
+        pool_recycle=int(DB_POOL_RECYCLE),
+        user=os.environ["DB_USER"],
+        password=os.environ["DB_USER_PASSWORD"],
+        host=endpoint.host if endpoint else os.environ["DB_HOST"],
+        db=os.environ["DB_NAME"],
+        port=endpoint.port if endpoint else int(os.environ["DB_PORT"]),
+        autocommit=True,
+    )
+
+
+async def get_async_pool(endpoint: Optional[Endpoint] = None) -> aiomysql.Pool:
+    """
+    Returns the aiomysql pool of an instance on the running event loop, creating it on first
+    use.
+
+    Connections are opened in autocommit mode: aiomysql closes connections that are returned
+    while a transaction is still open, so read queries must not leave one behind.
+
+    Args:
+        endpoint (Optional[Endpoint], optional): A reader instance. Defaults to the writer.
+
+    Returns:
+        aiomysql.Pool: The shared async connection pool.
+    """
+    global _pool, _pool_lock  # pylint: disable=global-statement
+    pool = _reader_pools.get(endpoint) if endpoint is not None else _pool
+    if pool is not None:
+        return pool
+    if _pool_lock is None:
+        _pool_lock = asyncio.Lock()
+    async with _pool_lock:
+        if endpoint is not None:
+            if endpoint not in _reader_pools:
+                _reader_pools[endpoint] = await _create_pool(endpoint)
+            return _reader_pools[endpoint]
+        if _pool is None:
+            _pool = await _create_pool(None)
+    return _pool
+
+
+async def _checkout(
+    endpoint: Optional[Endpoint],
+) -> Tuple[aiomysql.Pool, aiomysql.Connection]:
+    name = endpoint.name if endpoint else WRITER
+    breaker = get_circuit_breaker(name)
+    breaker.before_call()
+    started_at = time.perf_counter()
+    try:
+        pool = await get_async_pool(endpoint)
+        cnx = await asyncio.wait_for(pool.acquire(), timeout=DB_POOL_TIMEOUT)
+    except asyncio.TimeoutError as e:
+        breaker.cancel()
+        raise PoolTimeoutError(
+            f"No database connection available within {DB_POOL_TIMEOUT}s"
+        ) from e
+    except (OSError, pymysql.err.MySQLError):
+        breaker.record_failure()
+        raise
+    except BaseException:
+        breaker.cancel()
+        raise
+    finally:
+        seconds = time.perf_counter() - started_at
+        observe_connection_acquire(name, seconds)
+        record_span(CONNECTION, seconds, name)
+    breaker.record_success()
+    return pool, cnx
+
+
+def _record_query_error(name: str, error: pymysql.err.MySQLError) -> None:
+    # PyMySQL passes the MySQL error number as the first argument, see
+    # connection.record_query_error()
+    if error.args and error.args[0] in CONNECTION_ERRNOS:
+        get_circuit_breaker(name).record_failure()
+
+
+@asynccontextmanager
+async def async_pooled_connection() -> AsyncIterator[aiomysql.Connection]:
+    """
+    Checks out a connection to the writer for the duration of an async with block.
+
+    Connecting goes through the circuit breaker of the writer, see circuit_breaker.py, and
+    queries that fail because the connection broke are reported to it.
+
+    Yields:
+        aiomysql.Connection: A pooled connection to the MySQL database.
+
+    Raises:
+        CircuitOpenError: If the circuit breaker of the writer is open.
+        PoolTimeoutError: If no connection became available within DB_POOL_TIMEOUT seconds.
+    """
+    pool, cnx = await _checkout(None)
+    try:
+        yield cnx
+    except pymysql.err.MySQLError as e:
+        _record_query_error(WRITER, e)
+        raise
+    finally:
+        pool.release(cnx)
+
+
+@asynccontextmanager
+async def async_read_connection(scope: str) -> AsyncIterator[aiomysql.Connection]:
+    """
+    Checks out a connection for read-only queries for the duration of an async with block.
+
+    Routing and failover follow connection.read_connection().
+
+    Args:
+        scope (str): The data that is read, a category or routing.GLOBAL_SCOPE.
+
+    Yields:
+        aiomysql.Connection: A pooled connection to the MySQL database.
+
+    Raises:
+        CircuitOpenError: If the read went to the writer and its circuit breaker is open.
+        PoolTimeoutError: If no connection became available within DB_POOL_TIMEOUT seconds.
+    """
+    reader = read_router.choose_reader(scope)
+    checkout: Optional[Tuple[aiomysql.Pool, aiomysql.Connection]] = None
+    if reader is not None:
+        try:
+            checkout = await _checkout(reader)
+        except PoolTimeoutError:
+            raise
+        except (CircuitOpenError, OSError, pymysql.err.MySQLError) as e:
+            logger.debug("Failed to connect to reader %s: %s", reader.name, str(e))
+            read_router.mark_down(reader)
+            read_router.record_writer_read()
+    if reader is None or checkout is None:
+        async with async_pooled_connection() as writer_cnx:
+            yield writer_cnx
+        return
+
+    pool, cnx = checkout
+    try:
+        yield cnx
+    except (pymysql.err.InterfaceError, pymysql.err.OperationalError) as e:
+        read_router.mark_down(reader)
+        _record_query_error(reader.name, e)
+        raise
+    finally:
+        pool.release(cnx)
+
+
+async def close_async_pool() -> None:
+    """
+    Closes the async pools of the writer and the readers, waiting for all connections to be
+    released.
+    """
+    global _pool  # pylint: disable=global-statement
+    pools = list(_reader_pools.values())
+    _reader_pools.clear()
+    if _pool is not None:
+        pools.append(_pool)
+        _pool = None
+    for pool in pools:
+        pool.close()
+        await pool.wait_closed()
@@ -0,0 +1,232 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+A bounded in-process cache with per-entry TTL, LRU eviction and single-flight loading.
+"""
+
+import asyncio
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from ...types import CacheStats
+
+
+class _Flight:
+    """
+    A load in progress for a key, which concurrent sync callers wait for.
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache:
+    """
+    A thread-safe cache with a maximum number of entries, a time to live per entry and least
+    recently used eviction.
+
+    Values are loaded through get_or_load() (or aget_or_load() from async code). Only one load
+    per key runs at a time, concurrent callers for the same key wait for its result instead of
+    hitting the database as well. Values loaded while an invalidation happened are returned to
+    the callers but not stored, so a write never gets shadowed by an older read.
+
+    A ttl of 0 or less disables caching, every call then runs the loader.
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._async_flights: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._generation = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether values are cached at all."""
+        return self.ttl > 0 and self.max_entries > 0
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        # Must be called with the lock held
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._expirations += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key: Hashable, value: Any, generation: int) -> None:
+        # Must be called with the lock held
+        if generation != self._generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Returns the cached value for a key, loading it on a miss.
+
+        Args:
+            key (Hashable): The cache key.
+            loader (Callable[[], Any]): Produces the value on a miss.
+
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        if not self.enabled:
+            return loader()
+
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self._hits += 1
+                return value
+            self._misses += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            generation = self._generation
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+            with self._lock:
+                self._store(key, flight.value, generation)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    async def aget_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async variant of get_or_load() for coroutine loaders.
+
+        Args:
+            key (Hashable): The cache key.
+            loader (Callable[[], Awaitable[Any]]): Produces the value on a miss.
+
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        if not self.enabled:
+            return await loader()
+
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self._hits += 1
+                return value
+            self._misses += 1
+            generation = self._generation
+        future = self._async_flights.get(key)
+        if future is not None:
+            # shield so a cancelled follower does not cancel the leader's load
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_flights[key] = future
+        try:
+            value = await loader()
+            with self._lock:
+                self._store(key, value, generation)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # mark retrieved so an unobserved failure is not logged by asyncio
+            future.exception()
+            raise
+        finally:
+            self._async_flights.pop(key, None)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Removes all entries whose key matches the predicate.
+
+        Loads that are in flight while this is called will not store their result.
+
+        Args:
+            predicate (Callable[[Hashable], bool]): Selects the keys to remove.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        with self._lock:
+            self._generation += 1
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        self.invalidate(lambda _key: True)
+
+    def stats(self) -> CacheStats:
+        """
+        Returns a snapshot of the cache counters.
+
+        Returns:
+            CacheStats: The current cache statistics.
+        """
+        with self._lock:
+            return CacheStats(
+                max_entries=self.max_entries,
+                ttl=self.ttl,
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+            )
@@ -0,0 +1,225 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+---
+
+Circuit breakers around opening database connections.
+
+While the database is unreachable every connection attempt hangs until it times out, and each
+request waiting on one ties up a worker thread. A breaker counts consecutive failed attempts per
+database instance, as well as queries that failed because their connection broke. After
+DB_CIRCUIT_FAILURE_THRESHOLD of them it opens, and for DB_CIRCUIT_RESET_TIMEOUT seconds further
+attempts fail right away with a CircuitOpenError, which the routes turn into 503 Service
+Unavailable with a Retry-After header. After that period the breaker is half-open: a single
+probe attempt is let through, which closes the breaker again if it succeeds and reopens it if it
+fails. Every failed probe keeps the breaker open for longer, drawn with decorrelated jitter up to
+DB_CIRCUIT_MAX_RESET_TIMEOUT seconds, so the breaker is the only backoff and no request sleeps
+between attempts. The state is shared by all requests of the process.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from typing import Dict, List
+from ...types import CircuitBreakerStats
+
+logger = logging.getLogger(__name__)
+
+DB_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("DB_CIRCUIT_FAILURE_THRESHOLD", "5"))
+DB_CIRCUIT_RESET_TIMEOUT = float(os.environ.get("DB_CIRCUIT_RESET_TIMEOUT", "10"))
+DB_CIRCUIT_MAX_RESET_TIMEOUT = float(os.environ.get("DB_CIRCUIT_MAX_RESET_TIMEOUT", "60"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of attempting to connect while a circuit breaker is open.
+
+    Attributes:
+        retry_after (float): The number of seconds until the breaker lets a probe through.
+    """
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"Database {name} is unavailable, retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+def decorrelated_jitter(previous: float, base: float, cap: float) -> float:
+    """
+    Returns the next delay of a "decorrelated jitter" backoff.
+
+    The delay is drawn at random between the base delay and three times the previous one, so
+    clients that failed at the same time do not retry in lockstep.
+
+    Args:
+        previous (float): The previous delay, or the base delay for the first retry.
+        base (float): The smallest delay.
+        cap (float): The largest delay.
+
+    Returns:
+        float: The delay in seconds.
+    """
+    return min(cap, random.uniform(base, max(base, previous * 3)))
+
+
+class CircuitBreaker:
+    """
+    A thread-safe circuit breaker with closed, open and half-open states.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DB_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = DB_CIRCUIT_RESET_TIMEOUT,
+        max_reset_timeout: float = DB_CIRCUIT_MAX_RESET_TIMEOUT,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max(max_reset_timeout, reset_timeout)
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._open_for = reset_timeout
+        self._probing = False
+        self._rejected = 0
+        self._transitions: Dict[str, int] = {}
+
+    def _transition(self, state: str) -> None:
+        key = f"{self._state}->{state}"
+        self._transitions[key] = self._transitions.get(key, 0) + 1
+        log = logger.warning if state == OPEN else logger.info
+        log("Circuit breaker of database %s: %s", self.name, key)
+        self._state = state
+
+    def before_call(self) -> None:
+        """
+        Checks whether an attempt may be made. Every admitted attempt must be followed by
+        record_success(), record_failure() or cancel().
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a probe in flight.
+        """
+        with self._lock:
+            if self._state == OPEN:
+                remaining = self._opened_at + self._open_for - time.monotonic()
+                if remaining > 0:
+                    self._rejected += 1
+                    raise CircuitOpenError(self.name, remaining)
+                self._transition(HALF_OPEN)
+            if self._state == HALF_OPEN:
+                if self._probing:
+                    self._rejected += 1
+                    raise CircuitOpenError(self.name, self._open_for)
+                self._probing = True
+
+    def cancel(self) -> None:
+        """
+        Releases an admitted attempt that ended without telling whether the database is up,
+        e.g. a timeout waiting for a pooled connection.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        """
+        Records a successful attempt, which closes the breaker.
+        """
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            if self._state != CLOSED:
+                self._open_for = self.reset_timeout
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        """
+        Records a failed attempt, which opens the breaker after too many failures in a row or
+        if it was a half-open probe. A failed probe draws a longer open period.
+        """
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._state == HALF_OPEN:
+                self._open_for = decorrelated_jitter(
+                    self._open_for, self.reset_timeout, self.max_reset_timeout
+                )
+            elif self._state != CLOSED or self._failures < self.failure_threshold:
+                return
+            self._opened_at = time.monotonic()
+            self._transition(OPEN)
+
+    def stats(self) -> CircuitBreakerStats:
+        """
+        Returns a snapshot of the breaker state and counters.
+
+        Returns:
+            CircuitBreakerStats: The current breaker statistics.
+        """
+        with self._lock:
+            retry_after = 0.0
+            if self._state == OPEN:
+                retry_after = max(0.0, self._opened_at + self._open_for - time.monotonic())
+            return CircuitBreakerStats(
+                name=self.name,
+                state=self._state,
+                consecutive_failures=self._failures,
+                retry_after=retry_after,
+                rejected=self._rejected,
+                transitions=dict(self._transitions),
+            )
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Returns the process-wide circuit breaker of a database instance, creating it on first use.
+
+    Args:
+        name (str): The name of the instance, "writer" or the `host:port` of a reader.
+
+    Returns:
+        CircuitBreaker: The shared circuit breaker.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name)
+        return breaker
+
+
+def get_circuit_breaker_stats() -> List[CircuitBreakerStats]:
+    """
+    Returns the statistics of all circuit breakers.
+
+    Returns:
+        List[CircuitBreakerStats]: The current breaker statistics, ordered by name.
+    """
+    with _breakers_lock:
+        breakers = sorted(_breakers.values(), key=lambda breaker: breaker.name)
+    return [breaker.stats() for breaker in breakers]
@@ -17,55 +17,499 @@ IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 ---
-
-Due to the asynchronous operation of FastAPI, each function connects to the database 
-individually instead of sharing a connection object.
-Otherwise errors as in 
+Connections are handed out by a process-wide ConnectionPool. FastAPI dispatches sync route
+handlers onto a threadpool, so a single connection object must never be shared by two requests
+at the same time (see
 https://stackoverflow.com/questions/65169638/mysqlconnector-python-new-db-connection-for-each-query-vs-one-single-connect
+). Instead each request checks out a connection via pooled_connection(), which guarantees the
+connection is returned to the pool (or discarded if it broke) when the block exits.
+
+Writes use pooled_connection(), which connects to the writer. Read-only queries use
+read_connection(), which sends them to a reader instance when DB_READER_HOSTS is set (see
+routing.py). Every instance gets its own pool.
 """
 
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+import logging
 import os
+import threading
 import time
+from typing import Callable, Deque, Dict, Iterator, Optional
 import mysql.connector
 from mysql.connector import errorcode, MySQLConnection
+from ...metrics import observe_connection_acquire
+from ...profiling import CONNECTION, record_span
+from ...types import PoolStats
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+from .routing import Endpoint, read_router
+
+logger = logging.getLogger(__name__)
+
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "10"))
+DB_POOL_MAX_OVERFLOW = int(os.environ.get("DB_POOL_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE = float(os.environ.get("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PING_INTERVAL = float(os.environ.get("DB_POOL_PING_INTERVAL", "30"))
+DB_CONNECT_TIMEOUT = int(os.environ.get("DB_CONNECT_TIMEOUT", "5"))
+DB_CONNECT_MAX_DELAY = float(os.environ.get("DB_CONNECT_MAX_DELAY", "2"))
+
+# Client errors of a connection that could not be opened or broke while a query ran
+CONNECTION_ERRNOS = frozenset(
+    {
+        errorcode.CR_CONNECTION_ERROR,
+        errorcode.CR_CONN_HOST_ERROR,
+        errorcode.CR_SERVER_GONE_ERROR,
+        errorcode.CR_SERVER_LOST,
+        errorcode.CR_SERVER_LOST_EXTENDED,
+    }
+)
+
+# The circuit breaker name of the writer, readers are named by their endpoint
+WRITER = "writer"
+
 
-def connect_to_mysql(attempts: int, delay: int = 2) -> MySQLConnection:
+class PoolTimeoutError(Exception):
+    """Raised when no connection could be checked out of the pool within the timeout."""
+
+
+def connect_to_mysql(endpoint: Optional[Endpoint] = None) -> MySQLConnection:
     """
-    Attempts to establish a connection to a MySQL database.
+    Makes a single attempt to establish a connection to a MySQL database.
 
     Args:
-        attempts (int): The maximum number of attempts to make when connecting to the database.
-        delay (int, optional): The initial delay in seconds between connection attempts.
-            Defaults to 2.
+        endpoint (Optional[Endpoint], optional): The instance to connect to. Defaults to the
+            writer given by DB_HOST and DB_PORT.
 
     Returns:
         mysql.connector.connection: A connection object to the MySQL database.
 
     Raises:
-        mysql.connector.Error: If the connection fails after all attempts.
+        CircuitOpenError: If the circuit breaker of the instance is open.
+        mysql.connector.Error: If the connection fails.
 
     This function uses environment variables to retrieve the database credentials and connection
-    details. It will attempt to connect to the database up to the specified number of attempts,
-    with an exponential backoff delay between each attempt. If a connection cannot be established
-    after all attempts, it will raise a mysql.connector.Error exception.
+    details. The attempt passes through the circuit breaker of the instance, which does the
+    backing off: rather than sleeping on the request thread between attempts, a failed attempt
+    fails the request, and once the breaker opens further requests fail fast.
+
+    Request handlers should not call this directly but use pooled_connection() instead.
+    """
+    breaker = get_circuit_breaker(endpoint.name if endpoint else WRITER)
+    breaker.before_call()
+    try:
+        cnx = mysql.connector.connect(
+            user=os.environ["DB_USER"],
+            password=os.environ["DB_USER_PASSWORD"],
+            host=endpoint.host if endpoint else os.environ["DB_HOST"],
+            database=os.environ["DB_NAME"],
+            port=endpoint.port if endpoint else int(os.environ["DB_PORT"]),
+            connection_timeout=DB_CONNECT_TIMEOUT,
+        )
+    except mysql.connector.Error as err:
+        breaker.record_failure()
+        if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
+            logger.error("Wrong credentials")
+        elif err.errno == errorcode.ER_BAD_DB_ERROR:
+            logger.error("DB does not exist")
+        else:
+            logger.error("Failed to connect to the database: %s", str(err))
+        raise
+    except BaseException:
+        breaker.cancel()
+        raise
+    breaker.record_success()
+    return cnx
+
+
+def record_query_error(name: str, err: mysql.connector.Error) -> None:
+    """
+    Reports a failed query to the circuit breaker of its instance if the connection broke.
+    Errors of the statement itself say nothing about the availability of the instance.
+
+    Args:
+        name (str): The name of the instance, see get_circuit_breaker().
+        err (mysql.connector.Error): The error raised by the query.
+    """
+    if err.errno in CONNECTION_ERRNOS:
+        get_circuit_breaker(name).record_failure()
+
+
+@dataclass
+class _PooledConnection:
+    """
+    Bookkeeping for a connection owned by the pool.
+
+    Attributes:
+        cnx (MySQLConnection): The underlying connection.
+        created_at (float): Monotonic time the connection was opened.
+        last_used_at (float): Monotonic time the connection was last returned to the pool.
+    """
+
+    cnx: MySQLConnection
+    created_at: float
+    last_used_at: float
+
+
+class ConnectionPool:
+    """
+    A bounded, thread-safe pool of MySQL connections.
+
+    The pool keeps up to `size` idle connections around for reuse. When all of them are checked
+    out, up to `max_overflow` additional connections are opened and closed again on return.
+    Once `size + max_overflow` connections are in use, callers wait up to `timeout` seconds for
+    one to be returned before a PoolTimeoutError is raised.
+
+    On checkout, connections older than `recycle` seconds are replaced, and connections that
+    have been idle for longer than `ping_interval` seconds are pinged and replaced if dead.
     """
-    attempt = 1
-    while attempt <= attempts:
+
+    def __init__(
+        self,
+        connect: Callable[[], MySQLConnection],
+        name: str = WRITER,
+        size: int = DB_POOL_SIZE,
+        max_overflow: int = DB_POOL_MAX_OVERFLOW,
+        timeout: float = DB_POOL_TIMEOUT,
+        recycle: float = DB_POOL_RECYCLE,
+        ping_interval: float = DB_POOL_PING_INTERVAL,
+    ) -> None:
+        self._connect = connect
+        self.name = name
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_interval = ping_interval
+
+        self._condition = threading.Condition()
+        self._idle: Deque[_PooledConnection] = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._opened = 0
+
+        self._checkouts = 0
+        self._timeouts = 0
+        self._recycled = 0
+        self._invalidated = 0
+
+    def _open(self) -> _PooledConnection:
+        now = time.monotonic()
+        return _PooledConnection(cnx=self._connect(), created_at=now, last_used_at=now)
+
+    def _close(self, pooled: _PooledConnection) -> None:
         try:
-            return mysql.connector.connect(
-                user=os.environ["DB_USER"],
-                password=os.environ["DB_USER_PASSWORD"],
-                host=os.environ["DB_HOST"],
-                database=os.environ["DB_NAME"],
-                port=int(os.environ["DB_PORT"]),
-            )
-        except mysql.connector.Error as err:
-            if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
-                print("Wrong credentials")
-            elif err.errno == errorcode.ER_BAD_DB_ERROR:
-                print("DB does not exist")
+            pooled.cnx.close()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Error while closing pooled connection: %s", str(e))
+
+    def _is_usable(self, pooled: _PooledConnection) -> bool:
+        now = time.monotonic()
+        if self.recycle >= 0 and now - pooled.created_at > self.recycle:
+            self._recycled += 1
+            return False
+        if now - pooled.last_used_at > self.ping_interval:
+            # is_connected() pings the server
+            if not pooled.cnx.is_connected():
+                self._invalidated += 1
+                return False
+        return True
+
+    def acquire(self) -> MySQLConnection:
+        """
+        Checks a connection out of the pool.
+
+        Returns:
+            MySQLConnection: A healthy connection. It must be handed back via release().
+
+        Raises:
+            PoolTimeoutError: If no connection became available within the pool timeout.
+        """
+        started_at = time.perf_counter()
+        try:
+            return self._acquire()
+        finally:
+            seconds = time.perf_counter() - started_at
+            observe_connection_acquire(self.name, seconds)
+            record_span(CONNECTION, seconds, self.name)
+
+    def _acquire(self) -> MySQLConnection:
+        deadline = time.monotonic() + self.timeout
+        pooled: Optional[_PooledConnection] = None
+        with self._condition:
+            while True:
+                if self._idle:
+                    # LIFO keeps the working set small so surplus connections age out
+                    pooled = self._idle.pop()
+                    break
+                if self._opened < self.size + self.max_overflow:
+                    self._opened += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"No database connection available within {self.timeout}s"
+                    )
+                self._condition.wait(remaining)
+
+        # Health checks and connects happen outside the lock so slow network calls do not block
+        # other threads from returning connections
+        try:
+            if pooled is not None and not self._is_usable(pooled):
+                self._close(pooled)
+                pooled = None
+            if pooled is None:
+                pooled = self._open()
+        except BaseException:
+            with self._condition:
+                self._opened -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._in_use[id(pooled.cnx)] = pooled
+            self._checkouts += 1
+        return pooled.cnx
+
+    def release(self, cnx: MySQLConnection, discard: bool = False) -> None:
+        """
+        Returns a connection to the pool.
+
+        Any transaction left open is rolled back so the next user does not read from a stale
+        snapshot.
+
+        Args:
+            cnx (MySQLConnection): A connection previously obtained via acquire().
+            discard (bool, optional): Close the connection instead of reusing it, e.g. after a
+                connection error. Defaults to False.
+        """
+        with self._condition:
+            pooled = self._in_use.pop(id(cnx), None)
+        if pooled is None:
+            return
+
+        if not discard:
+            try:
+                if cnx.in_transaction:
+                    cnx.rollback()
+            except mysql.connector.Error:
+                discard = True
+
+        with self._condition:
+            if discard or len(self._idle) >= self.size:
+                if discard:
+                    self._invalidated += 1
+                self._opened -= 1
+                to_close: Optional[_PooledConnection] = pooled
             else:
-                print(err)
-            time.sleep(delay**attempt)
-            attempt += 1
-    raise Exception("Failed to connect to the database")
+                pooled.last_used_at = time.monotonic()
+                self._idle.append(pooled)
+                to_close = None
+            self._condition.notify()
+
+        if to_close is not None:
+            self._close(to_close)
+
+    @contextmanager
+    def connection(self) -> Iterator[MySQLConnection]:
+        """
+        Checks out a connection for the duration of a with block.
+
+        The connection is always returned to the pool. If the block raised a database error the
+        connection is discarded rather than reused, and reported to the circuit breaker if it
+        broke.
+
+        Yields:
+            MySQLConnection: A pooled connection.
+        """
+        cnx = self.acquire()
+        discard = False
+        try:
+            yield cnx
+        except mysql.connector.Error as err:
+            discard = True
+            record_query_error(self.name, err)
+            raise
+        finally:
+            self.release(cnx, discard=discard)
+
+    def stats(self) -> PoolStats:
+        """
+        Returns a snapshot of the pool counters.
+
+        Returns:
+            PoolStats: The current pool statistics.
+        """
+        with self._condition:
+            return PoolStats(
+                size=self.size,
+                max_overflow=self.max_overflow,
+                opened=self._opened,
+                idle=len(self._idle),
+                in_use=len(self._in_use),
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                recycled=self._recycled,
+                invalidated=self._invalidated,
+            )
+
+    def close(self) -> None:
+        """
+        Closes all idle connections. Connections currently checked out are closed on return.
+        """
+        with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._opened -= len(idle)
+            self.size = 0
+            self._condition.notify_all()
+        for pooled in idle:
+            self._close(pooled)
+
+
+_pool: Optional[ConnectionPool] = None
+_reader_pools: Dict[Endpoint, ConnectionPool] = {}
+_pool_lock = threading.Lock()
+
+
+def get_pool(endpoint: Optional[Endpoint] = None) -> ConnectionPool:
+    """
+    Returns the process-wide connection pool of an instance, creating it on first use.
+
+    Args:
+        endpoint (Optional[Endpoint], optional): A reader instance. Defaults to the writer.
+
+    Returns:
+        ConnectionPool: The shared connection pool.
+    """
+    global _pool  # pylint: disable=global-statement
+    if endpoint is not None:
+        pool = _reader_pools.get(endpoint)
+        if pool is None:
+            with _pool_lock:
+                pool = _reader_pools.get(endpoint)
+                if pool is None:
+                    pool = ConnectionPool(
+                        connect=lambda: connect_to_mysql(endpoint), name=endpoint.name
+                    )
+                    _reader_pools[endpoint] = pool
+        return pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(connect=connect_to_mysql)
+    return _pool
+
+
+def close_pools() -> None:
+    """
+    Closes the writer pool and all reader pools.
+    """
+    with _pool_lock:
+        pools = list(_reader_pools.values())
+        if _pool is not None:
+            pools.append(_pool)
+    for pool in pools:
+        pool.close()
+
+
+@contextmanager
+def pooled_connection() -> Iterator[MySQLConnection]:
+    """
+    Checks out a connection to the writer for the duration of a with block.
+
+    Yields:
+        MySQLConnection: A pooled connection to the MySQL database.
+    """
+    with get_pool().connection() as cnx:
+        yield cnx
+
+
+def wait_for_database(timeout: float) -> None:
+    """
+    Blocks until a connection to the writer can be opened, e.g. while the database is still
+    starting up. Waits out open circuit breaker periods instead of failing.
+
+    Args:
+        timeout (float): The maximum number of seconds to wait.
+
+    Raises:
+        CircuitOpenError: If the writer is still unavailable after the timeout.
+        Exception: If the connection fails after the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with pooled_connection():
+                return
+        except CircuitOpenError as e:
+            wait = e.retry_after
+            if time.monotonic() + wait > deadline:
+                raise
+        except Exception:  # pylint: disable=broad-exception-caught
+            wait = DB_CONNECT_MAX_DELAY
+            if time.monotonic() + wait > deadline:
+                raise
+        logger.info("Waiting %.1fs for the database to become available", wait)
+        time.sleep(wait)
+
+
+@contextmanager
+def read_connection(scope: str) -> Iterator[MySQLConnection]:
+    """
+    Checks out a connection for read-only queries for the duration of a with block.
+
+    The connection goes to a reader unless the scope was written to recently or no reader is
+    available. A reader that cannot be connected to is taken out of rotation and the read fails
+    over to the writer; so is a reader that drops the connection while the block runs, although
+    the error still propagates to the caller.
+
+    Args:
+        scope (str): The data that is read, a category or routing.GLOBAL_SCOPE.
+
+    Yields:
+        MySQLConnection: A pooled connection to the MySQL database.
+    """
+    reader = read_router.choose_reader(scope)
+    if reader is None:
+        with pooled_connection() as cnx:
+            yield cnx
+        return
+
+    pool = get_pool(reader)
+    try:
+        cnx = pool.acquire()
+    except PoolTimeoutError:
+        raise
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.debug("Failed to connect to reader %s: %s", reader.name, str(e))
+        read_router.mark_down(reader)
+        read_router.record_writer_read()
+        with pooled_connection() as cnx:
+            yield cnx
+        return
+
+    discard = False
+    try:
+        yield cnx
+    except (mysql.connector.InterfaceError, mysql.connector.OperationalError) as err:
+        discard = True
+        read_router.mark_down(reader)
+        record_query_error(reader.name, err)
+        raise
+    except mysql.connector.Error:
+        discard = True
+        raise
+    finally:
+        pool.release(cnx, discard=discard)
+
+
+def get_pool_stats() -> PoolStats:
+    """
+    Returns the statistics of the writer connection pool.
+
+    Returns:
+        PoolStats: The current pool statistics.
+    """
+    return get_pool().stats()
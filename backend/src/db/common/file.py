@@ -17,7 +17,9 @@ IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import json
 import logging
+from typing import Any, Iterator, List
 
 logger = logging.getLogger(__name__)
 
@@ -40,3 +42,135 @@ def read_text_file(path: str, encoding: str = "utf-8") -> str:
     except Exception as e:
         logger.exception("Could not read prefill_articles.json: %s", str(e))
         raise
+
+
+class JsonArrayDecoder:
+    """
+    Incrementally decodes the items of a top-level JSON array from text chunks.
+
+    Only the current item is buffered, so arbitrarily long arrays can be processed with bounded
+    memory. Items are returned as soon as they are complete.
+
+    Example:
+        decoder = JsonArrayDecoder()
+        for chunk in chunks:
+            for item in decoder.feed(chunk):
+                ...
+        decoder.close()
+    """
+
+    def __init__(self, max_item_size: int = 1024 * 1024) -> None:
+        self.max_item_size = max_item_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        self._expect_value = True
+        self._seen_value = False
+
+    def _skip_whitespace(self, pos: int) -> int:
+        while pos < len(self._buffer) and self._buffer[pos] in " \t\r\n":
+            pos += 1
+        return pos
+
+    def _decode(self, final: bool) -> List[Any]:
+        items: List[Any] = []
+        pos = 0
+        while True:
+            pos = self._skip_whitespace(pos)
+            if pos >= len(self._buffer):
+                break
+            char = self._buffer[pos]
+            if self._finished:
+                raise ValueError(f"Unexpected data after the JSON array: '{char}'")
+            if not self._started:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                pos += 1
+            elif char == "]" and (not self._expect_value or not self._seen_value):
+                self._finished = True
+                pos += 1
+            elif char == ",":
+                if self._expect_value:
+                    raise ValueError("Unexpected ',' in JSON array")
+                self._expect_value = True
+                pos += 1
+            elif not self._expect_value:
+                raise ValueError(f"Expected ',' or ']' in JSON array, got '{char}'")
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(self._buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # A number at the end of the buffer may continue in the next chunk
+                if end >= len(self._buffer) and not final:
+                    break
+                if end - pos > self.max_item_size:
+                    raise ValueError(f"JSON array item exceeds {self.max_item_size} characters")
+                items.append(item)
+                self._expect_value = False
+                self._seen_value = True
+                pos = end
+        self._buffer = self._buffer[pos:]
+        if len(self._buffer) > self.max_item_size:
+            raise ValueError(f"JSON array item exceeds {self.max_item_size} characters")
+        return items
+
+    def feed(self, text: str) -> List[Any]:
+        """
+        Adds the next chunk of the document.
+
+        Args:
+            text (str): The chunk.
+
+        Returns:
+            List[Any]: The items completed by this chunk.
+
+        Raises:
+            ValueError: If the document is not a well-formed JSON array.
+        """
+        self._buffer += text
+        return self._decode(final=False)
+
+    def close(self) -> List[Any]:
+        """
+        Signals the end of the document.
+
+        Returns:
+            List[Any]: The items completed by the end of the document.
+
+        Raises:
+            ValueError: If the document ended before the array was closed.
+        """
+        items = self._decode(final=True)
+        if not self._finished:
+            raise ValueError("Unexpected end of JSON array")
+        return items
+
+
+def iter_json_array_file(
+    path: str, encoding: str = "utf-8", chunk_size: int = 64 * 1024
+) -> Iterator[Any]:
+    """
+    Streams the items of a file containing a JSON array.
+
+    Args:
+        path (str): The path of the file.
+        encoding (str, optional): The file encoding. Defaults to "utf-8".
+        chunk_size (int, optional): The number of characters to read at a time.
+            Defaults to 64 KiB.
+
+    Yields:
+        Any: The decoded array items.
+    """
+    decoder = JsonArrayDecoder()
+    with open(file=path, mode="r", encoding=encoding) as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield from decoder.feed(chunk)
+    yield from decoder.close()
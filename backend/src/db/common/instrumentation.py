@@ -0,0 +1,184 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Timed execution of the SQL statements of the data-access layer.
+
+Statements are loaded with read_sql_file(), which remembers the name of the file each one came
+from. The execute and fetch helpers below run a statement on a sync or async cursor and record
+its duration and row count under that name (see metrics.py), add it to the trace of a profiled
+request (see profiling.py) and log it with its parameters if it took at least
+SLOW_QUERY_SECONDS.
+"""
+
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from ...metrics import observe_query
+from ...profiling import SQL, record_span
+from .file import read_text_file
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_SECONDS = float(os.environ.get("SLOW_QUERY_SECONDS", "0.5"))
+# Parameters can hold whole article texts, the slow query log shortens them
+SLOW_QUERY_MAX_PARAM_LENGTH = 200
+
+UNNAMED_QUERY = "unnamed"
+
+_query_names: Dict[str, str] = {}
+
+
+def read_sql_file(path: str) -> str:
+    """
+    Reads a SQL statement from a file and registers the file name as the name of the statement.
+
+    Args:
+        path (str): The path of the SQL file.
+
+    Returns:
+        str: The SQL statement.
+    """
+    sql = read_text_file(path=path)
+    register_query_name(sql, os.path.basename(path))
+    return sql
+
+
+def register_query_name(sql: str, name: str) -> None:
+    """
+    Registers the name of a statement that was not read with read_sql_file(), e.g. one
+    rendered from a template.
+
+    Args:
+        sql (str): The SQL statement.
+        name (str): The name to record the statement under.
+    """
+    _query_names[sql] = name
+
+
+def query_name(sql: str) -> str:
+    """
+    Returns the name of a statement loaded with read_sql_file().
+
+    Args:
+        sql (str): The SQL statement.
+
+    Returns:
+        str: The file name of the statement, or UNNAMED_QUERY.
+    """
+    return _query_names.get(sql, UNNAMED_QUERY)
+
+
+def _shorten(value: Any) -> Any:
+    if isinstance(value, str) and len(value) > SLOW_QUERY_MAX_PARAM_LENGTH:
+        return value[:SLOW_QUERY_MAX_PARAM_LENGTH] + "..."
+    return value
+
+
+def _observe(
+    sql: str, params: Optional[Sequence], seconds: float, rows: Optional[int] = None
+) -> None:
+    name = query_name(sql)
+    observe_query(name, seconds, rows)
+    record_span(SQL, seconds, name)
+    if seconds >= SLOW_QUERY_SECONDS:
+        # The parameters of executemany() batches are not logged
+        logged_params = None if params is None else [_shorten(value) for value in params]
+        logger.warning(
+            "Slow query %s took %.3fs",
+            name,
+            seconds,
+            extra={"query": name, "params": logged_params, "seconds": seconds, "rows": rows},
+        )
+
+
+def execute(cursor: Any, sql: str, params: Sequence = ()) -> None:
+    """
+    Executes a statement that returns no rows.
+
+    Args:
+        cursor (Any): A mysql-connector cursor.
+        sql (str): The SQL statement.
+        params (Sequence, optional): The statement parameters. Defaults to ().
+    """
+    started_at = time.perf_counter()
+    cursor.execute(sql, params)
+    _observe(sql, params, time.perf_counter() - started_at)
+
+
+def execute_many(cursor: Any, sql: str, seq_params: Iterable[Sequence]) -> None:
+    """
+    Executes a statement once for every set of parameters.
+
+    Args:
+        cursor (Any): A mysql-connector cursor.
+        sql (str): The SQL statement.
+        seq_params (Iterable[Sequence]): The parameters of each execution.
+    """
+    started_at = time.perf_counter()
+    cursor.executemany(sql, seq_params)
+    _observe(sql, None, time.perf_counter() - started_at)
+
+
+def fetch_all(cursor: Any, sql: str, params: Sequence = ()) -> List[Sequence]:
+    """
+    Executes a query and fetches all of its rows.
+
+    Args:
+        cursor (Any): A mysql-connector cursor.
+        sql (str): The SQL statement.
+        params (Sequence, optional): The statement parameters. Defaults to ().
+
+    Returns:
+        List[Sequence]: The rows.
+    """
+    started_at = time.perf_counter()
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+    _observe(sql, params, time.perf_counter() - started_at, len(rows))
+    return rows
+
+
+async def aexecute(cursor: Any, sql: str, params: Sequence = ()) -> None:
+    """
+    Async variant of execute() for aiomysql cursors.
+    """
+    started_at = time.perf_counter()
+    await cursor.execute(sql, params)
+    _observe(sql, params, time.perf_counter() - started_at)
+
+
+async def aexecute_many(cursor: Any, sql: str, seq_params: Iterable[Sequence]) -> None:
+    """
+    Async variant of execute_many() for aiomysql cursors.
+    """
+    started_at = time.perf_counter()
+    await cursor.executemany(sql, seq_params)
+    _observe(sql, None, time.perf_counter() - started_at)
+
+
+async def afetch_all(cursor: Any, sql: str, params: Sequence = ()) -> List[Sequence]:
+    """
+    Async variant of fetch_all() for aiomysql cursors.
+    """
+    started_at = time.perf_counter()
+    await cursor.execute(sql, params)
+    rows = await cursor.fetchall()
+    _observe(sql, params, time.perf_counter() - started_at, len(rows))
+    return rows
@@ -0,0 +1,223 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+---
+
+Routing of read queries between the writer and the reader instances of the database cluster.
+
+The writer is configured through DB_HOST and DB_PORT as before. Readers are listed in
+DB_READER_HOSTS as comma-separated `host[:port][=weight]` entries, e.g.
+`reader-1.example.com=2,reader-2.example.com:3307`; the port defaults to DB_PORT and the
+weight to 1. Without readers every query goes to the writer.
+
+Replicas apply the writes of the writer with a small lag. To let clients read their own writes,
+a category is pinned to the writer for DB_READ_AFTER_WRITE_WINDOW seconds after an article was
+added to it. The top stories span all categories and are pinned after any write. This also keeps
+the article cache from being refilled with rows read from a reader that is still behind.
+
+A reader that fails to connect is taken out of rotation for DB_READER_RETRY_AFTER seconds and
+its reads fail over to the other readers, or to the writer once none is left.
+"""
+
+from dataclasses import dataclass
+import logging
+import os
+import random
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+from ...types import ReadRoutingStats, ReaderStats
+
+logger = logging.getLogger(__name__)
+
+DB_READER_HOSTS = os.environ.get("DB_READER_HOSTS", "")
+DB_READ_AFTER_WRITE_WINDOW = float(os.environ.get("DB_READ_AFTER_WRITE_WINDOW", "5"))
+DB_READER_RETRY_AFTER = float(os.environ.get("DB_READER_RETRY_AFTER", "30"))
+
+GLOBAL_SCOPE = "*"
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """
+    A database instance to connect to.
+
+    Attributes:
+        host (str): The host name of the instance.
+        port (int): The port of the instance.
+        weight (int): The relative share of reads sent to the instance.
+    """
+
+    host: str
+    port: int
+    weight: int = 1
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the `host:port` name of the endpoint.
+        """
+        return f"{self.host}:{self.port}"
+
+
+def parse_endpoints(value: str, default_port: int) -> List[Endpoint]:
+    """
+    Parses a comma-separated list of `host[:port][=weight]` entries.
+
+    Args:
+        value (str): The list of endpoints.
+        default_port (int): The port of entries that do not specify one.
+
+    Returns:
+        List[Endpoint]: The parsed endpoints, in order.
+
+    Raises:
+        ValueError: If an entry is malformed or has a weight below 1.
+    """
+    endpoints = []
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        address, _, weight = entry.partition("=")
+        host, _, port = address.partition(":")
+        if not host:
+            raise ValueError(f"Missing host in database endpoint '{entry}'")
+        endpoint = Endpoint(
+            host=host,
+            port=int(port) if port else default_port,
+            weight=int(weight) if weight else 1,
+        )
+        if endpoint.weight < 1:
+            raise ValueError(f"Weight of database endpoint '{entry}' must be at least 1")
+        endpoints.append(endpoint)
+    return endpoints
+
+
+class ReadRouter:
+    """
+    Picks the instance a read query is sent to.
+    """
+
+    def __init__(
+        self,
+        readers: Iterable[Endpoint],
+        sticky_window: float = DB_READ_AFTER_WRITE_WINDOW,
+        retry_after: float = DB_READER_RETRY_AFTER,
+    ) -> None:
+        self.readers = list(readers)
+        self.sticky_window = sticky_window
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._random = random.Random()
+        self._last_write: Dict[str, float] = {}
+        self._down_until: Dict[Endpoint, float] = {}
+        self._reads: Dict[Endpoint, int] = {reader: 0 for reader in self.readers}
+        self._writer_reads = 0
+        self._sticky_reads = 0
+        self._failovers = 0
+
+    def record_write(self, scope: str) -> None:
+        """
+        Pins the reads of a scope, and of the global scope, to the writer for the sticky window.
+
+        Args:
+            scope (str): The scope that was written to, usually a category.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._last_write[scope] = now
+            self._last_write[GLOBAL_SCOPE] = now
+
+    def choose_reader(self, scope: str = GLOBAL_SCOPE) -> Optional[Endpoint]:
+        """
+        Picks a healthy reader for a read of the given scope, weighted at random.
+
+        Args:
+            scope (str, optional): The scope that is read, usually a category. Defaults to the
+                global scope.
+
+        Returns:
+            Optional[Endpoint]: The reader to query, or None if the read must go to the writer.
+        """
+        if not self.readers:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            last_write = self._last_write.get(scope)
+            if last_write is not None and now - last_write < self.sticky_window:
+                self._sticky_reads += 1
+                self._writer_reads += 1
+                return None
+            healthy = [r for r in self.readers if self._down_until.get(r, 0) <= now]
+            if not healthy:
+                self._writer_reads += 1
+                return None
+            reader = self._random.choices(healthy, weights=[r.weight for r in healthy])[0]
+            self._reads[reader] += 1
+            return reader
+
+    def mark_down(self, reader: Endpoint) -> None:
+        """
+        Takes a reader out of rotation for the retry period after it failed.
+
+        Args:
+            reader (Endpoint): The reader that failed.
+        """
+        with self._lock:
+            self._down_until[reader] = time.monotonic() + self.retry_after
+            self._failovers += 1
+        logger.warning(
+            "Database reader %s is unavailable, retrying in %.0fs", reader.name, self.retry_after
+        )
+
+    def record_writer_read(self) -> None:
+        """
+        Counts a read that failed over to the writer after the chosen reader failed.
+        """
+        with self._lock:
+            self._writer_reads += 1
+
+    def stats(self) -> ReadRoutingStats:
+        """
+        Returns a snapshot of the routing counters.
+
+        Returns:
+            ReadRoutingStats: The current routing statistics.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return ReadRoutingStats(
+                readers=[
+                    ReaderStats(
+                        name=reader.name,
+                        weight=reader.weight,
+                        healthy=self._down_until.get(reader, 0) <= now,
+                        reads=self._reads[reader],
+                    )
+                    for reader in self.readers
+                ],
+                writer_reads=self._writer_reads,
+                sticky_reads=self._sticky_reads,
+                failovers=self._failovers,
+            )
+
+
+read_router = ReadRouter(
+    parse_endpoints(DB_READER_HOSTS, default_port=int(os.environ.get("DB_PORT", "3306")))
+)
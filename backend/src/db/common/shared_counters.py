@@ -0,0 +1,152 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Version counters shared by the worker processes of one host through a memory-mapped file.
+
+The serving supervisor (python -m src.serve) creates the file in a directory it passes to its
+workers in SHARED_STATE_DIR. Every named counter occupies a fixed slot holding its value and
+the Unix timestamp of its last increment. Increments and reads take an flock on the file, so a
+worker never sees a value without its timestamp. An flock belongs to the open file, which all
+threads of a worker share, so a thread lock keeps the threads of a worker apart as well.
+Without SHARED_STATE_DIR every process keeps its own counters.
+"""
+
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+from typing import Dict, Optional, Sequence, Tuple
+
+SHARED_STATE_DIR = os.environ.get("SHARED_STATE_DIR", "")
+
+COUNTERS_FILE_NAME = "counters"
+
+# boot id (8 ASCII characters) and creation time
+_HEADER = struct.Struct("<8sd")
+# value and time of the last increment
+_SLOT = struct.Struct("<qd")
+
+
+class SharedCounters:
+    """
+    A fixed set of named counters in a memory-mapped file shared between processes.
+
+    Attributes:
+        boot_id (str): A random id chosen when the file was created, the same in every process.
+        created_at (float): The Unix timestamp of the creation of the file.
+    """
+
+    def __init__(self, path: str, names: Sequence[str]) -> None:
+        """
+        Maps an existing counters file.
+
+        Args:
+            path (str): The path of the file, as created by create().
+            names (Sequence[str]): The counter names, in the order passed to create().
+        """
+        self.path = path
+        self._offsets = {
+            name: _HEADER.size + index * _SLOT.size for index, name in enumerate(names)
+        }
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR)
+        self._map = mmap.mmap(self._fd, _HEADER.size + len(names) * _SLOT.size)
+        boot_id, self.created_at = _HEADER.unpack_from(self._map, 0)
+        self.boot_id = boot_id.decode("ascii")
+
+    @classmethod
+    def create(cls, path: str, names: Sequence[str]) -> "SharedCounters":
+        """
+        Creates a counters file with all counters at 0 and maps it.
+
+        Args:
+            path (str): The path of the file.
+            names (Sequence[str]): The counter names.
+
+        Returns:
+            SharedCounters: The mapped counters.
+        """
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(uuid.uuid4().hex[:8].encode("ascii"), time.time()))
+            file.write(bytes(len(names) * _SLOT.size))
+        return cls(path, names)
+
+    def increment(self, name: str) -> Tuple[int, float]:
+        """
+        Increments a counter and records the time.
+
+        Args:
+            name (str): The counter name.
+
+        Returns:
+            Tuple[int, float]: The new value and the time of the increment.
+        """
+        offset = self._offsets[name]
+        now = time.time()
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                value = _SLOT.unpack_from(self._map, offset)[0] + 1
+                _SLOT.pack_into(self._map, offset, value, now)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return value, now
+
+    def snapshot(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Reads all counters.
+
+        Returns:
+            Dict[str, Tuple[int, float]]: The value and time of the last increment of every
+                counter, 0.0 if it was never incremented.
+        """
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_SH)
+            try:
+                return {
+                    name: _SLOT.unpack_from(self._map, offset)
+                    for name, offset in self._offsets.items()
+                }
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """
+        Unmaps the file.
+        """
+        self._map.close()
+        os.close(self._fd)
+
+
+def open_shared_counters(names: Sequence[str]) -> Optional[SharedCounters]:
+    """
+    Maps the counters file of the serving supervisor, if this process is one of its workers.
+
+    Args:
+        names (Sequence[str]): The counter names.
+
+    Returns:
+        Optional[SharedCounters]: The counters, None if SHARED_STATE_DIR is not set.
+    """
+    if not SHARED_STATE_DIR:
+        return None
+    return SharedCounters(os.path.join(SHARED_STATE_DIR, COUNTERS_FILE_NAME), names)
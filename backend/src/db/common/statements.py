@@ -0,0 +1,227 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Registry of the SQL statements of the application and server-side prepared statements.
+
+The statements of the api and setup sql directories are loaded and validated once, when this
+module is imported, so a broken file fails the startup instead of the first request using it.
+A file can be a template with {part} markers, e.g. for the select list, which render() fills
+in. Every rendering is validated and kept, so it is a registered statement as well.
+
+Hot read queries are executed as server-side prepared statements via statement_cursor(). The
+server parses them once per connection and later executions only send the statement id and the
+binary encoded parameters. Every pooled connection keeps its prepared cursors, one per
+statement, for as long as it lives, up to DB_PREPARED_STATEMENTS_PER_CONNECTION of them.
+aiomysql has no support for prepared statements, the async data-access layer keeps sending the
+statement text.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import logging
+import os
+import re
+from typing import Any, Dict, Iterator, List, Set, Tuple
+from weakref import WeakKeyDictionary
+from .instrumentation import read_sql_file, register_query_name
+
+logger = logging.getLogger(__name__)
+
+DB_PREPARED_STATEMENTS = os.environ.get("DB_PREPARED_STATEMENTS", "true").lower() == "true"
+# The least recently used prepared statement of a connection is closed beyond this number, which
+# keeps the server-wide max_prepared_stmt_count in reach of many pooled connections
+DB_PREPARED_STATEMENTS_PER_CONNECTION = int(
+    os.environ.get("DB_PREPARED_STATEMENTS_PER_CONNECTION", "32")
+)
+
+DB_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Placeholders other than %s, e.g. pyformat or qmark style
+_UNSUPPORTED_PLACEHOLDER = re.compile(r"%\(|%[^s%]|\?")
+_TEMPLATE_PART = re.compile(r"\{(\w+)\}")
+
+_registered: Set[str] = set()
+_prepared_cursors: "WeakKeyDictionary[Any, OrderedDict[str, Any]]" = WeakKeyDictionary()
+
+
+class InvalidStatementError(ValueError):
+    """
+    Raised when a SQL file does not hold a single statement with %s placeholders.
+    """
+
+
+def validate_statement(name: str, sql: str) -> None:
+    """
+    Checks that a SQL file holds exactly one statement which uses %s placeholders only.
+
+    Args:
+        name (str): The file name of the statement.
+        sql (str): The SQL statement.
+
+    Raises:
+        InvalidStatementError: If the statement is invalid.
+    """
+    body = sql.strip().rstrip(";").strip()
+    if not body:
+        raise InvalidStatementError(f"{name} is empty")
+    if ";" in body:
+        raise InvalidStatementError(f"{name} holds more than one statement")
+    if _UNSUPPORTED_PLACEHOLDER.search(body):
+        raise InvalidStatementError(f"{name} uses a placeholder other than %s")
+
+
+class StatementRegistry:
+    """
+    The SQL statements and statement templates of one sql directory, keyed by file name.
+
+    Lookups and renderings return the same string object every time, which the prepared cursors
+    rely on to recognize a statement they already prepared.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._statements: Dict[str, str] = {}
+        self._templates: Dict[str, str] = {}
+        self._rendered: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], str] = {}
+        for file_name in sorted(os.listdir(path)):
+            if not file_name.endswith(".sql"):
+                continue
+            sql = read_sql_file(path=os.path.join(path, file_name))
+            parts = set(_TEMPLATE_PART.findall(sql))
+            if parts:
+                validate_statement(file_name, self._fill(sql, {part: "1" for part in parts}))
+                self._templates[file_name] = sql
+                continue
+            validate_statement(file_name, sql)
+            self._statements[file_name] = sql
+            _registered.add(sql)
+        logger.debug(
+            "Loaded %d SQL statements and %d templates from %s",
+            len(self._statements),
+            len(self._templates),
+            path,
+        )
+
+    def __getitem__(self, name: str) -> str:
+        try:
+            return self._statements[name]
+        except KeyError:
+            if name in self._templates:
+                raise KeyError(f"SQL statement {name} is a template, use render()") from None
+            raise KeyError(f"No SQL statement {name} in {self.path}") from None
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._statements or name in self._templates
+
+    @staticmethod
+    def _fill(template: str, parts: Dict[str, str]) -> str:
+        return _TEMPLATE_PART.sub(lambda match: parts[match.group(1)], template)
+
+    def render(self, name: str, **parts: str) -> str:
+        """
+        Renders a statement template.
+
+        Args:
+            name (str): The file name of the template.
+            **parts (str): The SQL for every {part} marker of the template.
+
+        Returns:
+            str: The statement, registered under the file name of the template.
+
+        Raises:
+            KeyError: If there is no such template.
+            InvalidStatementError: If the rendered statement is invalid.
+        """
+        key = (name, tuple(sorted(parts.items())))
+        sql = self._rendered.get(key)
+        if sql is not None:
+            return sql
+        try:
+            template = self._templates[name]
+        except KeyError:
+            raise KeyError(f"No SQL statement template {name} in {self.path}") from None
+        missing = set(_TEMPLATE_PART.findall(template)) - set(parts)
+        if missing:
+            raise KeyError(f"No SQL for {', '.join(sorted(missing))} of {name}")
+        sql = self._fill(template, parts)
+        validate_statement(name, sql)
+        register_query_name(sql, name)
+        _registered.add(sql)
+        # Concurrent first renderings agree on one string object
+        return self._rendered.setdefault(key, sql)
+
+    def names(self) -> List[str]:
+        """
+        Returns the file names of all statements.
+
+        Returns:
+            List[str]: The file names in alphabetical order.
+        """
+        return sorted(list(self._statements) + list(self._templates))
+
+
+api_statements = StatementRegistry(os.path.join(DB_PATH, "api", "sql"))
+setup_statements = StatementRegistry(os.path.join(DB_PATH, "setup", "sql"))
+
+
+@contextmanager
+def statement_cursor(cnx: Any, sql: str) -> Iterator[Any]:
+    """
+    Provides a cursor for executing a statement on a mysql-connector connection.
+
+    For registered statements this is the prepared cursor the connection keeps for the
+    statement, created and prepared on first use. Other statements, or all of them with
+    DB_PREPARED_STATEMENTS disabled, get a regular cursor for the duration of the with block.
+
+    Args:
+        cnx (Any): A pooled mysql-connector connection.
+        sql (str): The SQL statement that will be executed on the cursor.
+
+    Yields:
+        Any: The cursor.
+    """
+    if not DB_PREPARED_STATEMENTS or sql not in _registered:
+        with cnx.cursor() as cursor:
+            yield cursor
+        return
+    cursors = _prepared_cursors.get(cnx)
+    if cursors is None:
+        cursors = _prepared_cursors[cnx] = OrderedDict()
+    cursor = cursors.get(sql)
+    if cursor is None:
+        cursor = cursors[sql] = cnx.cursor(prepared=True)
+        while len(cursors) > DB_PREPARED_STATEMENTS_PER_CONNECTION:
+            _close_cursor(cursors.popitem(last=False)[1])
+    else:
+        cursors.move_to_end(sql)
+    try:
+        yield cursor
+    except BaseException:
+        # The statement may be left half executed, it is prepared again on the next use
+        del cursors[sql]
+        _close_cursor(cursor)
+        raise
+
+
+def _close_cursor(cursor: Any) -> None:
+    # Closing a prepared cursor deallocates the statement on the server
+    try:
+        cursor.close()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.debug("Error while closing prepared cursor: %s", str(e))
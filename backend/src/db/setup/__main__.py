@@ -0,0 +1,60 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+One-shot database bootstrap, run as a separate task before or while a new version of the API
+rolls out, so the API containers can start with DB_STARTUP_MODE=verify:
+
+    python -m src.db.setup            creates, migrates and prefills the schema
+    python -m src.db.setup --check    exits with 1 if the schema is not current
+
+The connection settings are the DB_* environment variables of the API.
+"""
+
+import argparse
+import sys
+from ...structured_logging import configure_logging
+from ..common.connection import close_pools, wait_for_database
+from .main import DB_STARTUP_TIMEOUT, init_db, schema_is_current
+
+
+def main() -> int:
+    """
+    Runs the bootstrap.
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Bootstrap the database schema")
+    parser.add_argument(
+        "--check", action="store_true", help="Only check whether the schema is current"
+    )
+    args = parser.parse_args()
+    configure_logging()
+    try:
+        if args.check:
+            wait_for_database(DB_STARTUP_TIMEOUT)
+            return 0 if schema_is_current() else 1
+        init_db()
+        return 0
+    finally:
+        close_pools()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,20 +21,47 @@ from datetime import datetime, timedelta
 import json
 import logging
 import os
-from typing import Annotated, List
+import time
+from typing import Annotated, Iterator, List, Tuple
 import mysql.connector
-from mysql.connector import errorcode
+from mysql.connector import errorcode, MySQLConnection
 from pydantic import BaseModel, Field
-from ..common.connection import connect_to_mysql
-from ..common.file import read_text_file
+from ..common.connection import pooled_connection, wait_for_database
+from ..common.file import iter_json_array_file
+from ..common.statements import setup_statements
+from ..api.main import LATEST_ARTICLES_DEPTH, article_to_row
 from ...types import Agency, Article, Author, Category, Text, Title
+from .migrations import SCHEMA_VERSION, get_schema_version, run_migrations, schema_lock
 
 logger = logging.getLogger(__name__)
 
-# In contrast to the API SQL statements which are reused constantly during the runtime of the
-# application, the setup SQL statements are running once and therefore do not need to be kept
-# in memory
-SQL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sql")
+PREFILL_BATCH_SIZE = int(os.environ.get("PREFILL_BATCH_SIZE", "500"))
+# How long to wait for the database to accept connections, e.g. while its container starts
+DB_STARTUP_TIMEOUT = float(os.environ.get("DB_STARTUP_TIMEOUT", "60"))
+# How often to check the schema again while it is not current, e.g. until the bootstrap task
+# has finished migrating
+DB_STARTUP_RETRY_INTERVAL = float(os.environ.get("DB_STARTUP_RETRY_INTERVAL", "5"))
+
+# What the API process does with the database when it starts:
+# "verify" only checks that the schema version is current and leaves bootstrapping to a
+# separate one-shot task (python -m src.db.setup), "bootstrap" always runs init_db(), and
+# "auto" verifies and bootstraps only when the schema is missing or outdated
+DB_STARTUP_MODES = ("auto", "verify", "bootstrap")
+DB_STARTUP_MODE = os.environ.get("DB_STARTUP_MODE", "auto").lower()
+if DB_STARTUP_MODE not in DB_STARTUP_MODES:
+    raise ValueError(
+        f"Unsupported DB_STARTUP_MODE '{DB_STARTUP_MODE}', expected one of "
+        + ", ".join(DB_STARTUP_MODES)
+    )
+
+CATEGORIES: List[Category] = [
+    "Mathematics",
+    "Physics",
+    "Chemistry",
+    "Medicine",
+    "Biology",
+    "IT",
+]
 
 
 class ArticlePrefillData(BaseModel):
@@ -59,90 +86,78 @@ class ArticlePrefillData(BaseModel):
     timedelta: Annotated[int, Field(strict=True, ge=3, le=15)]
 
 
-def create_tables() -> None:
+def create_tables(cnx: MySQLConnection) -> None:
     """
-    Creates the 'categories' and 'articles' tables in the MySQL database.
+    Creates the 'schema_migrations', 'categories', 'articles' and 'latest_articles' tables in the
+    MySQL database.
+
+    New tables are created with the current schema, tables created by earlier versions are
+    brought up to date by run_migrations().
+
+    Args:
+        cnx (MySQLConnection): The connection to use.
     """
-    cnx = connect_to_mysql(attempts=3)
     create_table_statements = {
-        "categores": read_text_file(
-            path=os.path.join(SQL_PATH, "create_table_categories.sql")
-        ),
-        "articles": read_text_file(
-            path=os.path.join(SQL_PATH, "create_table_articles.sql")
-        ),
+        "schema_migrations": setup_statements["create_table_schema_migrations.sql"],
+        "categores": setup_statements["create_table_categories.sql"],
+        "articles": setup_statements["create_table_articles.sql"],
+        "latest_articles": setup_statements["create_table_latest_articles.sql"],
     }
     with cnx.cursor() as cursor:
         for name, description in create_table_statements.items():
             try:
-                print(f"Creating table {name}: ", end="")
                 cursor.execute(description)
             except mysql.connector.Error as err:
                 if err.errno == errorcode.ER_TABLE_EXISTS_ERROR:
-                    print("already exists.")
+                    logger.info("Creating table %s: already exists", name)
                 else:
-                    print(err.msg)
+                    logger.error("Creating table %s: %s", name, err.msg)
             else:
-                print("OK")
+                logger.info("Creating table %s: OK", name)
 
 
-def upsert_categories() -> None:
+def upsert_categories(cnx: MySQLConnection) -> None:
     """
     Inserts or updates a predefined set of categories in the 'categories' table.
-    """
-    cnx = connect_to_mysql(attempts=3)
-    categories: List[Category] = [
-        "Mathematics",
-        "Physics",
-        "Chemistry",
-        "Medicine",
-        "Biology",
-        "IT",
-    ]
-    sql = read_text_file(path=os.path.join(SQL_PATH, "upsert_category.sql"))
-    for category in categories:
-        with cnx.cursor() as cursor:
-            cursor.execute(
-                sql,
-                (category,),
-            )
-            cnx.commit()
 
+    All categories are sent as one multi-row INSERT and committed once.
 
-def get_prefill_articles() -> List[Article]:
+    Args:
+        cnx (MySQLConnection): The connection to use.
     """
-    Reads and parses article data from the prefill_articles.json file to create Article objects.
+    sql = setup_statements["upsert_category.sql"]
+    with cnx.cursor() as cursor:
+        # executemany() rewrites the INSERT into a single multi-row statement
+        cursor.executemany(sql, [(category,) for category in CATEGORIES])
+    cnx.commit()
 
-    This function:
-    1. Locates and reads the prefill_articles.json file from the same directory as the source file
-    2. Parses the JSON data into ArticlePrefillData objects
-    3. Converts the ArticlePrefillData objects into Article objects, calculating dates based on
-       the timedelta values
 
-    Returns:
-        List[Article]: A list of Article objects created from the prefill data
+def iter_prefill_articles() -> Iterator[Article]:
     """
+    Streams the article data from the prefill_articles.json file as Article objects.
 
-    file_text = read_text_file(
-        path=os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "prefill_articles.json"
-        )
-    )
-    articles_data = json.loads(file_text)
+    This function:
+    1. Reads the prefill_articles.json file from the same directory as the source file item by
+       item, so the whole corpus never has to be held in memory
+    2. Converts each item into an Article object, calculating its date based on the timedelta
+       value
 
-    articles: List[Article] = []
-    for article_data in articles_data:
+    Yields:
+        Article: The Article objects created from the prefill data
+    """
+    today = datetime.today()
+    for article_data in iter_json_array_file(
+        path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "prefill_articles.json")
+    ):
         try:
-            articles.append(
-                Article(
-                    title=article_data["title"],
-                    date=datetime.today() - timedelta(days=article_data["timedelta"]),
-                    author=article_data["author"],
-                    text=article_data["text"],
-                    agency=article_data["agency"],
-                    category=article_data["category"],
-                    user_submitted=0,
-                )
+            yield Article(
+                title=article_data["title"],
+                date=today - timedelta(days=article_data["timedelta"]),
+                author=article_data["author"],
+                text=article_data["text"],
+                agency=article_data["agency"],
+                category=article_data["category"],
+                user_submitted=0,
             )
         except Exception as e:
             logger.exception(
@@ -150,58 +165,159 @@ def get_prefill_articles() -> List[Article]:
             )
             raise
 
-    return articles
 
-
-def prefill_articles() -> None:
+def prefill_articles(cnx: MySQLConnection, batch_size: int = PREFILL_BATCH_SIZE) -> int:
     """
     Prefills the database with a set of predefined articles.
 
-    This function inserts a list of predefined Article objects into the database table 'articles'.
-    If the table is empty, it inserts all the articles. If the table already contains articles,
-    it updates the existing articles with the new data.
+    If the 'articles' table is empty, the predefined articles are inserted in multi-row batches
+    of batch_size articles. All batches and the recount of the category counters run in a
+    single transaction, so a failed prefill leaves the table empty and is retried on the next
+    start.
+
+    Args:
+        cnx (MySQLConnection): The connection to use.
+        batch_size (int, optional): The number of articles per INSERT statement.
+            Defaults to PREFILL_BATCH_SIZE.
+
+    Returns:
+        int: The number of inserted articles.
     """
-    cnx = connect_to_mysql(attempts=3)
-    select_count_articles_sql = read_text_file(
-        path=os.path.join(SQL_PATH, "select_count_articles.sql")
-    )
-    insert_article_sql = read_text_file(
-        path=os.path.join(SQL_PATH, "insert_article.sql")
-    )
+    select_count_articles_sql = setup_statements["select_count_articles.sql"]
+    insert_article_sql = setup_statements["insert_article.sql"]
+    reconcile_category_counts_sql = setup_statements["reconcile_category_counts.sql"]
 
     with cnx.cursor() as cursor:
         # get number of rows in articles table, store in variable
         cursor.execute(select_count_articles_sql)
         num_rows: int = cursor.fetchone()[0]
-
-        if num_rows == 0:
-            for article in get_prefill_articles():
-                cursor.execute(
-                    insert_article_sql,
-                    (
-                        article.title,
-                        article.date,
-                        article.author,
-                        article.text,
-                        article.agency,
-                        article.category,
-                        article.user_submitted,
-                    ),
-                )
+        if num_rows != 0:
             cnx.commit()
+            return 0
+
+        started_at = time.perf_counter()
+        inserted = 0
+        batch: List[Tuple] = []
+        for article in iter_prefill_articles():
+            batch.append(article_to_row(article))
+            if len(batch) >= batch_size:
+                cursor.executemany(insert_article_sql, batch)
+                inserted += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(insert_article_sql, batch)
+            inserted += len(batch)
+        cursor.execute(reconcile_category_counts_sql)
+        cnx.commit()
+
+    elapsed = time.perf_counter() - started_at
+    logger.info(
+        "Prefilled %d articles in %.3fs (%.0f rows/s)",
+        inserted,
+        elapsed,
+        inserted / elapsed if elapsed > 0 else 0,
+    )
+    return inserted
+
+
+def reconcile_category_counts(cnx: MySQLConnection) -> None:
+    """
+    Recounts the articles of every category into 'categories.article_count'.
+
+    add_article() keeps the counters up to date transactionally. This corrects any drift, e.g.
+    from rows written by other tools, and fills the column after it was added to an existing
+    table.
+
+    Args:
+        cnx (MySQLConnection): The connection to use.
+    """
+    sql = setup_statements["reconcile_category_counts.sql"]
+    with cnx.cursor() as cursor:
+        cursor.execute(sql)
+    cnx.commit()
+
+
+def rebuild_latest_articles(cnx: MySQLConnection) -> None:
+    """
+    Rebuilds the 'latest_articles' table, which holds the ids of the LATEST_ARTICLES_DEPTH
+    newest articles of every category.
+
+    add_article() keeps the table up to date transactionally. Rebuilding it corrects any drift
+    and picks up a changed LATEST_ARTICLES_DEPTH.
+
+    Args:
+        cnx (MySQLConnection): The connection to use.
+    """
+    delete_sql = setup_statements["delete_latest_articles_category.sql"]
+    insert_sql = setup_statements["insert_latest_articles_category.sql"]
+    with cnx.cursor() as cursor:
+        for category in CATEGORIES:
+            cursor.execute(delete_sql, (category,))
+            cursor.execute(insert_sql, (category, LATEST_ARTICLES_DEPTH))
+    cnx.commit()
 
 
 def init_db() -> None:
     """
-    Initializes the database by creating tables, upserting categories, and prefilling articles.
+    Bootstraps the database by creating tables, migrating existing tables to the current
+    schema, upserting categories, and prefilling articles.
+
+    All steps share a single connection and hold the schema lock, so processes bootstrapping at
+    the same time take turns and only the first one prefills. The database is given
+    DB_STARTUP_TIMEOUT seconds to become available.
 
     Raises:
         Exception: If the connection to the database cannot be established.
     """
-    cnx = connect_to_mysql(attempts=3)
-    if cnx and cnx.is_connected():
-        create_tables()
-        upsert_categories()
-        prefill_articles()
-    else:
-        raise RuntimeError("Could not connect to database")
+    started_at = time.perf_counter()
+    wait_for_database(DB_STARTUP_TIMEOUT)
+    with pooled_connection() as cnx:
+        if not cnx.is_connected():
+            raise RuntimeError("Could not connect to database")
+        with schema_lock(cnx):
+            create_tables(cnx)
+            run_migrations(cnx)
+            upsert_categories(cnx)
+            if prefill_articles(cnx) == 0:
+                reconcile_category_counts(cnx)
+            rebuild_latest_articles(cnx)
+    logger.info("Initialized the database in %.3fs", time.perf_counter() - started_at)
+
+
+def schema_is_current() -> bool:
+    """
+    Checks with a single query whether all migrations of this version have been applied.
+
+    A newer schema counts as current, as migrations only add to the schema while older tasks are
+    still running.
+
+    Returns:
+        bool: Whether the schema is current.
+    """
+    with pooled_connection() as cnx:
+        version = get_schema_version(cnx)
+    if version < SCHEMA_VERSION:
+        logger.warning("Schema version is %d, expected %d", version, SCHEMA_VERSION)
+        return False
+    return True
+
+
+def prepare_db(mode: str = DB_STARTUP_MODE) -> bool:
+    """
+    Prepares the database for serving requests according to the startup mode.
+
+    Args:
+        mode (str, optional): One of DB_STARTUP_MODES. Defaults to DB_STARTUP_MODE.
+
+    Returns:
+        bool: Whether the schema is current, i.e. the process is ready to serve requests.
+    """
+    if mode != "bootstrap":
+        started_at = time.perf_counter()
+        if schema_is_current():
+            logger.info("Verified the schema in %.3fs", time.perf_counter() - started_at)
+            return True
+        if mode == "verify":
+            return False
+    init_db()
+    return True
@@ -0,0 +1,253 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Versioned schema migrations, applied by init_db() when the database is bootstrapped.
+
+Every migration has a version number and is recorded in the 'schema_migrations' table once it
+has been applied. Migrations are written to be idempotent, so a migration interrupted half way
+is simply run again on the next bootstrap. A named MySQL lock serializes concurrent bootstraps,
+only one of them migrates while the others wait and then find nothing left to do.
+
+Expensive data changes are done in small committed batches and table changes use
+ALGORITHM=INPLACE, LOCK=NONE, so the running tasks keep reading and writing while a new version
+rolls out.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import logging
+import os
+from typing import Callable, Iterable, Iterator, List, Set
+import mysql.connector
+from mysql.connector import errorcode, MySQLConnection
+from ..common.statements import setup_statements
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_LOCK_NAME = "new_science_schema_migrations"
+MIGRATION_LOCK_TIMEOUT = int(os.environ.get("MIGRATION_LOCK_TIMEOUT", "300"))
+MIGRATION_BATCH_SIZE = int(os.environ.get("MIGRATION_BATCH_SIZE", "1000"))
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    A schema migration.
+
+    Attributes:
+        version (int): The version the schema has after this migration, applied in ascending
+            order.
+        name (str): A short description.
+        apply (Callable[[MySQLConnection], None]): Applies the migration. Must be idempotent.
+    """
+
+    version: int
+    name: str
+    apply: Callable[[MySQLConnection], None]
+
+
+def _execute_file(
+    cnx: MySQLConnection, file_name: str, ignored_errnos: Iterable[int] = ()
+) -> None:
+    """
+    Executes a statement from the setup SQL directory and commits.
+
+    Args:
+        cnx (MySQLConnection): The connection to use.
+        file_name (str): The file in db/setup/sql holding the statement.
+        ignored_errnos (Iterable[int], optional): MySQL error numbers which mean the change is
+            already in place. Defaults to ().
+    """
+    try:
+        with cnx.cursor() as cursor:
+            cursor.execute(setup_statements[file_name])
+        cnx.commit()
+    except mysql.connector.Error as err:
+        if err.errno not in ignored_errnos:
+            raise
+        logger.info("Skipping %s: %s", file_name, err.msg)
+
+
+def _add_articles_category_date_id_idx(cnx: MySQLConnection) -> None:
+    _execute_file(
+        cnx, "create_index_articles_category_date.sql", (errorcode.ER_DUP_KEYNAME,)
+    )
+
+
+def _add_categories_article_count(cnx: MySQLConnection) -> None:
+    _execute_file(
+        cnx, "alter_table_categories_add_article_count.sql", (errorcode.ER_DUP_FIELDNAME,)
+    )
+    _execute_file(cnx, "reconcile_category_counts.sql")
+
+
+def _convert_articles_date_to_datetime(cnx: MySQLConnection) -> None:
+    """
+    Converts 'articles.date' from varchar(45) to DATETIME(6) without blocking writers.
+
+    The values are copied into a shadow column in batches, then a single online ALTER swaps the
+    shadow column in and rebuilds the (category, date, id) index on the typed column.
+    """
+    with cnx.cursor() as cursor:
+        cursor.execute(
+            setup_statements["select_column_data_type.sql"],
+            ("articles", "date"),
+        )
+        row = cursor.fetchone()
+    cnx.commit()
+    if row is not None and row[0].lower() == "datetime":
+        return
+
+    _execute_file(cnx, "alter_table_articles_add_date_dt.sql", (errorcode.ER_DUP_FIELDNAME,))
+
+    update_range_sql = setup_statements["update_articles_date_dt_range.sql"]
+    with cnx.cursor() as cursor:
+        cursor.execute(setup_statements["select_max_article_id.sql"])
+        max_id = cursor.fetchone()[0]
+        cnx.commit()
+        for start in range(0, max_id, MIGRATION_BATCH_SIZE):
+            cursor.execute(update_range_sql, (start, start + MIGRATION_BATCH_SIZE))
+            cnx.commit()
+        logger.info("Copied dates of articles up to id %s", max_id)
+
+    # Catch rows inserted during the backfill. Rows inserted by tasks still running the old
+    # version while the swap runs make it fail, it is then retried on the next start
+    _execute_file(cnx, "update_articles_date_dt_remaining.sql")
+    _execute_file(cnx, "alter_table_articles_swap_date_dt.sql")
+
+
+def _add_articles_title_text_ft_idx(cnx: MySQLConnection) -> None:
+    # The first FULLTEXT index of a table adds a hidden FTS_DOC_ID column, which rebuilds the
+    # table. Writes are blocked while it is built, reads are not
+    _execute_file(
+        cnx, "create_fulltext_index_articles_title_text.sql", (errorcode.ER_DUP_KEYNAME,)
+    )
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "add articles.category_date_id_idx", _add_articles_category_date_id_idx),
+    Migration(2, "add categories.article_count", _add_categories_article_count),
+    Migration(3, "convert articles.date to DATETIME(6)", _convert_articles_date_to_datetime),
+    Migration(4, "add articles.title_text_ft_idx", _add_articles_title_text_ft_idx),
+]
+
+SCHEMA_VERSION = max(migration.version for migration in MIGRATIONS)
+
+
+def get_applied_versions(cnx: MySQLConnection) -> Set[int]:
+    """
+    Returns the versions of all migrations applied to the database.
+
+    Args:
+        cnx (MySQLConnection): The connection to use.
+
+    Returns:
+        Set[int]: The applied versions.
+    """
+    with cnx.cursor() as cursor:
+        cursor.execute(setup_statements["select_schema_migrations.sql"])
+        versions = {row[0] for row in cursor.fetchall()}
+    cnx.commit()
+    return versions
+
+
+def get_schema_version(cnx: MySQLConnection) -> int:
+    """
+    Returns the highest migration version applied to the database.
+
+    Args:
+        cnx (MySQLConnection): The connection to use.
+
+    Returns:
+        int: The schema version, 0 if the database was never bootstrapped.
+    """
+    try:
+        with cnx.cursor() as cursor:
+            cursor.execute(setup_statements["select_schema_version.sql"])
+            (version,) = cursor.fetchone()
+    except mysql.connector.Error as err:
+        if err.errno != errorcode.ER_NO_SUCH_TABLE:
+            raise
+        version = None
+    cnx.commit()
+    return version or 0
+
+
+@contextmanager
+def schema_lock(cnx: MySQLConnection) -> Iterator[None]:
+    """
+    Holds the named MySQL lock that serializes bootstraps for the duration of a with block.
+
+    The lock is re-entrant within the session of the connection.
+
+    Args:
+        cnx (MySQLConnection): The connection whose session holds the lock.
+
+    Raises:
+        RuntimeError: If the lock could not be acquired within MIGRATION_LOCK_TIMEOUT seconds.
+    """
+    with cnx.cursor() as cursor:
+        cursor.execute(
+            setup_statements["get_lock.sql"],
+            (MIGRATION_LOCK_NAME, MIGRATION_LOCK_TIMEOUT),
+        )
+        (locked,) = cursor.fetchone()
+    if locked != 1:
+        raise RuntimeError("Could not acquire the schema migration lock")
+    try:
+        yield
+    finally:
+        with cnx.cursor() as cursor:
+            cursor.execute(
+                setup_statements["release_lock.sql"],
+                (MIGRATION_LOCK_NAME,),
+            )
+            cursor.fetchone()
+
+
+def run_migrations(cnx: MySQLConnection) -> List[int]:
+    """
+    Applies all pending migrations in version order.
+
+    Args:
+        cnx (MySQLConnection): The connection to use.
+
+    Returns:
+        List[int]: The versions applied by this call.
+
+    Raises:
+        RuntimeError: If the migration lock could not be acquired in time.
+    """
+    applied: List[int] = []
+    with schema_lock(cnx):
+        done = get_applied_versions(cnx)
+        for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+            if migration.version in done:
+                continue
+            logger.info("Applying migration %d (%s)", migration.version, migration.name)
+            migration.apply(cnx)
+            with cnx.cursor() as cursor:
+                cursor.execute(
+                    setup_statements["insert_schema_migration.sql"],
+                    (migration.version, migration.name),
+                )
+            cnx.commit()
+            logger.info("Applied migration %d", migration.version)
+            applied.append(migration.version)
+    return applied
@@ -0,0 +1,6 @@
+ALTER TABLE
+    `articles`
+ADD
+    COLUMN `date_dt` datetime(6) NULL,
+    ALGORITHM = INPLACE,
+    LOCK = NONE;
\ No newline at end of file
@@ -0,0 +1,8 @@
+ALTER TABLE
+    `articles` DROP INDEX `category_date_id_idx`,
+    DROP COLUMN `date`,
+    CHANGE COLUMN `date_dt` `date` datetime(6) NOT NULL AFTER `title`,
+    ADD
+    KEY `category_date_id_idx` (`category`, `date`, `id`),
+    ALGORITHM = INPLACE,
+    LOCK = NONE;
\ No newline at end of file
@@ -0,0 +1,4 @@
+ALTER TABLE
+    `categories`
+ADD
+    COLUMN `article_count` int NOT NULL DEFAULT 0;
\ No newline at end of file
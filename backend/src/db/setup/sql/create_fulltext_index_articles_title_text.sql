@@ -0,0 +1 @@
+CREATE FULLTEXT INDEX `title_text_ft_idx` ON `articles` (`title`, `text`);
\ No newline at end of file
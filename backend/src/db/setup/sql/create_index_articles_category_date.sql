@@ -0,0 +1 @@
+CREATE INDEX `category_date_id_idx` ON `articles` (`category`, `date`, `id`);
\ No newline at end of file
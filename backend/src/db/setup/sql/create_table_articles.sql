@@ -1,7 +1,7 @@
 CREATE TABLE `articles` (
     `id` int NOT NULL AUTO_INCREMENT,
     `title` varchar(100) NOT NULL,
-    `date` varchar(45) NOT NULL,
+    `date` datetime(6) NOT NULL,
     `author` varchar(50) NOT NULL,
     `text` varchar(2000) DEFAULT NULL,
     `agency` varchar(50) DEFAULT NULL,
@@ -9,5 +9,7 @@ CREATE TABLE `articles` (
     `user_submitted` tinyint DEFAULT NULL,
     PRIMARY KEY (`id`),
     KEY `category_idx` (`category`),
+    KEY `category_date_id_idx` (`category`, `date`, `id`),
+    FULLTEXT KEY `title_text_ft_idx` (`title`, `text`),
     CONSTRAINT `category` FOREIGN KEY (`category`) REFERENCES `categories` (`category`) ON DELETE CASCADE ON UPDATE CASCADE
 ) ENGINE = InnoDB;
\ No newline at end of file
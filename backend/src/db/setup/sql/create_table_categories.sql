@@ -1,4 +1,5 @@
 CREATE TABLE `categories` (
     `category` varchar(45) NOT NULL,
+    `article_count` int NOT NULL DEFAULT 0,
     PRIMARY KEY (`category`)
 ) ENGINE = InnoDB;
\ No newline at end of file
@@ -0,0 +1,7 @@
+CREATE TABLE `latest_articles` (
+    `category` varchar(45) NOT NULL,
+    `article_id` int NOT NULL,
+    PRIMARY KEY (`category`, `article_id`),
+    KEY `article_id_idx` (`article_id`),
+    CONSTRAINT `latest_article` FOREIGN KEY (`article_id`) REFERENCES `articles` (`id`) ON DELETE CASCADE
+) ENGINE = InnoDB;
\ No newline at end of file
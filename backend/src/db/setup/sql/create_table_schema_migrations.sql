@@ -0,0 +1,6 @@
+CREATE TABLE `schema_migrations` (
+    `version` int NOT NULL,
+    `name` varchar(100) NOT NULL,
+    `applied_at` datetime(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    PRIMARY KEY (`version`)
+) ENGINE = InnoDB;
\ No newline at end of file
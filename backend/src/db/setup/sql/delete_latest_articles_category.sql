@@ -0,0 +1,4 @@
+DELETE FROM
+    latest_articles
+WHERE
+    category = %s;
\ No newline at end of file
@@ -0,0 +1,2 @@
+SELECT
+    GET_LOCK(%s, %s);
\ No newline at end of file
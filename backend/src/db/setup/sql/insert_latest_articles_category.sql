@@ -0,0 +1,13 @@
+INSERT
+    IGNORE INTO latest_articles (category, article_id)
+SELECT
+    category,
+    id
+FROM
+    articles
+WHERE
+    category = %s
+ORDER BY
+    id DESC
+LIMIT
+    %s;
\ No newline at end of file
@@ -0,0 +1,4 @@
+INSERT INTO
+    schema_migrations (version, name)
+VALUES
+    (%s, %s);
\ No newline at end of file
@@ -0,0 +1,11 @@
+UPDATE
+    categories
+SET
+    article_count = (
+        SELECT
+            COUNT(*)
+        FROM
+            articles
+        WHERE
+            articles.category = categories.category
+    );
\ No newline at end of file
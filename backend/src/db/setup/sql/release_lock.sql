@@ -0,0 +1,2 @@
+SELECT
+    RELEASE_LOCK(%s);
\ No newline at end of file
@@ -0,0 +1,8 @@
+SELECT
+    DATA_TYPE
+FROM
+    information_schema.COLUMNS
+WHERE
+    TABLE_SCHEMA = DATABASE()
+    AND TABLE_NAME = %s
+    AND COLUMN_NAME = %s;
\ No newline at end of file
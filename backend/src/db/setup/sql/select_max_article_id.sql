@@ -0,0 +1,4 @@
+SELECT
+    COALESCE(MAX(id), 0)
+FROM
+    articles;
\ No newline at end of file
@@ -0,0 +1,4 @@
+SELECT
+    MAX(version)
+FROM
+    schema_migrations;
\ No newline at end of file
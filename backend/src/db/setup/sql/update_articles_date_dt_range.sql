@@ -0,0 +1,8 @@
+UPDATE
+    articles
+SET
+    date_dt = CAST(date AS DATETIME(6))
+WHERE
+    id > %s
+    AND id <= %s
+    AND date_dt IS NULL;
\ No newline at end of file
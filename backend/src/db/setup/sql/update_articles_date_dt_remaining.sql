@@ -0,0 +1,6 @@
+UPDATE
+    articles
+SET
+    date_dt = CAST(date AS DATETIME(6))
+WHERE
+    date_dt IS NULL;
\ No newline at end of file
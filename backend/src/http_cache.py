@@ -0,0 +1,156 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+HTTP validators (ETag / Last-Modified) and Cache-Control headers for the read endpoints.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import hashlib
+import os
+from typing import Dict, Optional
+from fastapi import Request, Response, status
+
+CACHE_CONTROL_TOP_STORIES = os.environ.get(
+    "CACHE_CONTROL_TOP_STORIES", "public, max-age=10, s-maxage=30, stale-while-revalidate=60"
+)
+CACHE_CONTROL_CATEGORY = os.environ.get(
+    "CACHE_CONTROL_CATEGORY", "public, max-age=10, s-maxage=30, stale-while-revalidate=60"
+)
+CACHE_CONTROL_SEARCH = os.environ.get(
+    "CACHE_CONTROL_SEARCH", "public, max-age=10, s-maxage=30, stale-while-revalidate=60"
+)
+CACHE_CONTROL_ARTICLE = os.environ.get(
+    "CACHE_CONTROL_ARTICLE", "public, max-age=60, s-maxage=300, stale-while-revalidate=600"
+)
+
+
+@dataclass(frozen=True)
+class Validators:
+    """
+    The validators of a representation.
+
+    Attributes:
+        etag (str): The strong entity tag, including the quotes.
+        last_modified (datetime): The time of the last change, truncated to seconds.
+        cache_control (str): The Cache-Control header value of the route.
+    """
+
+    etag: str
+    last_modified: datetime
+    cache_control: str
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """The response headers carrying the validators."""
+        return {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+            "Cache-Control": self.cache_control,
+            # The body is compressed according to Accept-Encoding, see response_store.py
+            "Vary": "Accept-Encoding",
+        }
+
+
+def make_validators(
+    version: str,
+    modified_at: float,
+    variant: str,
+    cache_control: str,
+    encoding: Optional[str] = None,
+) -> Validators:
+    """
+    Derives the validators of a representation from a content version token.
+
+    Args:
+        version (str): The content version token the representation was built from.
+        modified_at (float): The Unix timestamp of the last change to that content.
+        variant (str): Distinguishes representations of the same content, e.g. the route and
+            page number.
+        cache_control (str): The Cache-Control header value of the route.
+        encoding (Optional[str], optional): The content coding the body is sent with, None for
+            identity. Every coding is a representation of its own and gets its own strong ETag.
+            Defaults to None.
+
+    Returns:
+        Validators: The validators of the representation.
+    """
+    digest = hashlib.sha1(f"{variant}|{version}".encode("utf-8")).hexdigest()[:20]
+    if encoding is not None:
+        digest = f"{digest}-{encoding}"
+    return Validators(
+        etag=f'"{digest}"',
+        last_modified=datetime.fromtimestamp(int(modified_at), tz=timezone.utc),
+        cache_control=cache_control,
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison function, so W/ prefixes are ignored
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """
+    Evaluates the conditional request headers against the current validators.
+
+    If-Modified-Since is only considered when the request carries no If-None-Match header.
+
+    Args:
+        request (Request): The incoming request.
+        validators (Validators): The validators of the current representation.
+
+    Returns:
+        bool: Whether the client's copy is still current.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, validators.etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since: Optional[datetime] = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since is None or since.tzinfo is None:
+            return False
+        return validators.last_modified <= since
+    return False
+
+
+def not_modified_response(validators: Validators) -> Response:
+    """
+    Builds a 304 Not Modified response carrying the validators.
+
+    Args:
+        validators (Validators): The validators of the current representation.
+
+    Returns:
+        Response: The empty 304 response.
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers)
@@ -0,0 +1,222 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Streaming bulk ingest of articles from a JSON array or NDJSON request body.
+
+The body is decoded chunk by chunk as it arrives. Every row is validated with the Article model
+on its own, valid rows are collected into batches which are inserted in one transaction each,
+and invalid rows are reported with their position. The next chunk is only read once the
+current batch is stored, so memory use is bounded by the batch size and slow databases push
+back on the client.
+"""
+
+import codecs
+import json
+import logging
+import os
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+from pydantic import ValidationError
+from .db.common.file import JsonArrayDecoder
+from .types import Article, BulkIngestResult, BulkIngestRowError
+
+logger = logging.getLogger(__name__)
+
+INGEST_BATCH_SIZE = int(os.environ.get("INGEST_BATCH_SIZE", "500"))
+INGEST_MAX_REPORTED_ERRORS = int(os.environ.get("INGEST_MAX_REPORTED_ERRORS", "1000"))
+INGEST_MAX_ROW_SIZE = int(os.environ.get("INGEST_MAX_ROW_SIZE", str(64 * 1024)))
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+# Marks a row which is not valid JSON. Only NDJSON rows can be skipped like this, a JSON array
+# cannot be resynchronized after a syntax error
+_MALFORMED = object()
+
+
+class MalformedBodyError(ValueError):
+    """
+    Raised when a JSON array body is not well-formed.
+
+    Attributes:
+        result (Optional[BulkIngestResult]): What was stored and rejected before the error,
+            set by ingest_articles().
+    """
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.result: Optional[BulkIngestResult] = None
+
+
+class _NdjsonDecoder:
+    """
+    Splits an NDJSON document into rows and decodes each of them.
+    """
+
+    def __init__(self, max_row_size: int) -> None:
+        self.max_row_size = max_row_size
+        self._buffer = ""
+
+    def _decode_line(self, line: str) -> List[Any]:
+        line = line.strip()
+        if not line:
+            return []
+        try:
+            return [json.loads(line)]
+        except ValueError:
+            return [_MALFORMED]
+
+    def feed(self, text: str) -> List[Any]:
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        # Complete rows as well as the one still arriving
+        if any(len(line) > self.max_row_size for line in (*lines, self._buffer)):
+            raise MalformedBodyError(f"NDJSON row exceeds {self.max_row_size} characters")
+        return [row for line in lines for row in self._decode_line(line)]
+
+    def close(self) -> List[Any]:
+        rows = self._decode_line(self._buffer)
+        self._buffer = ""
+        return rows
+
+
+class _JsonArrayRows:
+    """
+    Adapts JsonArrayDecoder to raise MalformedBodyError.
+    """
+
+    def __init__(self, max_row_size: int) -> None:
+        self._decoder = JsonArrayDecoder(max_item_size=max_row_size)
+
+    def feed(self, text: str) -> List[Any]:
+        try:
+            return self._decoder.feed(text)
+        except ValueError as e:
+            raise MalformedBodyError(str(e)) from e
+
+    def close(self) -> List[Any]:
+        try:
+            return self._decoder.close()
+        except ValueError as e:
+            raise MalformedBodyError(str(e)) from e
+
+
+def is_ndjson(content_type: str) -> bool:
+    """
+    Returns whether a Content-Type header denotes newline delimited JSON.
+
+    Args:
+        content_type (str): The Content-Type header value.
+
+    Returns:
+        bool: Whether the body is NDJSON rather than a JSON array.
+    """
+    return content_type.split(";")[0].strip().lower() in NDJSON_MEDIA_TYPES
+
+
+def _validate(row: Any) -> Tuple[Optional[Article], str]:
+    if row is _MALFORMED:
+        return None, "Invalid JSON"
+    try:
+        return Article.model_validate(row), ""
+    except ValidationError as e:
+        message = "; ".join(
+            f"{'.'.join(str(loc) for loc in error['loc']) or 'row'}: {error['msg']}"
+            for error in e.errors()
+        )
+        return None, message
+
+
+async def ingest_articles(
+    chunks: AsyncIterator[bytes],
+    ndjson: bool,
+    insert: Callable[[List[Article]], Awaitable[None]],
+    batch_size: int = INGEST_BATCH_SIZE,
+) -> BulkIngestResult:
+    """
+    Validates and inserts the articles of a streamed request body.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The request body.
+        ndjson (bool): Whether the body is NDJSON rather than a JSON array.
+        insert (Callable[[List[Article]], Awaitable[None]]): Stores a batch of articles in one
+            transaction.
+        batch_size (int, optional): The maximum number of articles per transaction.
+            Defaults to INGEST_BATCH_SIZE.
+
+    Returns:
+        BulkIngestResult: The number of inserted and rejected rows and the rejection reasons.
+
+    Raises:
+        MalformedBodyError: If a JSON array body is not well-formed. The valid rows read
+            before the error are stored, its result attribute reports them.
+    """
+    decoder = (
+        _NdjsonDecoder(INGEST_MAX_ROW_SIZE) if ndjson else _JsonArrayRows(INGEST_MAX_ROW_SIZE)
+    )
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    result = BulkIngestResult(inserted=0, failed=0, errors=[])
+    batch: List[Article] = []
+    batch_indexes: List[int] = []
+    index = 0
+
+    def reject(row_index: int, message: str) -> None:
+        result.failed += 1
+        if len(result.errors) < INGEST_MAX_REPORTED_ERRORS:
+            result.errors.append(BulkIngestRowError(index=row_index, message=message))
+
+    async def flush() -> None:
+        nonlocal batch, batch_indexes
+        if not batch:
+            return
+        try:
+            await insert(batch)
+            result.inserted += len(batch)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to store a batch of %d articles: %s", len(batch), str(e))
+            for row_index in batch_indexes:
+                reject(row_index, "Could not be stored in the database")
+        batch, batch_indexes = [], []
+
+    async def handle(rows: List[Any]) -> None:
+        nonlocal index
+        for row in rows:
+            article, message = _validate(row)
+            if article is None:
+                reject(index, message)
+            else:
+                batch.append(article)
+                batch_indexes.append(index)
+            index += 1
+            if len(batch) >= batch_size:
+                await flush()
+
+    try:
+        try:
+            async for chunk in chunks:
+                await handle(decoder.feed(text_decoder.decode(chunk)))
+            await handle(decoder.feed(text_decoder.decode(b"", final=True)))
+            await handle(decoder.close())
+        except UnicodeDecodeError as e:
+            raise MalformedBodyError("Request body is not valid UTF-8") from e
+    except MalformedBodyError as e:
+        # Completed by the flush below before the error reaches the caller
+        e.result = result
+        raise
+    finally:
+        await flush()
+    return result
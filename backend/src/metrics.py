@@ -0,0 +1,173 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Prometheus metrics of the HTTP routes and the database access, exposed on GET /metrics.
+
+The data-access layer records the duration and row count of every query under the name of its
+SQL file, and the connection pools record how long a checkout took. MetricsMiddleware records
+the latency of every request per route template (e.g. /category/{category}/{page}, so the
+number of series stays bounded) and the number of requests in flight. Recording a sample costs
+a few microseconds, so the metrics stay enabled unless METRICS_ENABLED is set to false.
+
+The workers of python -m src.serve write their samples to files in PROMETHEUS_MULTIPROC_DIR,
+and a scrape of any worker aggregates those of all workers.
+"""
+
+import os
+import time
+from typing import Optional
+from fastapi import Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() == "true"
+# Set by the serving supervisor for its workers, read by prometheus_client itself as well
+PROMETHEUS_MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR", "")
+
+# Database round-trips are much faster than whole requests, so their buckets start lower
+DB_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+ROW_COUNT_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Latency of HTTP requests until the response was sent.",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Number of HTTP requests currently being served.",
+    multiprocess_mode="livesum",
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Latency of database statements including fetching their rows, by SQL file.",
+    ["query"],
+    buckets=DB_LATENCY_BUCKETS,
+)
+DB_QUERY_ROWS = Histogram(
+    "db_query_rows",
+    "Number of rows returned by database queries, by SQL file.",
+    ["query"],
+    buckets=ROW_COUNT_BUCKETS,
+)
+DB_CONNECTION_ACQUIRE_DURATION = Histogram(
+    "db_connection_acquire_seconds",
+    "Time spent checking a connection out of a pool, including opening it.",
+    ["instance"],
+    buckets=DB_LATENCY_BUCKETS,
+)
+
+
+def observe_query(name: str, seconds: float, rows: Optional[int] = None) -> None:
+    """
+    Records the execution of a database statement.
+
+    Args:
+        name (str): The name of the SQL file of the statement.
+        seconds (float): The time spent executing it and fetching its rows.
+        rows (Optional[int], optional): The number of rows returned, None for statements that
+            return no rows. Defaults to None.
+    """
+    if not METRICS_ENABLED:
+        return
+    DB_QUERY_DURATION.labels(name).observe(seconds)
+    if rows is not None:
+        DB_QUERY_ROWS.labels(name).observe(rows)
+
+
+def observe_connection_acquire(instance: str, seconds: float) -> None:
+    """
+    Records a connection checkout.
+
+    Args:
+        instance (str): The database instance, "writer" or the `host:port` of a reader.
+        seconds (float): The time spent waiting for and opening the connection.
+    """
+    if METRICS_ENABLED:
+        DB_CONNECTION_ACQUIRE_DURATION.labels(instance).observe(seconds)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording the latency and concurrency of HTTP requests.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            REQUEST_DURATION.labels(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                str(status_code),
+            ).observe(time.perf_counter() - started_at)
+
+
+def metrics_response() -> Response:
+    """
+    Renders all metrics in the Prometheus text exposition format.
+
+    Returns:
+        Response: The response to a scrape.
+    """
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return Response(content=generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+def release_process_metrics() -> None:
+    """
+    Removes the samples of live-summed gauges of this process from the multi-process metrics
+    when the process shuts down.
+    """
+    if PROMETHEUS_MULTIPROC_DIR:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,236 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Opt-in profiling of individual requests.
+
+With PROFILING_ENABLED=true, ProfilingMiddleware profiles a request if it carries the
+PROFILING_HEADER header (`X-Profile: 1` by default) or if it is picked at random with
+probability PROFILING_SAMPLE_RATE. While a request is profiled, the connection layer, the SQL
+helpers, the row conversion and the JSON rendering record spans into its Trace. Outside of
+profiled requests recording a span is a single context variable lookup.
+
+A profiled request answers with a Server-Timing header holding the time per phase, and the
+trace is logged. Traces that took at least PROFILING_SLOW_TRACE_SECONDS, and all traces that
+were requested by header, are kept in a ring buffer served by GET /health/traces.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import os
+import random
+import threading
+import time
+from typing import Deque, Dict, Iterator, List, Optional
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .types import ProfileSpan, ProfileTrace
+
+logger = logging.getLogger(__name__)
+
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_SAMPLE_RATE = float(os.environ.get("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_HEADER = os.environ.get("PROFILING_HEADER", "X-Profile").lower()
+PROFILING_SLOW_TRACE_SECONDS = float(os.environ.get("PROFILING_SLOW_TRACE_SECONDS", "0.2"))
+PROFILING_MAX_TRACES = int(os.environ.get("PROFILING_MAX_TRACES", "100"))
+
+ROUTING = "routing"
+CONNECTION = "connection"
+SQL = "sql"
+CONVERT = "convert"
+SERIALIZE = "serialize"
+
+
+class Trace:
+    """
+    The spans recorded while serving one profiled request.
+    """
+
+    def __init__(self, method: str, path: str, requested: bool) -> None:
+        self.method = method
+        self.path = path
+        self.requested = requested
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.spans: List[ProfileSpan] = []
+
+    def add(self, phase: str, seconds: float, detail: Optional[str] = None) -> None:
+        """
+        Records a span.
+
+        Args:
+            phase (str): The phase the time was spent in, e.g. SQL.
+            seconds (float): The duration of the span.
+            detail (Optional[str], optional): E.g. the SQL file name. Defaults to None.
+        """
+        # list.append is atomic, spans may be added from a threadpool thread
+        self.spans.append(ProfileSpan(phase=phase, detail=detail, seconds=seconds))
+
+    def breakdown(self) -> Dict[str, float]:
+        """
+        Returns the total time per phase.
+
+        Returns:
+            Dict[str, float]: The seconds spent in each phase.
+        """
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            totals[span.phase] = totals.get(span.phase, 0.0) + span.seconds
+        return totals
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+
+_recent_traces: Deque[ProfileTrace] = deque(maxlen=PROFILING_MAX_TRACES)
+_recent_traces_lock = threading.Lock()
+
+
+def record_span(phase: str, seconds: float, detail: Optional[str] = None) -> None:
+    """
+    Records a span into the trace of the current request, if it is profiled.
+
+    Args:
+        phase (str): The phase the time was spent in.
+        seconds (float): The duration of the span.
+        detail (Optional[str], optional): E.g. the SQL file name. Defaults to None.
+    """
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(phase, seconds, detail)
+
+
+@contextmanager
+def span(phase: str, detail: Optional[str] = None) -> Iterator[None]:
+    """
+    Records the duration of a with block as a span of the current trace.
+
+    Args:
+        phase (str): The phase the time was spent in.
+        detail (Optional[str], optional): Further information. Defaults to None.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(phase, time.perf_counter() - started, detail)
+
+
+async def mark_routed() -> None:
+    """
+    App dependency recording the time from receiving a request until its route handler runs,
+    which covers the middleware, routing and parameter validation.
+    """
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(ROUTING, time.perf_counter() - trace.started)
+
+
+def get_recent_traces() -> List[ProfileTrace]:
+    """
+    Returns the kept traces.
+
+    Returns:
+        List[ProfileTrace]: The traces, most recent first.
+    """
+    with _recent_traces_lock:
+        return list(reversed(_recent_traces))
+
+
+def _server_timing(breakdown: Dict[str, float], total: float) -> str:
+    entries = [f"{phase};dur={seconds * 1000:.3f}" for phase, seconds in breakdown.items()]
+    entries.append(f"total;dur={total * 1000:.3f}")
+    return ", ".join(entries)
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that decides which requests to profile and collects their traces.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = PROFILING_SAMPLE_RATE,
+        header: str = PROFILING_HEADER,
+        slow_trace_seconds: float = PROFILING_SLOW_TRACE_SECONDS,
+    ) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.header = header.lower().encode("latin-1")
+        self.slow_trace_seconds = slow_trace_seconds
+
+    def _is_requested(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == self.header:
+                return value not in (b"", b"0", b"false")
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        requested = self._is_requested(scope)
+        if not requested and (self.sample_rate <= 0 or random.random() >= self.sample_rate):
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace(scope["method"], scope["path"], requested)
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    _server_timing(trace.breakdown(), time.perf_counter() - trace.started),
+                )
+            await send(message)
+
+        token = _current_trace.set(trace)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_trace.reset(token)
+            self._finish(trace, scope, status_code)
+
+    def _finish(self, trace: Trace, scope: Scope, status_code: int) -> None:
+        total = time.perf_counter() - trace.started
+        route = scope.get("route")
+        profile = ProfileTrace(
+            method=trace.method,
+            path=trace.path,
+            route=getattr(route, "path", None),
+            status=status_code,
+            started_at=trace.started_at,
+            total_seconds=total,
+            requested=trace.requested,
+            breakdown=trace.breakdown(),
+            spans=trace.spans,
+        )
+        logger.info("Request profile", extra={"profile": profile.model_dump()})
+        if trace.requested or total >= self.slow_trace_seconds:
+            with _recent_traces_lock:
+                _recent_traces.append(profile)
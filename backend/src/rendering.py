@@ -0,0 +1,77 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Serialization of the read endpoint results straight to JSON bytes.
+
+The data-access layer builds the result models from trusted database rows without validation.
+Returning them from a route would still make FastAPI validate every article against the
+response_model and encode it via jsonable_encoder. Rendering them with the pydantic-core
+serializer and returning the bytes skips both steps. The routes keep their response_model so
+the OpenAPI schema is unchanged.
+"""
+
+from typing import Any, List
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+from .profiling import SERIALIZE, span
+from .types import Article
+
+ARTICLE_LIST_ADAPTER = TypeAdapter(List[Article])
+
+
+def render_articles(articles: List[Article]) -> bytes:
+    """
+    Serializes a list of articles to JSON.
+
+    Args:
+        articles (List[Article]): The articles.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    with span(SERIALIZE):
+        return ARTICLE_LIST_ADAPTER.dump_json(articles)
+
+
+def render_model(model: BaseModel) -> bytes:
+    """
+    Serializes a result model to JSON.
+
+    Args:
+        model (BaseModel): The model.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    with span(SERIALIZE):
+        return model.__pydantic_serializer__.to_json(model)
+
+
+def render_json(value: Any) -> bytes:
+    """
+    Serializes plain data, such as projected articles, to JSON.
+
+    Args:
+        value (Any): The data.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    with span(SERIALIZE):
+        return to_json(value)
@@ -0,0 +1,287 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Rendered and pre-compressed bodies of the read endpoints.
+
+A read route renders its result to JSON once per content version and keeps the bytes here,
+together with their gzip and brotli encodings, each compressed the first time a client asks
+for it. Later requests for the same content are answered from the store without touching the
+data-access layer, the serializer or the compressor, so compression costs once per content
+change instead of once per request.
+
+Entries are keyed by the route variant (see make_validators()) and only returned for the
+content version they were rendered from, so a bumped version makes them unreachable right away.
+invalidate() additionally frees the entries of a category after a write. Brotli is used when the
+brotli package is installed, otherwise only gzip is offered.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import gzip
+import os
+import threading
+from typing import Dict, Optional, Set
+from fastapi import Response
+from .types import ResponseStoreStats
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+RESPONSE_STORE_MAX_ENTRIES = int(os.environ.get("RESPONSE_STORE_MAX_ENTRIES", "1024"))
+# Bodies smaller than this are sent uncompressed, the framing overhead would eat the savings
+RESPONSE_COMPRESSION_MIN_SIZE = int(os.environ.get("RESPONSE_COMPRESSION_MIN_SIZE", "512"))
+RESPONSE_GZIP_LEVEL = int(os.environ.get("RESPONSE_GZIP_LEVEL", "6"))
+RESPONSE_BROTLI_QUALITY = int(os.environ.get("RESPONSE_BROTLI_QUALITY", "5"))
+
+GZIP = "gzip"
+BROTLI = "br"
+# In order of preference when the client accepts several with the same quality
+ENCODINGS = (BROTLI, GZIP) if brotli is not None else (GZIP,)
+
+GLOBAL_SCOPE = "*"
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Picks the content coding for a response from the Accept-Encoding request header.
+
+    Args:
+        accept_encoding (Optional[str]): The header value, None if the header is missing.
+
+    Returns:
+        Optional[str]: One of ENCODINGS, or None for the identity coding.
+    """
+    if not accept_encoding:
+        return None
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    best: Optional[str] = None
+    best_quality = 0.0
+    for coding in ENCODINGS:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Compresses a body with a content coding.
+
+    Args:
+        body (bytes): The uncompressed body.
+        encoding (str): One of ENCODINGS.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if encoding == BROTLI:
+        return brotli.compress(body, mode=brotli.MODE_TEXT, quality=RESPONSE_BROTLI_QUALITY)
+    # A fixed mtime keeps the output identical for identical bodies
+    return gzip.compress(body, compresslevel=RESPONSE_GZIP_LEVEL, mtime=0)
+
+
+@dataclass
+class RenderedBody:
+    """
+    A rendered JSON body and its compressed encodings.
+
+    Attributes:
+        body (bytes): The uncompressed JSON document.
+        scope (str): The category the content belongs to, or GLOBAL_SCOPE if it spans all of
+            them.
+        version (str): The content version token the body was rendered from.
+        encoded (Dict[str, bytes]): The compressed bodies by content coding, filled on demand.
+    """
+
+    body: bytes
+    scope: str
+    version: str
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    def content_coding(self, encoding: Optional[str]) -> Optional[str]:
+        """
+        Returns the content coding the body is sent with for a negotiated coding.
+
+        Args:
+            encoding (Optional[str]): The negotiated content coding, None for identity.
+
+        Returns:
+            Optional[str]: The negotiated coding, or None if the body is too small to be
+                compressed.
+        """
+        if len(self.body) < RESPONSE_COMPRESSION_MIN_SIZE:
+            return None
+        return encoding
+
+
+class ResponseStore:
+    """
+    A thread-safe store of rendered bodies with least recently used eviction.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_STORE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, RenderedBody]" = OrderedDict()
+        self._keys_by_scope: Dict[str, Set[str]] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._compressions = 0
+
+    def get(self, key: str, version: str) -> Optional[RenderedBody]:
+        """
+        Returns the rendered body of a route variant if it is of the current content version.
+
+        Args:
+            key (str): The route variant.
+            version (str): The current content version token.
+
+        Returns:
+            Optional[RenderedBody]: The rendered body, or None.
+        """
+        with self._lock:
+            rendered = self._entries.get(key)
+            if rendered is None or rendered.version != version:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return rendered
+
+    def put(self, key: str, scope: Optional[str], version: str, body: bytes) -> RenderedBody:
+        """
+        Stores the rendered body of a route variant.
+
+        Args:
+            key (str): The route variant.
+            scope (Optional[str]): The category of the content, None if it spans all of them.
+            version (str): The content version token the body was rendered from.
+            body (bytes): The JSON document.
+
+        Returns:
+            RenderedBody: The stored body.
+        """
+        rendered = RenderedBody(body=body, scope=scope or GLOBAL_SCOPE, version=version)
+        if self.max_entries <= 0:
+            return rendered
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = rendered
+            self._keys_by_scope.setdefault(rendered.scope, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+        return rendered
+
+    def _remove(self, key: str) -> None:
+        # Must be called with the lock held
+        rendered = self._entries.pop(key, None)
+        if rendered is not None:
+            self._keys_by_scope[rendered.scope].discard(key)
+
+    def invalidate(self, scope: str) -> int:
+        """
+        Removes the entries of a category and those spanning all categories after a write.
+
+        Args:
+            scope (str): The category an article was added to.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        with self._lock:
+            keys = [
+                key
+                for affected in (scope, GLOBAL_SCOPE)
+                for key in self._keys_by_scope.pop(affected, ())
+            ]
+            removed = 0
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    removed += 1
+            self._invalidations += removed
+            return removed
+
+    def respond(
+        self, rendered: RenderedBody, encoding: Optional[str], headers: Dict[str, str]
+    ) -> Response:
+        """
+        Builds the response of a rendered body for a negotiated content coding, compressing the
+        body if this is the first request for that coding. Bodies below
+        RESPONSE_COMPRESSION_MIN_SIZE are sent as they are (see RenderedBody.content_coding()).
+
+        Args:
+            rendered (RenderedBody): The rendered body.
+            encoding (Optional[str]): The negotiated content coding, None for identity.
+            headers (Dict[str, str]): Additional response headers, e.g. the validators.
+
+        Returns:
+            Response: The response.
+        """
+        encoding = rendered.content_coding(encoding)
+        if encoding is None:
+            return Response(content=rendered.body, media_type="application/json", headers=headers)
+        content = rendered.encoded.get(encoding)
+        if content is None:
+            # Concurrent requests may both compress, they store identical bytes
+            content = rendered.encoded[encoding] = compress(rendered.body, encoding)
+            with self._lock:
+                self._compressions += 1
+        return Response(
+            content=content,
+            media_type="application/json",
+            headers={**headers, "Content-Encoding": encoding},
+        )
+
+    def stats(self) -> ResponseStoreStats:
+        """
+        Returns a snapshot of the store counters.
+
+        Returns:
+            ResponseStoreStats: The current store statistics.
+        """
+        with self._lock:
+            return ResponseStoreStats(
+                max_entries=self.max_entries,
+                entries=len(self._entries),
+                encodings=list(ENCODINGS),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                compressions=self._compressions,
+            )
+
+
+response_store = ResponseStore()
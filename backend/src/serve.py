@@ -0,0 +1,165 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Multi-process serving of the API, as run by the container:
+
+    python -m src.serve
+
+Serves src.app:app from WEB_CONCURRENCY uvicorn worker processes, by default one per CPU
+available to the container (its cgroup CPU quota, or the CPUs the process may run on). The
+socket is bound right away, so /health answers while the database is still being prepared.
+With more than one worker, this process bootstraps the database once according to
+DB_STARTUP_MODE in a background thread, retrying every DB_STARTUP_RETRY_INTERVAL seconds until
+the schema is current, and the workers only verify it. Each worker reports ready on
+/health/ready once it found the schema current. A single worker prepares the database itself,
+like python -m uvicorn src.app:app does.
+
+The workers share the content version counters through a file in SHARED_STATE_DIR, so the
+cached pages and ETags of every worker follow a write made through any of them, and write their
+Prometheus samples to PROMETHEUS_MULTIPROC_DIR. Both live in a temporary directory, preferably
+in memory under /dev/shm, that is removed on exit.
+"""
+
+import logging
+import math
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from typing import Optional
+import uvicorn
+from .db.api.versions import SCOPES
+from .db.common.connection import close_pools
+from .db.common.shared_counters import COUNTERS_FILE_NAME, SharedCounters
+from .db.setup.main import DB_STARTUP_MODE, DB_STARTUP_RETRY_INTERVAL, prepare_db
+from .structured_logging import configure_logging
+
+logger = logging.getLogger(__name__)
+
+APP_HOST = os.environ.get("APP_HOST", "0.0.0.0")
+APP_PORT = int(os.environ.get("APP_PORT", "8000"))
+# The number of worker processes, 0 for one per available CPU
+WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", "0"))
+# How long a stopping worker waits for open requests, e.g. article streams, before it cancels
+# them and shuts down the application, which writes the queued articles
+APP_SHUTDOWN_TIMEOUT = float(os.environ.get("APP_SHUTDOWN_TIMEOUT", "10"))
+
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def cgroup_cpu_quota() -> Optional[float]:
+    """
+    Reads the CPU quota of the container from its cgroup.
+
+    Returns:
+        Optional[float]: The number of CPUs the quota allows, None if there is no quota.
+    """
+    try:
+        with open(CGROUP_V2_CPU_MAX, encoding="utf-8") as file:
+            quota, period = file.read().split()
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(CGROUP_V1_CPU_QUOTA, encoding="utf-8") as file:
+            quota = int(file.read())
+        with open(CGROUP_V1_CPU_PERIOD, encoding="utf-8") as file:
+            period = int(file.read())
+        return None if quota <= 0 else quota / period
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """
+    Returns the number of CPUs this process can use, limited by the cgroup CPU quota.
+
+    Returns:
+        int: The number of CPUs, at least 1.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    quota = cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+def bootstrap_database() -> None:
+    """
+    Prepares the database according to DB_STARTUP_MODE, retrying until the schema is current.
+    """
+    try:
+        while True:
+            try:
+                if prepare_db(DB_STARTUP_MODE):
+                    return
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Preparing the database failed: %s", str(e))
+            time.sleep(DB_STARTUP_RETRY_INTERVAL)
+    finally:
+        close_pools()
+
+
+def main() -> int:
+    """
+    Starts bootstrapping the database and runs the worker processes until they are stopped.
+
+    Returns:
+        int: The exit code.
+    """
+    configure_logging()
+    workers = WEB_CONCURRENCY or available_cpus()
+    if workers > 1 and DB_STARTUP_MODE != "verify":
+        # The workers inherit the environment when they are spawned
+        os.environ["DB_STARTUP_MODE"] = "verify"
+        threading.Thread(target=bootstrap_database, name="bootstrap", daemon=True).start()
+
+    state_dir = tempfile.mkdtemp(
+        prefix="api-", dir="/dev/shm" if os.path.isdir("/dev/shm") else None
+    )
+    try:
+        SharedCounters.create(os.path.join(state_dir, COUNTERS_FILE_NAME), SCOPES).close()
+        os.environ["SHARED_STATE_DIR"] = state_dir
+        if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            os.makedirs(os.path.join(state_dir, "metrics"))
+            os.environ["PROMETHEUS_MULTIPROC_DIR"] = os.path.join(state_dir, "metrics")
+
+        logger.info("Serving with %d worker processes", workers)
+        uvicorn.run(
+            f"{__package__}.app:app",
+            host=APP_HOST,
+            port=APP_PORT,
+            workers=workers,
+            log_config=None,
+            timeout_graceful_shutdown=APP_SHUTDOWN_TIMEOUT,
+        )
+        return 0
+    finally:
+        shutil.rmtree(state_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
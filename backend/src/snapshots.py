@@ -0,0 +1,346 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Static snapshots of the hottest read endpoints, for a CDN to serve without reaching the API:
+
+    python -m src.snapshots [--output DIR]    renders all snapshots from the database
+
+GET /top-stories and the first SNAPSHOT_CATEGORY_PAGES pages of every category are rendered to
+JSON files laid out like their URLs, e.g. top-stories.json and category/IT/1.json, with the
+same bytes the API would answer with. The output directory SNAPSHOT_DIR stands in for the
+bucket the CDN uses as its origin. Every file is written to a temporary file and renamed into
+place, so readers never see a partial file, and only if its content changed. manifest.json
+lists the SHA-256 hash, size and update time of every file and is replaced last. Processes
+publishing to the same directory render and write in turns, so a process that rendered older
+content can never replace the files of one that rendered after it.
+
+With SNAPSHOT_DIR set, the API re-renders the top stories and the pages of a category
+SNAPSHOT_DEBOUNCE seconds after the first article added to it, so a burst of writes is
+published once. Only the process that wrote an article publishes it.
+"""
+
+import argparse
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, get_args
+from fastapi.concurrency import run_in_threadpool
+from .db.api.main import get_category_articles, get_top_articles
+from .db.api.versions import content_versions
+from .db.common.connection import close_pools, wait_for_database
+from .db.setup.main import DB_STARTUP_TIMEOUT
+from .rendering import render_articles, render_model
+from .structured_logging import configure_logging
+from .types import Category, SnapshotStats
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = os.environ.get("SNAPSHOT_DIR", "")
+SNAPSHOT_DEBOUNCE = float(os.environ.get("SNAPSHOT_DEBOUNCE", "2"))
+SNAPSHOT_CATEGORY_PAGES = int(os.environ.get("SNAPSHOT_CATEGORY_PAGES", "3"))
+
+MANIFEST_NAME = "manifest.json"
+LOCK_NAME = ".lock"
+TOP_STORIES_PATH = "top-stories.json"
+
+
+def category_page_path(category: Category, page: int) -> str:
+    """Returns the path of the snapshot of a category page."""
+    return f"category/{category}/{page}.json"
+
+
+class SnapshotStore:
+    """
+    A directory of snapshot files with their manifest.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+
+    def _write_file(self, path: str, body: bytes) -> None:
+        target = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=os.path.dirname(target), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(body)
+                file.flush()
+                os.fsync(file.fileno())
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, target)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def read_manifest(self) -> Dict[str, Any]:
+        """
+        Reads the manifest.
+
+        Returns:
+            Dict[str, Any]: The manifest, with no files if there is none yet.
+        """
+        try:
+            with open(os.path.join(self.root, MANIFEST_NAME), encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {"generated_at": None, "files": {}}
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Holds the exclusive lock of the directory, which every thread and process publishing to
+        it takes before rendering.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        # Each call opens the lock file anew, an flock excludes other open files of it
+        with open(os.path.join(self.root, LOCK_NAME), "a", encoding="utf-8") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def write(self, bodies: Dict[str, bytes]) -> int:
+        """
+        Writes the files whose content changed and updates the manifest. Must be called with
+        lock() held.
+
+        Args:
+            bodies (Dict[str, bytes]): The content of the files by path.
+
+        Returns:
+            int: The number of files written.
+        """
+        manifest = self.read_manifest()
+        now = datetime.now(timezone.utc).isoformat()
+        written = 0
+        for path, body in sorted(bodies.items()):
+            digest = hashlib.sha256(body).hexdigest()
+            entry = manifest["files"].get(path)
+            if (
+                entry is not None
+                and entry["sha256"] == digest
+                and os.path.exists(os.path.join(self.root, path))
+            ):
+                continue
+            self._write_file(path, body)
+            manifest["files"][path] = {"sha256": digest, "size": len(body), "updated_at": now}
+            written += 1
+        manifest["generated_at"] = now
+        self._write_file(
+            MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+        )
+        return written
+
+
+def render_snapshots(categories: Iterable[Category], category_pages: int) -> Dict[str, bytes]:
+    """
+    Renders the top stories and the first pages of categories as the API would.
+
+    Args:
+        categories (Iterable[Category]): The categories whose pages to render.
+        category_pages (int): The number of pages to render per category.
+
+    Returns:
+        Dict[str, bytes]: The JSON documents by snapshot path.
+    """
+    bodies = {TOP_STORIES_PATH: render_articles(get_top_articles())}
+    for category in categories:
+        for page in range(1, category_pages + 1):
+            bodies[category_page_path(category, page)] = render_model(
+                get_category_articles(category, page)
+            )
+    return bodies
+
+
+class SnapshotPublisher:
+    """
+    Re-renders the snapshots of the categories articles were added to, debounced.
+    """
+
+    def __init__(
+        self,
+        store: SnapshotStore,
+        debounce: float = SNAPSHOT_DEBOUNCE,
+        category_pages: int = SNAPSHOT_CATEGORY_PAGES,
+    ) -> None:
+        self.store = store
+        self.debounce = debounce
+        self.category_pages = category_pages
+
+        self._lock = threading.Lock()
+        self._pending: Set[Category] = set()
+        self._wake = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._publisher: Optional["asyncio.Task[None]"] = None
+
+        self._publishes = 0
+        self._files_written = 0
+        self._failures = 0
+        self._last_publish_seconds = 0.0
+
+    def start(self) -> None:
+        """
+        Starts the background publisher on the running event loop.
+        """
+        if self._publisher is None:
+            self._loop = asyncio.get_running_loop()
+            self._loop_thread = threading.get_ident()
+            self._publisher = asyncio.create_task(self._run(), name="snapshot-publisher")
+
+    async def stop(self) -> None:
+        """
+        Stops the background publisher and publishes the categories still pending.
+        """
+        if self._publisher is not None:
+            self._publisher.cancel()
+            try:
+                await self._publisher
+            except asyncio.CancelledError:
+                pass
+            self._publisher = None
+        self._loop = None
+        await self._publish_pending()
+
+    def mark_dirty(self, category: Category) -> None:
+        """
+        Schedules the snapshots of a category and the top stories for re-rendering. May be
+        called from any thread.
+
+        Args:
+            category (Category): The category an article was added to.
+        """
+        with self._lock:
+            self._pending.add(category)
+        loop = self._loop
+        if loop is None:
+            return
+        if threading.get_ident() == self._loop_thread:
+            self._wake.set()
+        else:
+            try:
+                loop.call_soon_threadsafe(self._wake.set)
+            except RuntimeError:
+                # The loop closed in the meantime, stop() publishes the pending categories
+                pass
+
+    def publish(self, categories: Iterable[Category]) -> int:
+        """
+        Renders and writes the top stories and the pages of categories.
+
+        Args:
+            categories (Iterable[Category]): The categories whose pages to render.
+
+        Returns:
+            int: The number of files written, unchanged files are skipped.
+        """
+        started_at = time.perf_counter()
+        with self.store.lock():
+            # Drops the cached pages other workers' writes made stale before rendering
+            content_versions.sync()
+            written = self.store.write(render_snapshots(sorted(categories), self.category_pages))
+        self._last_publish_seconds = time.perf_counter() - started_at
+        self._publishes += 1
+        self._files_written += written
+        return written
+
+    def rebuild(self) -> int:
+        """
+        Renders and writes the snapshots of all categories.
+
+        Returns:
+            int: The number of files written.
+        """
+        return self.publish(get_args(Category))
+
+    async def _publish_pending(self) -> None:
+        with self._lock:
+            categories, self._pending = self._pending, set()
+        if not categories:
+            return
+        try:
+            await run_in_threadpool(self.publish, categories)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._failures += 1
+            # Publish them again with the next change
+            with self._lock:
+                self._pending |= categories
+            logger.exception("Publishing snapshots failed: %s", str(e))
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            # Collect the writes of the debounce window into one publish
+            await asyncio.sleep(self.debounce)
+            self._wake.clear()
+            await self._publish_pending()
+
+    def stats(self) -> SnapshotStats:
+        """
+        Returns a snapshot of the publisher counters.
+
+        Returns:
+            SnapshotStats: The current publisher statistics.
+        """
+        with self._lock:
+            pending = sorted(self._pending)
+        return SnapshotStats(
+            output=self.store.root,
+            pending=pending,
+            publishes=self._publishes,
+            files_written=self._files_written,
+            failures=self._failures,
+            last_publish_seconds=self._last_publish_seconds,
+        )
+
+
+def main() -> int:
+    """
+    Renders all snapshots from the database.
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Render all static snapshots")
+    parser.add_argument(
+        "--output",
+        default=SNAPSHOT_DIR,
+        required=not SNAPSHOT_DIR,
+        help="The output directory, defaults to SNAPSHOT_DIR",
+    )
+    args = parser.parse_args()
+    configure_logging()
+    try:
+        wait_for_database(DB_STARTUP_TIMEOUT)
+        written = SnapshotPublisher(SnapshotStore(args.output)).rebuild()
+        logger.info("Wrote %d snapshot files to %s", written, args.output)
+        return 0
+    finally:
+        close_pools()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
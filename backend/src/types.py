@@ -18,7 +18,7 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 from datetime import datetime
-from typing import Annotated, List, Literal
+from typing import Annotated, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field, StringConstraints
 
 Agency = Annotated[str, StringConstraints(min_length=1, max_length=50)]
@@ -66,7 +66,312 @@ class GetCategoryArticlesResult(BaseModel):
     total_pages: int
 
 
+class GetCategoryArticlesPageResult(BaseModel):
+    """
+    A class representing the result of the cursor paginated get_category_articles_page function.
+
+    Attributes:
+        articles (List[Article]): The list of articles returned.
+        next_cursor (Optional[str]): The cursor of the next page, or None on the last page.
+    """
+
+    articles: List[Article]
+    next_cursor: Optional[str]
+
+
+class SearchArticlesResult(BaseModel):
+    """
+    A class representing a page of search results, ordered by relevance.
+
+    Attributes:
+        articles (List[Article]): The matching articles, most relevant first.
+        next_cursor (Optional[str]): The cursor of the next page, or None on the last page.
+    """
+
+    articles: List[Article]
+    next_cursor: Optional[str]
+
+
 class HealthCheck(BaseModel):
     """Response model to validate and return when performing a health check."""
 
     status: str = "OK"
+
+
+class PoolStats(BaseModel):
+    """
+    A class representing a snapshot of the database connection pool.
+
+    Attributes:
+        size (int): The maximum number of idle connections kept for reuse.
+        max_overflow (int): The number of extra connections allowed on top of size.
+        opened (int): The number of connections currently open.
+        idle (int): The number of open connections waiting in the pool.
+        in_use (int): The number of connections currently checked out.
+        checkouts (int): The total number of successful checkouts.
+        timeouts (int): The total number of checkouts that timed out.
+        recycled (int): The total number of connections replaced because of their age.
+        invalidated (int): The total number of connections dropped because they were broken.
+    """
+
+    size: int
+    max_overflow: int
+    opened: int
+    idle: int
+    in_use: int
+    checkouts: int
+    timeouts: int
+    recycled: int
+    invalidated: int
+
+
+class CircuitBreakerStats(BaseModel):
+    """
+    A class representing a snapshot of the circuit breaker of a database instance.
+
+    Attributes:
+        name (str): The database instance, "writer" or the `host:port` of a reader.
+        state (str): One of "closed", "open" or "half_open".
+        consecutive_failures (int): The number of connection attempts that failed in a row.
+        retry_after (float): The seconds until an open breaker lets a probe through.
+        rejected (int): The total number of attempts failed fast while the breaker was open.
+        transitions (Dict[str, int]): The number of state changes, keyed by "from->to".
+    """
+
+    name: str
+    state: str
+    consecutive_failures: int
+    retry_after: float
+    rejected: int
+    transitions: Dict[str, int]
+
+
+class ReaderStats(BaseModel):
+    """
+    A class representing the state of a database reader instance.
+
+    Attributes:
+        name (str): The `host:port` of the reader.
+        weight (int): The relative share of reads sent to the reader.
+        healthy (bool): Whether the reader is currently in rotation.
+        reads (int): The total number of reads routed to the reader.
+    """
+
+    name: str
+    weight: int
+    healthy: bool
+    reads: int
+
+
+class ReadRoutingStats(BaseModel):
+    """
+    A class representing a snapshot of the routing of read queries.
+
+    Attributes:
+        readers (List[ReaderStats]): The configured reader instances.
+        writer_reads (int): The total number of reads sent to the writer.
+        sticky_reads (int): The number of writer reads caused by a recent write.
+        failovers (int): The total number of times a reader was taken out of rotation.
+    """
+
+    readers: List[ReaderStats]
+    writer_reads: int
+    sticky_reads: int
+    failovers: int
+
+
+class CacheStats(BaseModel):
+    """
+    A class representing a snapshot of an in-process cache.
+
+    Attributes:
+        max_entries (int): The maximum number of entries before the least recently used one is
+            evicted.
+        ttl (float): The time to live of an entry in seconds.
+        entries (int): The number of entries currently cached.
+        hits (int): The total number of lookups answered from the cache.
+        misses (int): The total number of lookups that had to load the value.
+        evictions (int): The total number of entries evicted to stay within max_entries.
+        expirations (int): The total number of entries dropped because their TTL passed.
+        invalidations (int): The total number of entries removed by writes.
+    """
+
+    max_entries: int
+    ttl: float
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+
+
+class ResponseStoreStats(BaseModel):
+    """
+    A class representing a snapshot of the store of rendered response bodies.
+
+    Attributes:
+        max_entries (int): The maximum number of entries before the least recently used one is
+            evicted.
+        entries (int): The number of bodies currently stored.
+        encodings (List[str]): The content codings offered besides identity, in order of
+            preference.
+        hits (int): The total number of responses served from the store.
+        misses (int): The total number of responses that had to be rendered.
+        evictions (int): The total number of entries evicted to stay within max_entries.
+        invalidations (int): The total number of entries removed by writes.
+        compressions (int): The total number of bodies compressed.
+    """
+
+    max_entries: int
+    entries: int
+    encodings: List[str]
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    compressions: int
+
+
+class ArticleStreamStats(BaseModel):
+    """
+    A class representing a snapshot of the broadcaster of the article stream.
+
+    Attributes:
+        subscribers (int): The number of connected subscribers.
+        max_subscribers (int): The maximum number of subscribers before new streams are
+            refused.
+        replay_events (int): The number of events kept for reconnecting clients.
+        published (int): The total number of events published.
+        dropped (int): The total number of subscribers dropped because their buffer was full.
+        resumed (int): The total number of streams resumed with Last-Event-ID.
+        resets (int): The total number of streams that could not be resumed.
+    """
+
+    subscribers: int
+    max_subscribers: int
+    replay_events: int
+    published: int
+    dropped: int
+    resumed: int
+    resets: int
+
+
+class BulkIngestRowError(BaseModel):
+    """
+    A class representing a rejected row of a bulk ingest request.
+
+    Attributes:
+        index (int): The 0-based position of the row in the request body.
+        message (str): Why the row was rejected.
+    """
+
+    index: int
+    message: str
+
+
+class BulkIngestResult(BaseModel):
+    """
+    A class representing the result of a bulk ingest request.
+
+    Attributes:
+        inserted (int): The number of articles added to the database.
+        failed (int): The number of rows that were rejected.
+        errors (List[BulkIngestRowError]): The rejected rows, capped at a configured maximum.
+    """
+
+    inserted: int
+    failed: int
+    errors: List[BulkIngestRowError]
+
+
+class WriteBehindStats(BaseModel):
+    """
+    A class representing a snapshot of the write-behind queue.
+
+    Attributes:
+        depth (int): The number of articles waiting to be written.
+        max_size (int): The capacity of the queue.
+        accepted (int): The total number of articles queued.
+        rejected (int): The total number of articles turned away because the queue was full.
+        written (int): The total number of queued articles committed to the database.
+        dropped (int): The total number of queued articles lost after failed retries.
+        flushes (int): The total number of committed batches.
+        last_flush_seconds (float): The duration of the most recent batch commit.
+        avg_flush_seconds (float): The mean duration of a batch commit.
+        max_flush_seconds (float): The longest duration of a batch commit.
+    """
+
+    depth: int
+    max_size: int
+    accepted: int
+    rejected: int
+    written: int
+    dropped: int
+    flushes: int
+    last_flush_seconds: float
+    avg_flush_seconds: float
+    max_flush_seconds: float
+
+
+class SnapshotStats(BaseModel):
+    """
+    A class representing a snapshot of the static snapshot publisher.
+
+    Attributes:
+        output (str): The directory the snapshots are written to.
+        pending (List[str]): The categories waiting to be re-rendered.
+        publishes (int): The total number of completed publishes.
+        files_written (int): The total number of files written, unchanged ones are skipped.
+        failures (int): The total number of failed publishes.
+        last_publish_seconds (float): The duration of the most recent publish.
+    """
+
+    output: str
+    pending: List[Category]
+    publishes: int
+    files_written: int
+    failures: int
+    last_publish_seconds: float
+
+
+class ProfileSpan(BaseModel):
+    """
+    A class representing a timed step of a profiled request.
+
+    Attributes:
+        phase (str): The phase the time was spent in, e.g. "sql" or "serialize".
+        detail (Optional[str]): Further information, e.g. the SQL file name.
+        seconds (float): The duration of the step.
+    """
+
+    phase: str
+    detail: Optional[str] = None
+    seconds: float
+
+
+class ProfileTrace(BaseModel):
+    """
+    A class representing the profile of a request.
+
+    Attributes:
+        method (str): The HTTP method.
+        path (str): The requested path.
+        route (Optional[str]): The matched route template, if any.
+        status (int): The HTTP status code of the response.
+        started_at (float): The Unix timestamp the request was received at.
+        total_seconds (float): The time until the response was sent.
+        requested (bool): Whether profiling was requested by header rather than sampled.
+        breakdown (Dict[str, float]): The seconds spent per phase.
+        spans (List[ProfileSpan]): The recorded steps in order.
+    """
+
+    method: str
+    path: str
+    route: Optional[str]
+    status: int
+    started_at: float
+    total_seconds: float
+    requested: bool
+    breakdown: Dict[str, float]
+    spans: List[ProfileSpan]
@@ -0,0 +1,79 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Fixtures of the API tests, which run against the SQLite stand-in of benchmarks/fake_mysql.py.
+
+Run from the backend directory, with pytest installed next to requirements.txt:
+
+    python -m pytest tests
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Iterator
+import pytest
+from fastapi.testclient import TestClient
+from benchmarks import fake_mysql
+
+# The stand-in has to be in place before the application is imported
+DATABASE_DIR = tempfile.mkdtemp(prefix="api-tests-")
+fake_mysql.install(os.path.join(DATABASE_DIR, "api.sqlite"))
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """
+    Serves the application from a freshly bootstrapped database for the whole test session.
+
+    Yields:
+        TestClient: The client of the running application.
+    """
+    from src.app import app  # pylint: disable=import-outside-toplevel
+    from src.db.setup.main import init_db  # pylint: disable=import-outside-toplevel
+
+    init_db()
+    with TestClient(app) as test_client:
+        yield test_client
+    shutil.rmtree(DATABASE_DIR, ignore_errors=True)
+
+
+def new_article(title: str, category: str = "IT", **fields: Any) -> Dict[str, Any]:
+    """
+    Returns the JSON body of a valid article.
+
+    Args:
+        title (str): The title of the article.
+        category (str, optional): The category of the article. Defaults to "IT".
+        **fields (Any): Overrides of the other fields.
+
+    Returns:
+        Dict[str, Any]: The article.
+    """
+    article = {
+        "title": title,
+        "date": "2025-01-01T00:00:00",
+        "author": "Author",
+        "text": "Some text of the article.",
+        "agency": "Agency",
+        "category": category,
+        "user_submitted": 1,
+    }
+    article.update(fields)
+    return article
@@ -0,0 +1,135 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Tests of the server-sent event stream of added articles.
+"""
+
+import asyncio
+import threading
+from typing import AsyncIterator
+import pytest
+from src.article_stream import RETRY_FRAME, ArticleBroadcaster, TooManySubscribersError
+from src.types import Article
+from .conftest import new_article
+
+
+def article(title: str, category: str = "IT") -> Article:
+    return Article(**new_article(title, category, user_submitted=1))
+
+
+def event_id(frame: bytes) -> str:
+    return frame.split(b"\n", 1)[0].decode().removeprefix("id: ")
+
+
+async def next_frame(events: AsyncIterator[bytes]) -> bytes:
+    return await asyncio.wait_for(events.__anext__(), 5)
+
+
+def test_stream_filters_categories_and_replays_missed_events() -> None:
+    async def run() -> None:
+        broadcaster = ArticleBroadcaster(heartbeat_interval=60)
+        broadcaster.start()
+        events = broadcaster.stream(["IT"], None)
+        assert await next_frame(events) == RETRY_FRAME
+
+        broadcaster.publish_change("Physics")
+        broadcaster.publish_article(article("First"))
+        first = await next_frame(events)
+        assert b"event: article\n" in first and b'"title":"First"' in first
+        broadcaster.publish_article(article("Second"))
+        broadcaster.publish_change("IT")
+        await events.aclose()
+
+        # A client reconnecting with the id of the first event gets the two it missed
+        resumed = broadcaster.stream(["IT"], event_id(first))
+        assert await next_frame(resumed) == RETRY_FRAME
+        assert b'"title":"Second"' in await next_frame(resumed)
+        assert b"event: changed\n" in await next_frame(resumed)
+        await resumed.aclose()
+
+        # An id another process handed out cannot be resumed
+        reset = broadcaster.stream(None, "elsewhere.1")
+        assert await next_frame(reset) == RETRY_FRAME
+        assert b"event: reset\n" in await next_frame(reset)
+        await reset.aclose()
+
+        stats = broadcaster.stats()
+        assert (stats.published, stats.resumed, stats.resets) == (4, 1, 1)
+        assert stats.subscribers == 0
+        broadcaster.close()
+
+    asyncio.run(run())
+
+
+def test_slow_subscribers_are_dropped() -> None:
+    async def run() -> None:
+        broadcaster = ArticleBroadcaster(subscriber_buffer=2, heartbeat_interval=60)
+        broadcaster.start()
+        slow = broadcaster.stream(None, None)
+        fast = broadcaster.stream(None, None)
+        assert await next_frame(slow) == RETRY_FRAME
+        assert await next_frame(fast) == RETRY_FRAME
+
+        for number in range(3):
+            broadcaster.publish_article(article(f"Article {number}"))
+            assert b"Article" in await next_frame(fast)
+        assert broadcaster.stats().dropped == 1
+
+        # The dropped stream ends after the frames it had buffered
+        frames = [frame async for frame in slow]
+        assert len(frames) == 2
+        assert b"Article 0" in frames[0] and b"Article 1" in frames[1]
+        await fast.aclose()
+        broadcaster.close()
+
+    asyncio.run(run())
+
+
+def test_articles_published_from_other_threads_are_delivered() -> None:
+    async def run() -> None:
+        broadcaster = ArticleBroadcaster(heartbeat_interval=60)
+        broadcaster.start()
+        events = broadcaster.stream(None, None)
+        assert await next_frame(events) == RETRY_FRAME
+
+        writer = threading.Thread(target=broadcaster.publish_article, args=(article("Threaded"),))
+        writer.start()
+        writer.join()
+        assert b'"title":"Threaded"' in await next_frame(events)
+
+        # Closing the broadcaster ends the streams
+        broadcaster.close()
+        assert [frame async for frame in events] == []
+
+    asyncio.run(run())
+
+
+def test_subscribers_are_limited() -> None:
+    async def run() -> None:
+        broadcaster = ArticleBroadcaster(heartbeat_interval=60, max_subscribers=1)
+        broadcaster.start()
+        events = broadcaster.stream(None, None)
+        assert await next_frame(events) == RETRY_FRAME
+        with pytest.raises(TooManySubscribersError):
+            broadcaster.stream(None, None)
+        await events.aclose()
+        broadcaster.stream(None, None)
+        broadcaster.close()
+
+    asyncio.run(run())
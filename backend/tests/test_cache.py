@@ -0,0 +1,130 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Tests of the article cache and its invalidation by generation.
+"""
+
+import asyncio
+from src.db.api.cache import (
+    articles_cache,
+    category_page_key,
+    invalidate_category,
+    search_cache,
+    search_key,
+    top_articles_key,
+)
+from src.db.common.cache import TTLCache
+from .conftest import new_article
+
+
+def test_value_is_cached_until_invalidated() -> None:
+    cache = TTLCache(max_entries=8, ttl=60)
+    loads = []
+
+    def loader() -> int:
+        loads.append(None)
+        return len(loads)
+
+    assert cache.get_or_load("key", loader) == 1
+    assert cache.get_or_load("key", loader) == 1
+    assert cache.invalidate(lambda key: key == "key") == 1
+    assert cache.get_or_load("key", loader) == 2
+
+
+def test_load_overlapping_an_invalidation_is_not_stored() -> None:
+    cache = TTLCache(max_entries=8, ttl=60)
+
+    def stale_loader() -> str:
+        # A write lands while the read is in flight
+        cache.invalidate(lambda _key: True)
+        return "stale"
+
+    assert cache.get_or_load("key", stale_loader) == "stale"
+    assert cache.get_or_load("key", lambda: "fresh") == "fresh"
+
+
+def test_async_load_overlapping_an_invalidation_is_not_stored() -> None:
+    cache = TTLCache(max_entries=8, ttl=60)
+
+    async def stale_loader() -> str:
+        cache.invalidate(lambda _key: True)
+        return "stale"
+
+    async def fresh_loader() -> str:
+        return "fresh"
+
+    async def load_twice() -> list:
+        return [
+            await cache.aget_or_load("key", stale_loader),
+            await cache.aget_or_load("key", fresh_loader),
+        ]
+
+    assert asyncio.run(load_twice()) == ["stale", "fresh"]
+
+
+def test_invalidate_category_keeps_unrelated_entries() -> None:
+    keys = {
+        top_articles_key(1): True,
+        category_page_key("IT", 1): True,
+        category_page_key("Physics", 1): False,
+    }
+    search_keys = {
+        search_key("quantum", "IT", None): True,
+        search_key("quantum", None, None): True,
+        search_key("quantum", "Physics", None): False,
+    }
+    try:
+        for cache, cached in ((articles_cache, keys), (search_cache, search_keys)):
+            cache.clear()
+            for key in cached:
+                cache.get_or_load(key, lambda: "cached")
+
+        invalidate_category("IT")
+
+        for cache, cached in ((articles_cache, keys), (search_cache, search_keys)):
+            for key, invalidated in cached.items():
+                expected = "reloaded" if invalidated else "cached"
+                assert cache.get_or_load(key, lambda: "reloaded") == expected, key
+    finally:
+        # The application shares the caches
+        articles_cache.clear()
+        search_cache.clear()
+
+
+def test_searches_do_not_evict_article_pages() -> None:
+    key = category_page_key("Physics", 1)
+    try:
+        articles_cache.get_or_load(key, lambda: "cached")
+        for i in range(search_cache.max_entries + 10):
+            search_cache.get_or_load(search_key(f"query {i}", None, None), lambda: "result")
+
+        assert articles_cache.get_or_load(key, lambda: "reloaded") == "cached"
+        assert search_cache.stats().evictions >= 10
+    finally:
+        articles_cache.clear()
+        search_cache.clear()
+
+
+def test_write_is_visible_on_the_next_read(client) -> None:
+    assert client.get("/category/Medicine/1").status_code == 200
+
+    article = new_article("Cache test", "Medicine", date="2099-01-01T00:00:00")
+    assert client.post("/article", json=article).status_code == 200
+
+    assert client.get("/category/Medicine/1").json()["articles"][0]["title"] == "Cache test"
@@ -0,0 +1,116 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Tests of the circuit breakers around the database connections.
+"""
+
+import time
+import mysql.connector
+from mysql.connector import errorcode
+import pytest
+from src.db.common.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+)
+from src.db.common.connection import ConnectionPool, connect_to_mysql
+from src.db.common.routing import Endpoint
+
+
+def test_breaker_opens_half_opens_and_closes() -> None:
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=0.05)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.stats().state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    time.sleep(0.06)
+    breaker.before_call()
+    assert breaker.stats().state == HALF_OPEN
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.stats().state == CLOSED
+    breaker.before_call()
+    breaker.record_success()
+
+
+def test_failed_probes_keep_the_breaker_open_for_longer() -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05, max_reset_timeout=1)
+    breaker.before_call()
+    breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError) as info:
+        breaker.before_call()
+    assert 0.04 < info.value.retry_after <= 1
+    assert breaker.stats().transitions == {
+        "closed->open": 1,
+        "open->half_open": 1,
+        "half_open->open": 1,
+    }
+
+
+def test_connect_makes_a_single_attempt(monkeypatch) -> None:
+    attempts = []
+
+    def refuse(**_kwargs):
+        attempts.append(None)
+        raise mysql.connector.errors.DatabaseError(
+            msg="Can't connect", errno=errorcode.CR_CONN_HOST_ERROR
+        )
+
+    monkeypatch.setattr(mysql.connector, "connect", refuse)
+    endpoint = Endpoint("unreachable.test", 3306)
+    with pytest.raises(mysql.connector.Error):
+        connect_to_mysql(endpoint)
+    assert len(attempts) == 1
+    assert get_circuit_breaker(endpoint.name).stats().consecutive_failures == 1
+
+
+class _Connection:
+    def close(self) -> None:
+        pass
+
+
+def test_broken_connections_of_queries_are_reported() -> None:
+    pool = ConnectionPool(connect=_Connection, name="query-errors.test:3306")
+    breaker = get_circuit_breaker(pool.name)
+
+    with pytest.raises(mysql.connector.Error):
+        with pool.connection():
+            raise mysql.connector.errors.DataError(msg="Data too long", errno=1406)
+    assert breaker.stats().consecutive_failures == 0
+
+    with pytest.raises(mysql.connector.Error):
+        with pool.connection():
+            raise mysql.connector.errors.OperationalError(
+                msg="Lost connection", errno=errorcode.CR_SERVER_LOST
+            )
+    assert breaker.stats().consecutive_failures == 1
+    assert pool.stats().invalidated == 2
@@ -0,0 +1,43 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Tests of the conditional requests of the read endpoints.
+"""
+
+from .conftest import new_article
+
+
+def test_etag_answers_304_until_a_write_to_the_category(client) -> None:
+    first = client.get("/category/Physics/1")
+    other = client.get("/category/Chemistry/1")
+    assert first.status_code == 200 and other.status_code == 200
+    etag = first.headers["etag"]
+    assert client.get("/category/Physics/1", headers={"If-None-Match": etag}).status_code == 304
+
+    article = new_article("ETag test", "Physics", date="2099-01-01T00:00:00")
+    assert client.post("/article", json=article).status_code == 200
+
+    changed = client.get("/category/Physics/1", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["articles"][0]["title"] == "ETag test"
+    unchanged = client.get(
+        "/category/Chemistry/1", headers={"If-None-Match": other.headers["etag"]}
+    )
+    assert unchanged.status_code == 304
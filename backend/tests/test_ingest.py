@@ -0,0 +1,71 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Tests of the streaming bulk ingest of POST /articles.
+"""
+
+import json
+import pytest
+from src import ingest
+from .conftest import new_article
+
+
+def test_ndjson_ingest_reports_invalid_rows(client) -> None:
+    rows = [json.dumps(new_article(f"NDJSON test {i}", "Mathematics")) for i in range(3)]
+    rows.insert(1, json.dumps({"title": ""}))
+    rows.append("{not json")
+    response = client.post(
+        "/articles",
+        content="\n".join(rows) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["inserted"] == 3
+    assert result["failed"] == 2
+    assert [error["index"] for error in result["errors"]] == [1, 4]
+
+
+def test_malformed_array_reports_the_rows_stored_before(client) -> None:
+    rows = [json.dumps(new_article(f"Array test {i}", "Mathematics")) for i in range(2)]
+    response = client.post("/articles", content="[" + ",".join(rows) + ",{")
+    assert response.status_code == 400
+    result = response.json()
+    assert result["detail"]
+    assert result["inserted"] == 2
+
+
+@pytest.mark.parametrize("ndjson", [True, False])
+def test_oversized_row_is_rejected(client, monkeypatch, ndjson: bool) -> None:
+    monkeypatch.setattr(ingest, "INGEST_MAX_ROW_SIZE", 500)
+    rows = [
+        json.dumps(new_article("Small row", "Mathematics")),
+        json.dumps(new_article("Large row", "Mathematics", text="x" * 1000)),
+        json.dumps(new_article("Last row", "Mathematics")),
+    ]
+    if ndjson:
+        response = client.post(
+            "/articles",
+            content="\n".join(rows) + "\n",
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+    else:
+        response = client.post("/articles", content="[" + ",".join(rows) + "]")
+    assert response.status_code == 400
+    assert "exceeds 500 characters" in response.json()["detail"]
@@ -0,0 +1,103 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Tests of the keyset pagination cursors.
+"""
+
+import base64
+from datetime import datetime
+import json
+import pytest
+from src.db.api.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    decode_search_cursor,
+    encode_cursor,
+    encode_search_cursor,
+)
+from .conftest import new_article
+
+
+def raw_cursor(payload: object) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+def test_cursor_round_trip() -> None:
+    assert decode_cursor(encode_cursor("2025-01-02 03:04:05", 7)) == ("2025-01-02 03:04:05", 7)
+    assert decode_cursor(encode_cursor(datetime(2025, 1, 2, 3, 4, 5), 7)) == (
+        "2025-01-02 03:04:05",
+        7,
+    )
+
+
+def test_search_cursor_round_trip() -> None:
+    assert decode_search_cursor(encode_search_cursor(1.5, 7)) == (1.5, 7)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not base64!",
+        raw_cursor({"date": "2025-01-02 03:04:05", "id": 7}),
+        raw_cursor(["2025-01-02 03:04:05"]),
+        raw_cursor(["2025-01-02 03:04:05", "7"]),
+        raw_cursor([20250102, 7]),
+        raw_cursor(["yesterday", 7]),
+        raw_cursor(["2025-01-02'; DROP TABLE articles; --", 7]),
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", raw_cursor([1, 7]), raw_cursor([1.5, "7"])])
+def test_malformed_search_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_search_cursor(cursor)
+
+
+def test_cursor_pages_list_every_article_once(client) -> None:
+    for i in range(12):
+        article = new_article(f"Cursor test {i}", "Biology", date=f"2024-06-{i + 1:02d}T00:00:00")
+        assert client.post("/article", json=article).status_code == 200
+
+    total_pages = client.get("/category/Biology/1").json()["total_pages"]
+    expected = [
+        article
+        for page in range(1, total_pages + 1)
+        for article in client.get(f"/category/Biology/{page}").json()["articles"]
+    ]
+
+    articles = []
+    cursor = None
+    while True:
+        page = client.get("/category/Biology", params={"cursor": cursor} if cursor else {}).json()
+        articles.extend(page["articles"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert articles == expected
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", raw_cursor(["yesterday", 7])])
+def test_malformed_cursor_is_answered_with_400(client, cursor: str) -> None:
+    response = client.get("/category/Biology", params={"cursor": cursor})
+    assert response.status_code == 400
@@ -0,0 +1,36 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Tests of the field projections and text excerpts of the list endpoints.
+"""
+
+
+def test_projection_returns_only_the_requested_fields(client) -> None:
+    articles = client.get("/top-stories?fields=title,id").json()
+    assert articles and all(set(article) == {"id", "title"} for article in articles)
+
+    page = client.get("/category/IT/1?fields=text&excerpt=5").json()
+    assert all(set(article) == {"text"} for article in page["articles"])
+    assert all(len(article["text"]) <= 5 for article in page["articles"])
+
+
+def test_projection_rejects_unknown_fields(client) -> None:
+    for fields in ("title,password", "id;DROP TABLE articles", ","):
+        response = client.get("/top-stories", params={"fields": fields})
+        assert response.status_code == 400, fields
@@ -0,0 +1,90 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Tests of the rendered response store and its content codings.
+"""
+
+import gzip
+from src import response_store as store_module
+from src.http_cache import make_validators
+from src.response_store import GZIP, ResponseStore
+
+
+def test_small_bodies_are_sent_as_identity() -> None:
+    store = ResponseStore()
+    rendered = store.put("small", "IT", "v1", b'{"articles":[]}')
+    response = store.respond(rendered, GZIP, {})
+    assert "content-encoding" not in response.headers
+    assert response.body == b'{"articles":[]}'
+    assert rendered.content_coding(GZIP) is None
+    assert store.stats().compressions == 0
+
+
+def test_large_bodies_are_compressed_once() -> None:
+    store = ResponseStore()
+    body = b'{"articles":[' + b'"x",' * store_module.RESPONSE_COMPRESSION_MIN_SIZE + b'"x"]}'
+    rendered = store.put("large", "IT", "v1", body)
+    assert rendered.content_coding(GZIP) == GZIP
+    for _ in range(3):
+        response = store.respond(rendered, GZIP, {})
+        assert response.headers["content-encoding"] == GZIP
+        assert gzip.decompress(response.body) == body
+    assert store.respond(rendered, None, {}).body == body
+    assert store.stats().compressions == 1
+
+
+def test_store_misses_other_content_versions() -> None:
+    store = ResponseStore()
+    store.put("page", "IT", "v1", b"{}")
+    assert store.get("page", "v1") is not None
+    assert store.get("page", "v2") is None
+    assert store.invalidate("IT") == 1
+    assert store.get("page", "v1") is None
+
+
+def test_only_compressed_bodies_get_a_coding_specific_etag(client, monkeypatch) -> None:
+    identity = make_validators("v1", 0, variant="page", cache_control="no-cache")
+    assert make_validators(
+        "v1", 0, variant="page", cache_control="no-cache", encoding=GZIP
+    ).etag != identity.etag
+
+    def fetch(path: str):
+        plain = client.get(path, headers={"Accept-Encoding": "identity"})
+        compressed = client.get(path, headers={"Accept-Encoding": GZIP})
+        return plain, compressed
+
+    # The same body is small with a high threshold and large with a low one
+    store_module.response_store.invalidate("*")
+    monkeypatch.setattr(store_module, "RESPONSE_COMPRESSION_MIN_SIZE", 1 << 30)
+    plain, compressed = fetch("/category/IT/1")
+    assert "content-encoding" not in compressed.headers
+    assert plain.headers["etag"] == compressed.headers["etag"]
+    assert client.get(
+        "/category/IT/1",
+        headers={"Accept-Encoding": GZIP, "If-None-Match": plain.headers["etag"]},
+    ).status_code == 304
+
+    monkeypatch.setattr(store_module, "RESPONSE_COMPRESSION_MIN_SIZE", 1)
+    plain, compressed = fetch("/category/IT/1")
+    assert compressed.headers["content-encoding"] == GZIP
+    assert plain.headers["etag"] != compressed.headers["etag"]
+    assert client.get(
+        "/category/IT/1",
+        headers={"Accept-Encoding": GZIP, "If-None-Match": plain.headers["etag"]},
+    ).status_code == 200
@@ -0,0 +1,107 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Tests of the static snapshots.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from src.snapshots import (
+    MANIFEST_NAME,
+    TOP_STORIES_PATH,
+    SnapshotPublisher,
+    SnapshotStore,
+    category_page_path,
+)
+from .conftest import new_article
+
+
+def test_store_writes_changed_files_and_the_manifest(tmp_path) -> None:
+    store = SnapshotStore(str(tmp_path))
+    with store.lock():
+        assert store.write({"a.json": b"[1]", "b/c.json": b"[2]"}) == 2
+        assert store.write({"a.json": b"[1]", "b/c.json": b"[3]"}) == 1
+        (tmp_path / "a.json").unlink()
+        assert store.write({"a.json": b"[1]"}) == 1
+
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+    assert manifest == store.read_manifest()
+    assert manifest["files"]["b/c.json"]["sha256"] == hashlib.sha256(b"[3]").hexdigest()
+    assert manifest["files"]["a.json"]["size"] == 3
+    assert (tmp_path / "b" / "c.json").read_bytes() == b"[3]"
+    assert not list(tmp_path.rglob(".tmp-*"))
+
+
+def test_lock_excludes_other_publishers(tmp_path) -> None:
+    store = SnapshotStore(str(tmp_path))
+    acquired = threading.Event()
+
+    def publish() -> None:
+        with store.lock():
+            acquired.set()
+
+    with store.lock():
+        other = threading.Thread(target=publish)
+        other.start()
+        assert not acquired.wait(0.2)
+    assert acquired.wait(5)
+    other.join()
+
+
+def test_snapshots_match_the_api_responses(client, tmp_path) -> None:
+    publisher = SnapshotPublisher(SnapshotStore(str(tmp_path)), category_pages=1)
+    assert publisher.rebuild() > 0
+    assert publisher.rebuild() == 0
+
+    headers = {"Accept-Encoding": "identity"}
+    top_stories = client.get("/top-stories", headers=headers)
+    assert (tmp_path / TOP_STORIES_PATH).read_bytes() == top_stories.content
+    page = client.get("/category/IT/1", headers=headers)
+    assert (tmp_path / category_page_path("IT", 1)).read_bytes() == page.content
+
+
+def test_publisher_debounces_added_articles(client, tmp_path) -> None:
+    publisher = SnapshotPublisher(SnapshotStore(str(tmp_path)), debounce=0.05, category_pages=1)
+    path = tmp_path / category_page_path("Biology", 1)
+
+    async def run() -> None:
+        publisher.start()
+        for number in range(3):
+            article = new_article(
+                f"Snapshot {number}", "Biology", date=f"2099-01-0{number + 1}T00:00:00"
+            )
+            client.post("/article", json=article)
+            publisher.mark_dirty("Biology")
+        assert publisher.stats().pending == ["Biology"]
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            if publisher.stats().publishes:
+                break
+        assert publisher.stats().publishes == 1
+        assert publisher.stats().pending == []
+        assert b"Snapshot 2" in path.read_bytes()
+
+        # Categories still pending when the publisher stops are published right away
+        publisher.mark_dirty("Biology")
+        await publisher.stop()
+        assert publisher.stats().publishes == 2
+
+    asyncio.run(run())
@@ -0,0 +1,73 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Tests of the content versions the worker processes share through a counters file.
+"""
+
+import multiprocessing
+import os
+import threading
+from typing import List
+from src.db.api.versions import SCOPES, ContentVersions
+from src.db.common.shared_counters import SharedCounters
+
+
+def bump_in_worker(path: str, category: str) -> None:
+    counters = SharedCounters(path, SCOPES)
+    try:
+        ContentVersions(shared=counters).bump(category)
+    finally:
+        counters.close()
+
+
+def test_bump_in_another_process_changes_the_version(tmp_path) -> None:
+    path = os.path.join(tmp_path, "counters")
+    counters = SharedCounters.create(path, SCOPES)
+    versions = ContentVersions(epoch_seconds=0, shared=counters)
+    changed: List[str] = []
+    versions.add_change_listener(changed.append)
+    it_before, physics_before = versions.get("IT"), versions.get("Physics")
+
+    worker = multiprocessing.get_context("spawn").Process(
+        target=bump_in_worker, args=(path, "IT")
+    )
+    worker.start()
+    worker.join(timeout=30)
+    assert worker.exitcode == 0
+
+    assert versions.get("IT")[0] != it_before[0]
+    assert versions.get("Physics")[0] == physics_before[0]
+    assert changed == ["IT"]
+    counters.close()
+
+
+def test_threads_of_a_process_lose_no_increments(tmp_path) -> None:
+    counters = SharedCounters.create(os.path.join(tmp_path, "counters"), SCOPES)
+
+    def increment() -> None:
+        for _ in range(2000):
+            counters.increment("IT")
+
+    threads = [threading.Thread(target=increment) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counters.snapshot()["IT"][0] == 16000
+    counters.close()
@@ -0,0 +1,133 @@
+"""
+MIT No Attribution
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+the Software, and to permit persons to whom the Software is furnished to do so.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+---
+
+Tests of the write-behind queue.
+"""
+
+import asyncio
+from typing import List
+import pymysql
+import pytest
+from src.db.api.write_behind import QueueClosedError, QueueFullError, WriteBehindQueue
+from src.db.common.circuit_breaker import CircuitOpenError
+from src.types import Article
+from .conftest import new_article
+
+
+def article(title: str) -> Article:
+    return Article(**new_article(title))
+
+
+def test_stop_writes_the_queued_articles() -> None:
+    inserted: List[str] = []
+
+    async def insert(articles: List[Article]) -> None:
+        inserted.extend(item.title for item in articles)
+
+    async def run() -> WriteBehindQueue:
+        queue = WriteBehindQueue(insert=insert, batch_size=4, max_delay=0.05)
+        queue.start()
+        for i in range(10):
+            await queue.submit(article(f"Queued {i}"))
+        await queue.stop()
+        with pytest.raises(QueueClosedError):
+            await queue.submit(article("Too late"))
+        return queue
+
+    stats = asyncio.run(run()).stats()
+    assert inserted == [f"Queued {i}" for i in range(10)]
+    assert stats.written == 10 and stats.depth == 0
+
+
+def test_full_queue_turns_submitters_away() -> None:
+    async def run() -> WriteBehindQueue:
+        release = asyncio.Event()
+
+        async def insert(_articles: List[Article]) -> None:
+            await release.wait()
+
+        queue = WriteBehindQueue(
+            insert=insert, max_size=1, batch_size=1, max_delay=0, enqueue_timeout=0.01
+        )
+        queue.start()
+        await queue.submit(article("Being written"))
+        await asyncio.sleep(0.01)
+        await queue.submit(article("Waiting"))
+        with pytest.raises(QueueFullError):
+            await queue.submit(article("Turned away"))
+        release.set()
+        await queue.stop()
+        return queue
+
+    stats = asyncio.run(run()).stats()
+    assert (stats.accepted, stats.rejected, stats.written) == (2, 1, 2)
+
+
+def test_open_circuit_holds_the_batch_until_the_database_is_back() -> None:
+    outage = [5]
+
+    async def insert(_articles: List[Article]) -> None:
+        if outage[0]:
+            outage[0] -= 1
+            raise CircuitOpenError("writer", 0.01)
+
+    async def run() -> WriteBehindQueue:
+        queue = WriteBehindQueue(insert=insert, max_delay=0)
+        queue.start()
+        await queue.submit(article("Held"))
+        await queue.stop()
+        return queue
+
+    stats = asyncio.run(run()).stats()
+    assert (stats.written, stats.dropped) == (1, 0)
+
+
+def test_rejected_articles_are_dropped_alone() -> None:
+    async def insert(articles: List[Article]) -> None:
+        if any(item.title == "Bad" for item in articles):
+            raise pymysql.err.DataError(1406, "Data too long")
+
+    async def run() -> WriteBehindQueue:
+        queue = WriteBehindQueue(insert=insert, batch_size=16, max_delay=0.05)
+        queue.start()
+        for i in range(16):
+            await queue.submit(article("Bad" if i in (3, 11) else f"Good {i}"))
+        await queue.stop()
+        return queue
+
+    stats = asyncio.run(run()).stats()
+    assert (stats.written, stats.dropped) == (14, 2)
+
+
+def test_batch_of_a_lost_connection_is_not_retried() -> None:
+    calls = []
+
+    async def insert(_articles: List[Article]) -> None:
+        calls.append(None)
+        raise pymysql.err.OperationalError(2013, "Lost connection to MySQL server")
+
+    async def run() -> WriteBehindQueue:
+        queue = WriteBehindQueue(insert=insert, max_delay=0)
+        queue.start()
+        await queue.submit(article("Unknown"))
+        await queue.stop()
+        return queue
+
+    stats = asyncio.run(run()).stats()
+    assert len(calls) == 1 and stats.dropped == 1